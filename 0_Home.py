@@ -1,51 +1,15 @@
 import streamlit as st
 from PIL import Image
-import os
 from datetime import datetime
-import base64
-
-st.set_page_config(layout="wide", page_title="PROGAM IP4T", initial_sidebar_state="auto")
-
-# Function to display and center the logo in the sidebar
-def display_logo():
-    logo_path = 'logo.png'  # Adjust path to your logo file
-    if os.path.exists(logo_path):
-        with open(logo_path, "rb") as image_file:
-            encoded_image = base64.b64encode(image_file.read()).decode()
-        st.sidebar.markdown(
-            f"""
-            <div style="text-align: center;">
-                <img src="data:image/png;base64,{encoded_image}" width="150" />
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-    else:
-        st.sidebar.error(f"Logo file '{logo_path}' not found. Please ensure the file is in the correct directory.")
+
+from potensitol.layout import debug_panel, page_title, setup_page
+
+setup_page("PROGAM IP4T")
 
 # Function to display the header
 
 def display_header():
-    st.markdown(
-        """
-        <div style="text-align: center; margin-top: 20px;">
-            <h1 style="
-                color: white;
-                background-color: #11009E;
-                border-radius: 20px;
-                padding: 20px;
-                display: inline-block;
-                font-size: 22px;
-                text-transform: uppercase;
-                letter-spacing: 1px;
-                box-shadow: 2px 2px 10px rgba(0, 0, 0, 0.3);
-            ">
-                PROGRAM INVENTARISASI PENGUASAAN, PEMILIKAN, PENGGUNAAN, DAN PEMANFAATAN TANAH (IP4T)
-            </h1>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    page_title("PROGRAM INVENTARISASI PENGUASAAN, PEMILIKAN, PENGGUNAAN, DAN PEMANFAATAN TANAH (IP4T)")
 
     
 
@@ -105,10 +69,12 @@ def display_data_info():
 
 
 # Display content for the single page
-display_logo()
 display_header()
 display_date_time()
 display_data_info()
 
 # Info message with a link to the dataset
 st.info('Dokumentasi project ini dapat dilihat di GitHub: [PotensiTOL](https://github.com/putrifahriani29/PotensiTOL)')
+
+# Panel waktu eksekusi (hanya dengan ?debug=1)
+debug_panel()
@@ -2,7 +2,6 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 from io import StringIO
-import time
 import os
 import plotly.express as px
 import plotly.graph_objects as go
@@ -71,11 +70,7 @@ file = st.file_uploader("Unggah file CSV", type=["csv"])
 
 # Tombol untuk memulai analisis
 if st.button("📂 Lakukan Analisis Dataset"):
-    progress = st.progress(0, text="⏳ Memulai analisis...")
-
-    for i in range(1, 6):
-        time.sleep(0.15)
-        progress.progress(i * 20, text=f"⏳ Memproses langkah {i}/5...")
+    progress = st.progress(0, text="⏳ Membaca file...")
 
     # Baca file dari upload atau default
     if file:
@@ -85,11 +80,13 @@ if st.button("📂 Lakukan Analisis Dataset"):
         df = pd.read_csv("dataset20052025.csv", sep=";")
         st.info("Menggunakan dataset default")
 
+    progress.progress(50, text="⏳ Pembersihan data...")
+
     # Drop kolom NO jika ada
     if "NO" in df.columns:
         df.drop(columns=["NO"], inplace=True)
 
-    progress.progress(100, text="✅ Analisis selesai!")
+    progress.progress(100, text="✅ Data siap dianalisis")
 
     # Tampilkan data awal
     st.subheader("📁 Data Awal")
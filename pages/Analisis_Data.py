@@ -1,34 +1,27 @@
 import streamlit as st
-import pandas as pd
 from datetime import datetime
-from io import StringIO
-import time
-import os
+from io import BytesIO, StringIO
 import plotly.express as px
-import plotly.graph_objects as go
 import numpy as np
-import base64
-
-# Atur layout wide
-st.set_page_config(layout="wide", page_title="Informasi Dataset", initial_sidebar_state="auto")
-
-# Function to display and center the logo in the sidebar
-def display_logo():
-    logo_path = 'logo.png'  # Adjust path to your logo file
-    if os.path.exists(logo_path):
-        with open(logo_path, "rb") as image_file:
-            encoded_image = base64.b64encode(image_file.read()).decode()
-        st.sidebar.markdown(
-            f"""
-            <div style="text-align: center;">
-                <img src="data:image/png;base64,{encoded_image}" width="150" />
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-    else:
-        st.sidebar.error(f"Logo file '{logo_path}' not found. Please ensure the file is in the correct directory.")
-display_logo()
+
+import potensitol
+from potensitol.data import DATASET_PATH, FEATURES, TARGET
+from potensitol.charts import (
+    HIST_BINS, box_figure, box_stats, box_stats_from_summary, confusion_matrix_figure, histogram_figure,
+    importance_figure, kde_from_summary, kde_from_values, learning_curve_figure, roc_figure, violin_figure,
+)
+from potensitol.evaluate import evaluate
+from potensitol.explain import load_explainer
+from potensitol.layout import debug_panel, page_title, setup_page
+from potensitol.progress import StreamlitStageProgress
+from potensitol.quality import profile_dataset
+from potensitol.snapshot import load_profile_snapshot
+from potensitol.stats import summarize_chunks
+from potensitol.trace import span
+
+# Atur layout wide + logo sidebar (aset di-cache per proses)
+setup_page("Informasi Dataset")
+
 # Fungsi tampilkan tanggal sekarang
 def tampilkan_tanggal():
     now = datetime.now()
@@ -48,179 +41,316 @@ if "toast_shown" not in st.session_state:
 tampilkan_tanggal()
 
 def display_title():
-    st.markdown(
-        """
-        <div style="text-align: center; margin-top: 20px;">
-            <h1 style="
-                color: white;
-                background-color: #11009E;
-                border-radius: 20px;
-                padding: 20px;
-                display: inline-block;
-                font-size: 22px;
-                text-transform: uppercase;
-                letter-spacing: 1px;
-                font-weight: bold;
-                box-shadow: 2px 2px 10px rgba(0, 0, 0, 0.3);
-                margin-bottom: 30px;
-            ">
-                ANALISIS DATASET PROGAM IP4T DAN MODEL RANDOM FOREST CLASSIFIER
-            </h1>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    page_title("ANALISIS DATASET PROGAM IP4T DAN MODEL RANDOM FOREST CLASSIFIER", margin_bottom=30, bold=True)
 display_title()   
 
 
-# Upload file
-file = st.file_uploader("Unggah file CSV", type=["csv"])
+# Dataset bertipe (kategori + numerik) dan profil kualitasnya di-cache per hash
+# isi file, sehingga analisis ulang file yang sama tidak mem-parsing CSV lagi
+@st.cache_data(show_spinner=False, max_entries=8)
+def muat_dataset(digest, nama, _data=None):
+    if _data is None:
+        # Dataset default: snapshot Arrow (mmap) + laporan kualitas tersimpan bila sudah dibuat
+        return load_profile_snapshot(nama, digest)
+    buffer = BytesIO(_data)
+    buffer.name = nama
+    return profile_dataset(buffer)
 
-# Tombol untuk memulai analisis
-if st.button("📂 Lakukan Analisis Dataset"):
-    progress = st.progress(0, text="⏳ Memulai analisis...")
+def visualisasi_kualitas(laporan):
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Baris di file", f"{laporan.lines:,}")
+    col2.metric("Baris kosong dibuang", f"{laporan.blank_rows:,}")
+    col3.metric("Baris data", f"{laporan.rows:,}")
+    col4.metric("Luas bermasalah", f"{laporan.luas_issues['BARIS'].nunique():,}")
+    with st.expander("Rincian pemeriksaan kualitas data"):
+        st.dataframe(laporan.summary(), use_container_width=True, hide_index=True)
+        if len(laporan.near_duplicates):
+            st.markdown("**Label kategori yang mirip** (kemungkinan variasi ejaan)")
+            st.dataframe(laporan.near_duplicates, use_container_width=True, hide_index=True)
+        if len(laporan.luas_issues):
+            st.markdown("**Nilai Luas bermasalah** (ambigu: titik bisa berarti desimal atau pemisah ribuan)")
+            st.dataframe(laporan.luas_issues, use_container_width=True, hide_index=True)
 
-    for i in range(1, 6):
-        time.sleep(0.15)
-        progress.progress(i * 20, text=f"⏳ Memproses langkah {i}/5...")
+# Kepentingan fitur global = rata-rata |kontribusi jalur pohon| atas dataset,
+# di-cache per (versi model, hash dataset)
+@st.cache_resource
+def muat_explainer(model_sha256):
+    return load_explainer()
 
-    # Baca file dari upload atau default
-    if file:
-        df = pd.read_csv(file)
-        st.success("File berhasil diunggah!")
-    else:
-        df = pd.read_csv("dataset20052025(3).csv", sep=";")
-        st.info("Menggunakan dataset default")
+@st.cache_data(show_spinner=False, max_entries=8)
+def kepentingan_fitur(model_sha256, digest, _df):
+    return muat_explainer(model_sha256).global_importance(_df)
 
-    # Drop kolom NO jika ada
-    if "NO" in df.columns:
-        df.drop(columns=["NO"], inplace=True)
+# Cross-validation paralel (semua core) di-cache ke disk per (versi model, hash dataset),
+# sehingga membuka ulang halaman tidak melatih ulang fold
+@st.cache_data(show_spinner=False, max_entries=8, persist="disk")
+def evaluasi_model(model_sha256, digest, _df):
+    return evaluate(potensitol.load_model(), _df)
 
-    progress.progress(100, text="✅ Analisis selesai!")
+def visualisasi_evaluasi(hasil):
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Akurasi cross-validation", f"{hasil['accuracy']:.1%}")
+    col2.metric("Jumlah data", f"{hasil['rows']:,}")
+    col3.metric("Fold", hasil["cv_folds"])
+    tabs = st.tabs(["Confusion Matrix", "Precision/Recall", "ROC", "Learning Curve"])
+    with tabs[0]:
+        st.plotly_chart(confusion_matrix_figure(hasil["confusion_matrix"], hasil["classes"],
+                                                "Confusion Matrix (prediksi out-of-fold)"), use_container_width=True)
+    with tabs[1]:
+        st.dataframe(hasil["per_class"].style.format({"Precision": "{:.1%}", "Recall": "{:.1%}", "F1": "{:.1%}"}),
+                     use_container_width=True)
+        st.caption("Kelas dengan sedikit data (mis. Legalisasi aset) memiliki metrik yang kurang stabil.")
+    with tabs[2]:
+        st.plotly_chart(roc_figure(hasil["roc"], "Kurva ROC one-vs-rest"), use_container_width=True)
+    with tabs[3]:
+        st.plotly_chart(learning_curve_figure(hasil["learning_curve"], "Learning Curve"), use_container_width=True)
+
+# Barplot dan pie/donut chart distribusi target
+def visualisasi_target(potensi_tol_data, col1, col2):
+    # Bar chart dengan Plotly
+    with span("figure.target_bar"):
+        fig_bar = px.bar(
+            potensi_tol_data,
+            x="POTENSI TOL",
+            y="Count",
+            title="BARPLOT POTENSI TOL",
+            labels={"POTENSI TOL": "Potensi TOL", "Count": "Jumlah Data"},
+            color="POTENSI TOL",
+            color_discrete_sequence=px.colors.qualitative.Pastel
+        )
+        fig_bar.update_layout(showlegend=False)
+    col1.plotly_chart(fig_bar, use_container_width=True)
+
+    # Pie/donut chart dengan Plotly
+    with span("figure.target_pie"):
+        fig_pie = px.pie(
+            potensi_tol_data,
+            names="POTENSI TOL",
+            values="Count",
+            title="DISTRIBUSI POTENSI TOL (%)",
+            hole=0.4,
+            color_discrete_sequence=px.colors.qualitative.Pastel
+        )
+        fig_pie.update_traces(textposition='inside', textinfo='percent')
+    col2.plotly_chart(fig_pie, use_container_width=True)
+
+# Violin, boxplot dan histogram Luas dari statistik yang sudah dihitung di server,
+# sehingga ukuran figure tetap berapa pun jumlah barisnya
+def visualisasi_luas(stats, hist, kde):
+    tabs = st.tabs(["Violin Plot", "Boxplot", "Histogram"])
+    with tabs[0]:
+        st.plotly_chart(violin_figure(*kde, stats, "Violin Plot Luas Tanah", "Luas  m2"), use_container_width=True)
+    with tabs[1]:
+        st.plotly_chart(box_figure(stats, "Boxplot Luas Tanah", "Luas  m2"), use_container_width=True)
+    with tabs[2]:
+        st.plotly_chart(histogram_figure(*hist, "Histogram Luas Tanah", "Luas  m2"), use_container_width=True)
+
+# Analisis streaming: file dibaca per chunk dan hanya agregat yang disimpan,
+# sehingga file yang lebih besar dari memori tetap bisa diringkas
+STREAMING_CHUNK_SIZE = 200_000
+STREAMING_AUTO_BYTES = 50 * 1024 * 1024
+
+def kepentingan_per_chunk(chunks, explainer, akumulasi):
+    # Jumlah |kontribusi| dihitung sambil chunk lewat, tanpa menyimpan barisnya
+    for chunk in chunks:
+        if all(c in chunk.columns for c in FEATURES):
+            with span("model.explain"):
+                total, rows = explainer.importance_total(chunk)
+            akumulasi["total"] = akumulasi.get("total", 0) + total
+            akumulasi["rows"] = akumulasi.get("rows", 0) + rows
+        yield chunk
+
+def analisis_streaming(file):
+    progress = StreamlitStageProgress(["Membaca & agregasi chunk", "Membuat grafik"])
+    with progress.stage("Membaca & agregasi chunk"):
+        explainer = muat_explainer(potensitol.model_info()["sha256"])
+        kepentingan = {}
+        chunks = potensitol.read_table(file, chunksize=STREAMING_CHUNK_SIZE)
+        summary = summarize_chunks(kepentingan_per_chunk(chunks, explainer, kepentingan), on_progress=progress.report)
+    st.success(f"File berhasil diringkas secara streaming: {summary.rows:,} baris ({summary.blank_rows:,} baris kosong dibuang)")
 
-    # Tampilkan data awal
     st.subheader("📁 Data Awal")
-    st.dataframe(df.head())
+    st.dataframe(summary.head)
 
-    # Informasi struktur
     st.subheader("🧾 Informasi Struktur DataFrame")
-    buffer = StringIO()
-    df.info(buf=buffer)
-    s = buffer.getvalue()
-    st.text(s)
+    st.dataframe(summary.structure(), use_container_width=True)
 
-    # Ringkasan statistik 
     st.subheader("📈 Ringkasan Statistik Data Numerik")
-    st.dataframe(df.describe().T)
+    st.dataframe(summary.describe())
 
-    # Ringkasan data kategorik dalam tabs
     st.subheader("📋 Ringkasan Data Kategorik")
-    kategorik_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
-
+    kategorik_cols = list(summary.counts)
     if kategorik_cols:
-        tabs_kat = st.tabs(kategorik_cols)  # Buat tab untuk tiap kolom kategorik
+        tabs_kat = st.tabs(kategorik_cols)
         for tab, col in zip(tabs_kat, kategorik_cols):
             with tab:
-                # Hitung frekuensi, dropna=True untuk otomatis drop NaN
-                freq = df[col].value_counts(dropna=True) \
-                            .rename_axis(col) \
-                            .reset_index(name='Jumlah')
-                
-                # Jika ada string literal 'None' yang ternyata data valid, sesuaikan filter ini
-                freq = freq[freq[col].notnull() & (freq[col] != 'None')]
-
+                freq = summary.value_counts(col).rename_axis(col).reset_index(name='Jumlah')
                 st.dataframe(freq, use_container_width=True)
     else:
         st.info("Tidak ada kolom kategorik ditemukan pada data.")
 
-
-# Univariate Analysis Tabs: Violin, Boxplot, Histogram tanpa KDE
-    st.subheader("📊 Univariate Analysis: Distribusi Luas Tanah")
-    if "Luas  m2" in df.columns:
-        df["Luas  m2"] = pd.to_numeric(df["Luas  m2"], errors="coerce")
-        df_luas = df.dropna(subset=["Luas  m2"])
-
-        if not df_luas.empty:
-            tabs = st.tabs(["Violin Plot", "Boxplot", "Histogram"])
-
-            # Violin plot
-            with tabs[0]:
-                violin_fig = px.violin(
-                    df_luas,
-                    y="Luas  m2",
-                    box=True,
-                    points="all",
-                    color_discrete_sequence=["#1E3A8A"],
-                    title="Violin Plot Luas Tanah"
-                )
-                st.plotly_chart(violin_fig, use_container_width=True)
-
-            # Boxplot
-            with tabs[1]:
-                box_fig = px.box(
-                    df_luas,
-                    y="Luas  m2",
-                    color_discrete_sequence=["#1E3A8A"],
-                    title="Boxplot Luas Tanah"
-                )
-                st.plotly_chart(box_fig, use_container_width=True)
-
-            # Histogram tanpa KDE
-            with tabs[2]:
-                hist_fig = go.Figure()
-                hist_fig.add_trace(go.Histogram(
-                    x=df_luas["Luas  m2"],
-                    nbinsx=30,
-                    histnorm='density',
-                    marker_color='#1E3A8A',
-                    opacity=0.7,
-                    name='Histogram'
-                ))
-                hist_fig.update_layout(
-                    title="Histogram Luas Tanah",
-                    xaxis_title="Luas  m2",
-                    yaxis_title="Density"
-                )
-                st.plotly_chart(hist_fig, use_container_width=True)
+    with progress.stage("Membuat grafik"):
+        st.subheader("📊 Univariate Analysis: Distribusi Luas Tanah")
+        luas = summary.numeric.get("Luas  m2")
+        if luas is not None and luas.count:
+            visualisasi_luas(box_stats_from_summary(luas), luas.histogram(bins=HIST_BINS), kde_from_summary(luas))
         else:
             st.info("Data kolom 'Luas  m2' kosong atau tidak valid.")
-    else:
-        st.info("Kolom 'Luas  m2' tidak ditemukan pada data.")
 
-    # Visualisasi barplot dan pie/donut chart dengan Plotly
-    st.subheader("📋 Visualisasi TARGET")
-    col1, col2 = st.columns(2)
-    if "POTENSI TOL" in df.columns:
-        potensi_tol_data = df["POTENSI TOL"].value_counts().reset_index()
-        potensi_tol_data.columns = ["POTENSI TOL", "Count"]
+        st.subheader("📋 Visualisasi TARGET")
+        col1, col2 = st.columns(2)
+        if "POTENSI TOL" in summary.counts:
+            potensi_tol_data = summary.value_counts("POTENSI TOL").rename_axis("POTENSI TOL").reset_index(name="Count")
+            visualisasi_target(potensi_tol_data, col1, col2)
+        else:
+            col1.info("Kolom 'POTENSI TOL' tidak ditemukan pada data.")
+            col2.info("Kolom 'POTENSI TOL' tidak ditemukan pada data.")
 
-        # Bar chart dengan Plotly
-        fig_bar = px.bar(
-            potensi_tol_data, 
-            x="POTENSI TOL", 
-            y="Count", 
-            title="BARPLOT POTENSI TOL",
-            labels={"POTENSI TOL": "Potensi TOL", "Count": "Jumlah Data"},
-            color="POTENSI TOL",
-            color_discrete_sequence=px.colors.qualitative.Pastel
-        )
-        fig_bar.update_layout(showlegend=False)
-        col1.plotly_chart(fig_bar, use_container_width=True)
+        st.subheader("🌲 Kepentingan Fitur Model Random Forest")
+        if kepentingan:
+            st.plotly_chart(
+                importance_figure(explainer.importance_frame(kepentingan["total"], kepentingan["rows"]),
+                                  "Rata-rata |kontribusi| fitur terhadap probabilitas tiap kelas"),
+                use_container_width=True,
+            )
+            st.caption("Dihitung per chunk dari kontribusi jalur pohon setiap baris valid; makin panjang bar, "
+                       "makin besar pengaruh fitur terhadap prediksi.")
+        else:
+            st.info("Kolom fitur model tidak lengkap pada data.")
 
-        # Pie/donut chart dengan Plotly
-        fig_pie = px.pie(
-            potensi_tol_data, 
-            names="POTENSI TOL", 
-            values="Count", 
-            title="DISTRIBUSI POTENSI TOL (%)",
-            hole=0.4,
-            color_discrete_sequence=px.colors.qualitative.Pastel
-        )
-        fig_pie.update_traces(textposition='inside', textinfo='percent')
-        col2.plotly_chart(fig_pie, use_container_width=True)
-    else:
-        col1.info("Kolom 'POTENSI TOL' tidak ditemukan pada data.")
-        col2.info("Kolom 'POTENSI TOL' tidak ditemukan pada data.")
+        # Cross-validation melatih ulang fold dari seluruh baris, jadi sengaja tidak
+        # dijalankan di mode streaming (tidak ada tahap "Evaluasi model" di sini)
+        st.subheader("🧪 Evaluasi Model Random Forest")
+        st.info("Evaluasi model (cross-validation) membutuhkan seluruh baris di memori dan hanya "
+                "tersedia di mode non-streaming.")
 
-    
+    progress.finish()
     st.success("✅ Analisis selesai!")
+
+# Upload file
+file = st.file_uploader("Unggah file CSV", type=["csv"])
+streaming = st.checkbox(
+    "Mode streaming (untuk file sangat besar, ringkasan tanpa memuat seluruh data)",
+    value=file is not None and file.size > STREAMING_AUTO_BYTES,
+    disabled=file is None,
+)
+
+# Tombol untuk memulai analisis
+analisis = st.button("📂 Lakukan Analisis Dataset")
+if analisis and streaming and file:
+    analisis_streaming(file)
+elif analisis:
+    progress = StreamlitStageProgress(
+        ["Membaca file", "Pembersihan data", "Ringkasan statistik", "Membuat grafik", "Evaluasi model"]
+    )
+
+    with progress.stage("Membaca file"):
+        # Baca file dari upload atau default
+        if file:
+            digest = potensitol.file_digest(file)
+            df, laporan = muat_dataset(digest, file.name, file.getvalue())
+            st.success("File berhasil diunggah!")
+        else:
+            digest = potensitol.file_digest(DATASET_PATH)
+            df, laporan = muat_dataset(digest, str(DATASET_PATH))
+            st.info("Menggunakan dataset default")
+
+    with progress.stage("Pembersihan data"):
+        # Baris kosong sudah dibuang saat dimuat; tampilkan temuan profil kualitas
+        st.subheader("🩺 Kualitas Data")
+        visualisasi_kualitas(laporan)
+
+        # Drop kolom NO jika ada
+        if "NO" in df.columns:
+            df.drop(columns=["NO"], inplace=True)
+
+    with progress.stage("Ringkasan statistik"):
+        # Tampilkan data awal
+        st.subheader("📁 Data Awal")
+        st.dataframe(df.head())
+
+        # Informasi struktur
+        st.subheader("🧾 Informasi Struktur DataFrame")
+        buffer = StringIO()
+        df.info(buf=buffer)
+        s = buffer.getvalue()
+        st.text(s)
+
+        # Ringkasan statistik 
+        st.subheader("📈 Ringkasan Statistik Data Numerik")
+        st.dataframe(df.describe().T)
+
+        # Ringkasan data kategorik dalam tabs
+        st.subheader("📋 Ringkasan Data Kategorik")
+        kategorik_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
+
+        if kategorik_cols:
+            tabs_kat = st.tabs(kategorik_cols)  # Buat tab untuk tiap kolom kategorik
+            for tab, col in zip(tabs_kat, kategorik_cols):
+                with tab:
+                    # Hitung frekuensi, dropna=True untuk otomatis drop NaN
+                    with span("data.value_counts"):
+                        freq = df[col].value_counts(dropna=True) \
+                                    .rename_axis(col) \
+                                    .reset_index(name='Jumlah')
+                
+                    # Jika ada string literal 'None' yang ternyata data valid, sesuaikan filter ini
+                    freq = freq[freq[col].notnull() & (freq[col] != 'None')]
+
+                    st.dataframe(freq, use_container_width=True)
+        else:
+            st.info("Tidak ada kolom kategorik ditemukan pada data.")
+
+    with progress.stage("Membuat grafik"):
+        # Univariate Analysis Tabs: Violin, Boxplot, Histogram (statistik dihitung di server)
+        st.subheader("📊 Univariate Analysis: Distribusi Luas Tanah")
+        if "Luas  m2" in df.columns:
+            df_luas = df.dropna(subset=["Luas  m2"])
+
+            if not df_luas.empty:
+                values = df_luas["Luas  m2"].to_numpy()
+                visualisasi_luas(box_stats(values), np.histogram(values, bins=HIST_BINS), kde_from_values(values))
+            else:
+                st.info("Data kolom 'Luas  m2' kosong atau tidak valid.")
+        else:
+            st.info("Kolom 'Luas  m2' tidak ditemukan pada data.")
+
+        # Visualisasi barplot dan pie/donut chart dengan Plotly
+        st.subheader("📋 Visualisasi TARGET")
+        col1, col2 = st.columns(2)
+        if "POTENSI TOL" in df.columns:
+            with span("data.value_counts"):
+                potensi_tol_data = df["POTENSI TOL"].value_counts().reset_index()
+            potensi_tol_data.columns = ["POTENSI TOL", "Count"]
+
+            visualisasi_target(potensi_tol_data, col1, col2)
+        else:
+            col1.info("Kolom 'POTENSI TOL' tidak ditemukan pada data.")
+            col2.info("Kolom 'POTENSI TOL' tidak ditemukan pada data.")
+
+        # Kepentingan fitur model Random Forest pada dataset ini
+        st.subheader("🌲 Kepentingan Fitur Model Random Forest")
+        if all(c in df.columns for c in FEATURES):
+            model_sha256 = potensitol.model_info()["sha256"]
+            kepentingan = kepentingan_fitur(model_sha256, digest, df)
+            st.plotly_chart(
+                importance_figure(kepentingan, "Rata-rata |kontribusi| fitur terhadap probabilitas tiap kelas"),
+                use_container_width=True,
+            )
+            st.caption("Dihitung dari kontribusi jalur pohon setiap baris valid; makin panjang bar, "
+                       "makin besar pengaruh fitur terhadap prediksi.")
+        else:
+            st.info("Kolom fitur model tidak lengkap pada data.")
+
+    with progress.stage("Evaluasi model"):
+        st.subheader("🧪 Evaluasi Model Random Forest")
+        if all(c in df.columns for c in FEATURES + [TARGET]):
+            visualisasi_evaluasi(evaluasi_model(potensitol.model_info()["sha256"], digest, df))
+        else:
+            st.info("Evaluasi membutuhkan kolom fitur dan kolom 'POTENSI TOL'.")
+
+    progress.finish()
+    st.success("✅ Analisis selesai!")
+
+# Panel waktu eksekusi (hanya dengan ?debug=1)
+debug_panel()
@@ -1,71 +1,28 @@
 import streamlit as st
-import pickle
-import pandas as pd
-import time
 import os
-import base64
+from io import StringIO
+
+import potensitol
+from potensitol.cache import PREDICTION_CACHE
+from potensitol.charts import contribution_figure
+from potensitol.data import CONFIDENCE, FEATURES, PREDICTION, VALIDATION
+from potensitol.explain import load_explainer
+from potensitol.layout import button_style, debug_panel, page_banner, page_fragment, setup_page
+from potensitol.model import SCORE_DTYPE, confidence_level, top_k
+from potensitol.progress import StreamlitStageProgress
+from potensitol.schema import COLUMN_ALIASES, Schema
+from potensitol.store import PredictionStore
+from potensitol.trace import span
 
 # --------------------- Konfigurasi Halaman ---------------------
-# Atur layout wide
-st.set_page_config(layout="wide", page_title="Prediksi Potensi TOL", initial_sidebar_state="auto")
-
-# Function to display and center the logo in the sidebar
-def display_logo():
-    logo_path = 'logo.png'  # Adjust path to your logo file
-    if os.path.exists(logo_path):
-        with open(logo_path, "rb") as image_file:
-            encoded_image = base64.b64encode(image_file.read()).decode()
-        st.sidebar.markdown(
-            f"""
-            <div style="text-align: center;">
-                <img src="data:image/png;base64,{encoded_image}" width="150" />
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-    else:
-        st.sidebar.error(f"Logo file '{logo_path}' not found. Please ensure the file is in the correct directory.")
-display_logo()
-st.markdown("""
-    <div style='
-        text-align: center;
-        color: #004AAD;
-        background-color: #E3F2FD;
-        padding: 20px;
-        border-radius: 12px;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-    '>
-        <div style="font-size: 2.2rem; font-weight: bold;">
-            PREDIKSI POTENSI TOL
-        </div>
-        <div style="font-size: 1.3rem; font-weight: bold;">
-            (Tanah Objek Landreform)
-        </div>
-    </div>
-""", unsafe_allow_html=True)
+# Atur layout wide + logo sidebar (aset di-cache per proses)
+setup_page("Prediksi Potensi TOL")
+
+page_banner("PREDIKSI POTENSI TOL", "(Tanah Objek Landreform)")
 
 
 # --------------------- Styling Tombol ---------------------
-st.markdown("""
-    <style>
-    div.stButton > button {
-        background-color: #007BFF;
-        color: white;
-        font-weight: bold;
-        border: none;
-        border-radius: 8px;
-        padding: 0.75em 1.5em;
-        transition: background-color 0.3s ease;
-        font-size: 18px;
-        width: 100%;
-    }
-
-    div.stButton > button:hover {
-        background-color: #FFD600;
-        color: black;
-    }
-    </style>
-""", unsafe_allow_html=True)
+button_style()
 
 # --------------------- Fungsi Styling Output ---------------------
 def generate_style(param_name, value, bg_color="#FFF5C2", text_color="blue"):
@@ -88,92 +45,268 @@ def generate_style(param_name, value, bg_color="#FFF5C2", text_color="blue"):
 
 # --------------------- Load Model ---------------------
 
+# Kunci cache = SHA-256 model, sehingga artefak baru otomatis dimuat ulang.
+# Forest dijalankan lewat mesin terkompilasi (hasil identik dengan scikit-learn).
 @st.cache_resource
-def load_model():
-    with open("model_rf_potensiTOL.pkl", "rb") as f:
-        model = pickle.load(f)
-    return model
-
-model = load_model()
-
-# --------------------- Form Input Pengguna ---------------------
-st.markdown("### 🧾 Masukkan Karakteristik Lahan")
-
-penguasaan = st.selectbox("PENGUASAAN TANAH", 
-    ["Penggarap", "Pemilik", "Fasos Fasum", "Aset Desa", "Pemerintah"])
-
-kepemilikan = st.selectbox("KEPEMILIKAN TANAH", 
-    ["Terdaftar", "Belum Terdaftar", "Terdaftar (HGU Baru)", 
-     "Tidak Terdaftar", "Terdaftar (tumpang tindih)"])
-
-penggunaan = st.selectbox("PENGGUNAAN TANAH", 
-    ["Tegalan", "Rumah Tinggal", "Kebun Campuran", "Mushola", "Masjid", 
-     "PAUD", "Madrasah", "Pangkalan Ojek", "Kebun", "Lainnya"])
-
-pemanfaatan = st.selectbox("PEMANFAATAN TANAH", 
-    ["Tanaman semusim", "Tempat tinggal", "Produksi pertanian", 
-     "Sarana Ibadah", "Sarana Pendidikan", "Olahraga", "Usaha", "Tanaman tahunan"])
-
-luas = st.number_input("Luas Lahan (m²)", min_value=1, max_value=500000, value=10000, step=1)
-
-# --------------------- Tombol Submit di Tengah ---------------------
-col1, col2, col3 = st.columns([1, 2, 1])
-with col2:
-    submit = st.button("TAMPILKAN PREDIKSI ")
-
-# --------------------- Proses Prediksi ---------------------
-if submit:
-    st.toast("Memproses data...", icon="⏳")
-    progress = st.progress(0)
-    for i in range(100):
-        time.sleep(0.01)
-        progress.progress(i + 1)
-    progress.empty()
-
-    input_df = pd.DataFrame([{
-        "PENGUASAAN TANAH": penguasaan,
-        "PEMILIKAN TANAH": kepemilikan,
-        "PENGGUNAAN TANAH": penggunaan,
-        "PEMANFAATAN TANAH": pemanfaatan,
-        "Luas  m2": luas   
-    }])
-
-    try:
-        prediksi = model.predict(input_df)[0]
-    except Exception as e:
-        st.error(f"❌ Terjadi kesalahan saat prediksi: {e}")
-        st.stop()
-
-    # --------------------- Tampilkan Hasil Input ---------------------
-    st.markdown("## Hasil Input Parameter")
-    col1, col2 = st.columns(2)
-    col1.markdown(generate_style("Penguasaan Tanah", penguasaan), unsafe_allow_html=True)
-    col2.markdown(generate_style("Kepemilikan Tanah", kepemilikan), unsafe_allow_html=True)
-
-    col1, col2 = st.columns(2)
-    col1.markdown(generate_style("Penggunaan Tanah", penggunaan), unsafe_allow_html=True)
-    col2.markdown(generate_style("Pemanfaatan Tanah", pemanfaatan), unsafe_allow_html=True)
-
-    col1, col2 = st.columns(2)
-    col1.markdown(generate_style("Luas Lahan (m²)", luas), unsafe_allow_html=True)
-    col2.empty()
-
-    # --------------------- Hasil Prediksi ---------------------
-    st.markdown(f"""
-    <div style="
-        margin-top: 30px;
-        padding: 15px;
-        background-color: #C2D5FF;
-        border-radius: 20px;
-        border: 4px double blue;
-        text-align: center;
-        font-size: 2rem;
-        font-weight: bold;
-        color: #B80000;
-        box-shadow: 0 0 15px #C2D5FF;
-    ">
-        Hasil Prediksi: <span style="text-transform: uppercase;">{prediksi}</span>
-    </div>
-    """, unsafe_allow_html=True)
+def load_model(model_sha256):
+    return potensitol.load_engine()
+
+# Pilihan form dan validasi batch memakai kosakata kategori model itu sendiri
+@st.cache_resource
+def load_schema(model_sha256):
+    return Schema.from_model(load_model(model_sha256))
+
+# Penjelasan butuh array node forest, di-cache per versi model
+@st.cache_resource
+def load_explainer_cached(model_sha256):
+    return load_explainer()
+
+# Riwayat prediksi SQLite; satu objek per proses (koneksi dibuka per operasi)
+@st.cache_resource
+def load_store():
+    return PredictionStore()
+
+model_info = potensitol.model_info()
+model = load_model(model_info["sha256"])
+schema = load_schema(model_info["sha256"])
+st.sidebar.caption(
+    f"Model: `{model_info['version']}`"
+    + (f" · scikit-learn {model_info['sklearn_version']}" if model_info["sklearn_version"] else "")
+)
+
+# --------------------- Mode Prediksi ---------------------
+tab_satuan, tab_batch, tab_riwayat = st.tabs(
+    ["🧾 Prediksi Satuan", "📂 Prediksi Batch (CSV/XLSX)", "🗂️ Riwayat Prediksi"]
+)
+
+# --------------------- Prediksi Satuan ---------------------
+# Input dikumpulkan dalam st.form sehingga mengubah pilihan tidak memicu rerun;
+# fragment membatasi rerun saat submit hanya pada form dan panel hasil ini.
+def tandai_simpan():
+    st.session_state.simpan_prediksi = True
+
+@page_fragment
+def prediksi_satuan():
+    # --------------------- Form Input Pengguna ---------------------
+    st.markdown("### 🧾 Masukkan Karakteristik Lahan")
+
+    with st.form("form_prediksi", border=False):
+        no_parsel = st.text_input("NO PARSEL (opsional, untuk riwayat prediksi)")
+
+        penguasaan = st.selectbox("PENGUASAAN TANAH", schema.options("PENGUASAAN TANAH"), format_func=str.strip)
+
+        kepemilikan = st.selectbox("KEPEMILIKAN TANAH", schema.options("PEMILIKAN TANAH"), format_func=str.strip)
+
+        penggunaan = st.selectbox("PENGGUNAAN TANAH", schema.options("PENGGUNAAN TANAH"), format_func=str.strip)
+
+        pemanfaatan = st.selectbox("PEMANFAATAN TANAH", schema.options("PEMANFAATAN TANAH"), format_func=str.strip)
+
+        luas = st.number_input("Luas Lahan (m²)", min_value=1, max_value=500000, value=10000, step=1)
+
+        # --------------------- Tombol Submit di Tengah ---------------------
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            # Callback berjalan tepat sekali per klik, sehingga riwayat tidak
+            # tercatat ulang pada rerun berikutnya
+            submit = st.form_submit_button("TAMPILKAN PREDIKSI ", on_click=tandai_simpan)
+
+    # --------------------- Proses Prediksi ---------------------
+    if submit:
+        progress = StreamlitStageProgress(["Inferensi model"])
+
+        input_data = {
+            "PENGUASAAN TANAH": penguasaan,
+            "PEMILIKAN TANAH": kepemilikan,
+            "PENGGUNAAN TANAH": penggunaan,
+            "PEMANFAATAN TANAH": pemanfaatan,
+            "Luas  m2": luas   
+        }
+
+        try:
+            # Profil lahan yang sama diambil dari cache LRU proses
+            with progress.stage("Inferensi model"), span("model.predict_record"):
+                proba = PREDICTION_CACHE.predict_proba(model, input_data, model_info["sha256"])
+            kelas, peluang, margin = top_k(proba, model.classes_, k=len(model.classes_))
+            prediksi = kelas[0, 0]
+        except Exception as e:
+            st.error(f"❌ Terjadi kesalahan saat prediksi: {e}")
+            st.stop()
+        progress.finish()
+        if st.session_state.pop("simpan_prediksi", False):
+            load_store().insert_record(input_data, model.classes_, proba, model_info["version"], no=no_parsel)
+
+        # --------------------- Tampilkan Hasil Input ---------------------
+        st.markdown("## Hasil Input Parameter")
+        col1, col2 = st.columns(2)
+        col1.markdown(generate_style("Penguasaan Tanah", penguasaan), unsafe_allow_html=True)
+        col2.markdown(generate_style("Kepemilikan Tanah", kepemilikan), unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+        col1.markdown(generate_style("Penggunaan Tanah", penggunaan), unsafe_allow_html=True)
+        col2.markdown(generate_style("Pemanfaatan Tanah", pemanfaatan), unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+        col1.markdown(generate_style("Luas Lahan (m²)", luas), unsafe_allow_html=True)
+        col2.empty()
+
+        # --------------------- Hasil Prediksi ---------------------
+        st.markdown(f"""
+        <div style="
+            margin-top: 30px;
+            padding: 15px;
+            background-color: #C2D5FF;
+            border-radius: 20px;
+            border: 4px double blue;
+            text-align: center;
+            font-size: 2rem;
+            font-weight: bold;
+            color: #B80000;
+            box-shadow: 0 0 15px #C2D5FF;
+        ">
+            Hasil Prediksi: <span style="text-transform: uppercase;">{prediksi}</span>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # --------------------- Keyakinan Model ---------------------
+        st.markdown("## Keyakinan Model")
+        keyakinan = confidence_level(margin)[0]
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Probabilitas", f"{peluang[0, 0]:.1%}")
+        col2.metric("Margin dari kelas kedua", f"{margin[0]:.1%}", help="Probabilitas kelas teratas dikurangi kelas kedua")
+        col3.metric("Keyakinan", keyakinan)
+        for nama_kelas, p in zip(kelas[0], peluang[0]):
+            st.progress(float(p), text=f"{nama_kelas}: {p:.1%}")
+
+        # --------------------- Penjelasan Prediksi ---------------------
+        st.markdown("## Mengapa Kelas Ini?")
+        _, bias, kontribusi = load_explainer_cached(model_info["sha256"]).explain_record(input_data, prediksi)
+        st.plotly_chart(
+            contribution_figure(kontribusi, f"Kontribusi fitur terhadap probabilitas {prediksi}"),
+            use_container_width=True,
+        )
+        st.caption(
+            f"Probabilitas dasar {prediksi} (rata-rata seluruh data latih): {bias:.1%}. "
+            "Setiap fitur menaikkan atau menurunkan probabilitas dari titik itu sepanjang jalur pohon."
+        )
+
+        st.snow()
+
+    # --------------------- Statistik Cache Prediksi ---------------------
+    # Di dalam fragment agar selalu mutakhir setelah setiap submit
+    cache = PREDICTION_CACHE.stats()
+    with st.expander("Cache prediksi"):
+        col1, col2 = st.columns(2)
+        col1.metric("Hit", f"{cache['hits']:,}")
+        col2.metric("Miss", f"{cache['misses']:,}")
+        st.caption(
+            f"Hit rate {cache['hit_rate']:.0%} · {cache['size']:,}/{cache['maxsize']:,} entri · "
+            f"{cache['evictions']:,} eviction · {cache['invalidations']:,} invalidasi"
+        )
+
+with tab_satuan:
+    prediksi_satuan()
+
+# CSV unduhan dibangun sekali per hasil batch (kunci: hash file + opsi), bukan setiap rerun
+@st.cache_data(show_spinner=False, max_entries=4)
+def hasil_csv(digest, _df):
+    buffer = StringIO()
+    potensitol.write_csv(_df, buffer)
+    return buffer.getvalue().encode("utf-8")
+
+with tab_batch:
+    st.markdown("### 📂 Unggah File Inventarisasi IP4T")
+    st.caption("Format kolom sama dengan dataset IP4T: " + ", ".join(f"`{c}`" for c in FEATURES))
+
+    file_batch = st.file_uploader("Unggah file CSV atau XLSX", type=["csv", "xlsx"], key="file_batch")
+
+    jelaskan = st.checkbox("Sertakan kontribusi fitur per baris (penjelasan prediksi)")
+    simpan = st.checkbox("Simpan hasil ke riwayat prediksi", value=True)
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        submit_batch = st.button("PREDIKSI SELURUH FILE", disabled=file_batch is None)
+
+    if submit_batch and file_batch is not None:
+        progress = StreamlitStageProgress(
+            ["Membaca file", "Inferensi model"] + (["Penjelasan"] if jelaskan else []) + (["Menyimpan"] if simpan else [])
+        )
+        with progress.stage("Membaca file"):
+            df_batch = potensitol.read_table(file_batch, dtype=SCORE_DTYPE)
+        kolom_hilang = [c for c in FEATURES if c not in df_batch.rename(columns=COLUMN_ALIASES).columns]
+        if kolom_hilang:
+            progress.finish()
+            st.error(f"❌ Kolom berikut tidak ditemukan pada file: {', '.join(kolom_hilang)}")
+        else:
+            with progress.stage("Inferensi model"):
+                hasil, proba = potensitol.predict_frame(
+                    model, df_batch, on_progress=progress.report, schema=schema, return_proba=True
+                )
+            if jelaskan:
+                with progress.stage("Penjelasan"):
+                    hasil = hasil.join(load_explainer_cached(model_info["sha256"]).explain_frame(hasil))
+            if simpan:
+                with progress.stage("Menyimpan"):
+                    load_store().insert_frame(hasil, proba, model_info["version"], source=file_batch.name)
+            progress.finish()
+            st.session_state.hasil_batch = {
+                "nama": os.path.splitext(file_batch.name)[0],
+                "digest": f"{potensitol.file_digest(file_batch)}-{model_info['sha256']}-{jelaskan}",
+                "hasil": hasil,
+                "n_invalid": int(hasil[PREDICTION].isna().sum()),
+                "durasi": progress.total,
+            }
+
+    if "hasil_batch" in st.session_state:
+        batch = st.session_state.hasil_batch
+        hasil = batch["hasil"]
+        st.success(f"✅ {len(hasil):,} baris diprediksi dalam {batch['durasi']:.2f} detik")
+        if batch["n_invalid"]:
+            st.warning(f"⚠️ {batch['n_invalid']:,} baris gagal validasi dan tidak diprediksi.")
+            with st.expander("Rincian baris yang gagal validasi"):
+                kolom = [c for c in hasil.columns if c in FEATURES or c in COLUMN_ALIASES] + [VALIDATION]
+                st.dataframe(hasil.loc[hasil[VALIDATION].notna(), kolom], use_container_width=True)
+
+        col1, col2 = st.columns([2, 1])
+        col1.dataframe(hasil.head(100), use_container_width=True)
+        with span("data.value_counts"):
+            jumlah_kelas = hasil[PREDICTION].value_counts().rename_axis(PREDICTION).reset_index(name="Jumlah")
+            jumlah_keyakinan = hasil[CONFIDENCE].value_counts().rename_axis(CONFIDENCE).reset_index(name="Jumlah")
+        col2.dataframe(jumlah_kelas, use_container_width=True)
+        col2.dataframe(jumlah_keyakinan, use_container_width=True)
+
+        st.download_button(
+            "⬇️ Unduh Hasil Prediksi (CSV)",
+            data=hasil_csv(batch["digest"], hasil),
+            file_name=f"{batch['nama']}_prediksi.csv",
+            mime="text/csv",
+        )
+
+# --------------------- Riwayat Prediksi ---------------------
+# Halaman diambil di server dengan LIMIT/OFFSET (indeks NO dan kelas);
+# fragment membatasi rerun saat berpindah halaman hanya pada tab ini.
+@page_fragment
+def riwayat_prediksi():
+    store = load_store()
+    col1, col2, col3 = st.columns([2, 2, 1])
+    no = col1.text_input("Cari NO parsel")
+    kelas = col2.selectbox("Kelas prediksi", ["Semua"] + store.classes())
+    ukuran = col3.selectbox("Baris per halaman", [25, 50, 100], index=1)
+    filter_kelas = None if kelas == "Semua" else kelas
+
+    total = store.count(no=no, kelas=filter_kelas)
+    if not total:
+        st.info("Belum ada prediksi tersimpan yang sesuai.")
+        return
+    jumlah_halaman = -(-total // ukuran)
+    halaman = st.number_input("Halaman", min_value=1, max_value=jumlah_halaman, value=1, step=1)
+    st.dataframe(
+        store.query(no=no, kelas=filter_kelas, limit=ukuran, offset=(halaman - 1) * ukuran),
+        use_container_width=True, hide_index=True,
+    )
+    st.caption(f"Halaman {halaman} dari {jumlah_halaman:,} · {total:,} prediksi · terbaru dulu")
+
+with tab_riwayat:
+    riwayat_prediksi()
 
-    st.snow()
+# --------------------- Panel Debug (?debug=1) ---------------------
+debug_panel()
@@ -0,0 +1,27 @@
+"""Pustaka prediksi Potensi TOL (Tanah Objek Landreform) tanpa Streamlit.
+
+Modul ini dipakai bersama oleh halaman Streamlit dan job batch/cron::
+
+    from potensitol import load_engine, predict_frame, read_table
+
+    model = load_engine()
+    hasil = predict_frame(model, read_table("dataset20052025(3).csv"))
+"""
+
+from potensitol.data import FEATURES, TARGET, file_digest, load_dataset, read_table, write_csv
+from potensitol.model import MODEL_PATH, load_engine, load_model, model_info, predict_frame, score_file
+
+__all__ = [
+    "FEATURES",
+    "MODEL_PATH",
+    "TARGET",
+    "file_digest",
+    "load_dataset",
+    "load_engine",
+    "load_model",
+    "model_info",
+    "predict_frame",
+    "read_table",
+    "score_file",
+    "write_csv",
+]
@@ -0,0 +1,273 @@
+"""Entry point baris perintah.
+
+    python -m potensitol score in.csv out.csv --workers -1 --store prediksi.sqlite
+    python -m potensitol rescore in.csv out.csv --diff perubahan.csv
+    python -m potensitol serve --port 8000
+    python -m potensitol snapshot dataset.csv
+    python -m potensitol artifact import model_rf_potensiTOL.pkl
+    python -m potensitol train dataset.csv --n-jobs -1
+    python -m potensitol compile
+    python -m potensitol lookup
+    python -m potensitol profile dataset.csv
+    python -m potensitol bench --baseline bench.json
+"""
+
+import argparse
+import sys
+import time
+
+from potensitol.data import DATASET_PATH, FEATURES
+from potensitol.model import (
+    CHUNK_SIZE, engine_path, load_engine, load_model, lookup_path, model_info, resolve_model_path, score_file,
+)
+
+
+def cmd_score(args):
+    mulai = time.perf_counter()
+    store, disimpan = None, []
+    if args.store:
+        from potensitol.store import PredictionStore
+
+        store = PredictionStore(args.store)
+        version = model_info(args.model)["version"]
+
+    # Disimpan per chunk dari probabilitas yang sudah dihitung saat skoring
+    def simpan(hasil, proba):
+        disimpan.append(store.insert_frame(hasil, proba, version, source=str(args.input)))
+
+    on_chunk = simpan if store is not None else None
+    if args.workers == 1:
+        model = load_model(args.model) if args.sklearn else load_engine(args.model)
+        total = score_file(model, args.input, args.output, chunk_size=args.chunk_size, on_chunk=on_chunk)
+    else:
+        from potensitol.parallel import score_file_parallel
+
+        total = score_file_parallel(args.input, args.output, workers=args.workers, model_path=args.model,
+                                    sklearn=args.sklearn, chunk_size=args.chunk_size, on_chunk=on_chunk)
+    if store is not None:
+        print(f"{sum(disimpan)} prediksi disimpan ke {args.store}", file=sys.stderr)
+    durasi = time.perf_counter() - mulai
+    print(f"{total} baris diprediksi ke {args.output} dalam {durasi:.2f} detik "
+          f"(model {model_info(args.model)['version']})", file=sys.stderr)
+
+
+def cmd_rescore(args):
+    from potensitol.data import read_table, write_csv
+    from potensitol.incremental import load_store, rescore_frame, save_store, store_path
+
+    mulai = time.perf_counter()
+    info = model_info(args.model)
+    model = load_model(args.model) if args.sklearn else load_engine(args.model)
+    store = store_path(info["version"], args.store_dir)
+    hasil, simpanan, diff, ringkasan = rescore_frame(
+        model, read_table(args.input), load_store(store, info["sha256"]), chunk_size=args.chunk_size
+    )
+    with open(args.output, "w", encoding="utf-8", newline="") as out:
+        write_csv(hasil, out, chunk_size=args.chunk_size)
+    if args.diff:
+        diff.to_csv(args.diff, sep=";", index=False)
+    save_store(simpanan, store, info["sha256"])
+    for key, value in ringkasan.items():
+        print(f"{key:>14}: {value}", file=sys.stderr)
+    print(f"Hasil ditulis ke {args.output} dalam {time.perf_counter() - mulai:.2f} detik "
+          f"(model {info['version']}, simpanan {store})", file=sys.stderr)
+
+
+def cmd_serve(args):
+    from potensitol.server import serve
+
+    print(f"Melayani prediksi di http://{args.host}:{args.port}/predict", file=sys.stderr)
+    serve(args.host, args.port, model_path=args.model, max_batch=args.max_batch, max_wait_ms=args.max_wait_ms)
+
+
+def cmd_snapshot(args):
+    from potensitol.snapshot import write_snapshot
+
+    target = write_snapshot(args.input, args.output)
+    print(f"Snapshot Arrow ditulis ke {target}", file=sys.stderr)
+
+
+def cmd_artifact(args):
+    from potensitol import artifact
+
+    if args.action == "import":
+        directory = artifact.import_pickle(args.path, version=args.version, training_data=args.training_data,
+                                           make_current=not args.no_current)
+        print(f"Artefak ditulis ke {directory}", file=sys.stderr)
+    elif args.action == "use":
+        artifact.set_current(args.path)
+    current = artifact.current_artifact()
+    for metadata in artifact.list_artifacts():
+        tanda = "*" if current and current.name == metadata["version"] else " "
+        print(f"{tanda} {metadata['version']}  sklearn {metadata['sklearn_version']}  "
+              f"sha256 {metadata['model_sha256'][:12]}  metrik {metadata['metrics']}")
+
+
+def cmd_train(args):
+    from potensitol.train import train_artifact
+
+    directory, metrics = train_artifact(
+        args.input, version=args.version, make_current=not args.no_current,
+        n_estimators=args.n_estimators, max_depth=args.max_depth, n_jobs=args.n_jobs, cv=args.cv,
+    )
+    for key, value in metrics.items():
+        print(f"{key:>20}: {value}", file=sys.stderr)
+    print(f"Artefak ditulis ke {directory}", file=sys.stderr)
+
+
+def cmd_compile(args):
+    from potensitol.engine import compile_forest
+
+    path = resolve_model_path(args.model)
+    output = args.output or engine_path(path)
+    engine = compile_forest(load_model(path), model_sha256=model_info(path)["sha256"])
+    engine.save(output)
+    print(f"{engine.n_trees} pohon / {len(engine.feature)} node diekspor ke {output}", file=sys.stderr)
+
+
+def cmd_lookup(args):
+    from potensitol.engine import compile_forest
+    from potensitol.lookup import build_lookup
+
+    path = resolve_model_path(args.model)
+    output = args.output or lookup_path(path)
+    mulai = time.perf_counter()
+    table = build_lookup(compile_forest(load_model(path)), model_sha256=model_info(path)["sha256"])
+    table.save(output)
+    print(f"{table.n_combinations} kombinasi kategori × {table.n_intervals} interval Luas → "
+          f"{table.n_segments} segmen / {len(table.probas)} baris probabilitas unik, "
+          f"ditulis ke {output} dalam {time.perf_counter() - mulai:.1f} detik", file=sys.stderr)
+
+
+def cmd_profile(args):
+    from potensitol.quality import profile_dataset
+
+    _, report = profile_dataset(args.input)
+    print(report.summary().to_string(index=False))
+    if len(report.near_duplicates):
+        print("\nLabel kategori mirip:")
+        print(report.near_duplicates.to_string(index=False))
+    if len(report.luas_issues):
+        print("\nContoh Luas bermasalah:")
+        print(report.luas_issues.groupby("MASALAH").head(args.examples).to_string(index=False))
+
+
+def cmd_bench(args):
+    from potensitol import bench
+
+    rows = tuple(int(n) for n in args.rows.split(","))
+    result = bench.run_benchmarks(rows=rows, repeat=args.repeat, model_path=args.model,
+                                  pages=() if args.skip_pages else bench.PAGES)
+    for name, seconds in result["metrics"].items():
+        print(f"{name:>32}: {seconds * 1000:10.2f} ms", file=sys.stderr)
+    if args.output:
+        bench.write_result(result, args.output)
+        print(f"Hasil benchmark ditulis ke {args.output}", file=sys.stderr)
+    if args.baseline:
+        thresholds = {}
+        for item in args.metric_threshold:
+            name, _, value = item.partition("=")
+            thresholds[name] = float(value)
+        regressions = bench.compare(result, bench.load_result(args.baseline), threshold=args.threshold,
+                                    thresholds=thresholds, min_seconds=args.min_seconds)
+        for r in regressions:
+            print(f"REGRESI {r['metric']}: {r['baseline'] * 1000:.2f} ms -> {r['current'] * 1000:.2f} ms "
+                  f"(x{r['ratio']}, ambang +{r['threshold']:.0%})", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print(f"Tidak ada regresi dibanding {args.baseline}", file=sys.stderr)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="potensitol", description="Prediksi Potensi TOL tanpa Streamlit")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    score = sub.add_parser("score", help="Prediksi seluruh baris file CSV/XLSX")
+    score.add_argument("input", help="File masukan dengan kolom: " + ", ".join(FEATURES))
+    score.add_argument("output", help="File CSV hasil prediksi (pemisah ';')")
+    score.add_argument("--model", help="Direktori artefak atau file .pkl (default: models/CURRENT, lalu pkl bawaan)")
+    score.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Jumlah baris per batch prediksi")
+    score.add_argument("--sklearn", action="store_true", help="Pakai estimator scikit-learn, bukan mesin terkompilasi")
+    score.add_argument("--workers", type=int, default=1,
+                       help="Jumlah proses worker; file dibagi per rentang baris (-1 = semua core)")
+    score.add_argument("--store", help="Simpan juga hasil ke riwayat prediksi SQLite (mis. prediksi.sqlite)")
+    score.set_defaults(func=cmd_score)
+
+    rescore = sub.add_parser("rescore", help="Skor ulang hanya parsel (per NO) yang baru atau berubah")
+    rescore.add_argument("input", help="File masukan dengan kolom NO dan: " + ", ".join(FEATURES))
+    rescore.add_argument("output", help="File CSV hasil prediksi seluruh baris (pemisah ';')")
+    rescore.add_argument("--diff", help="File CSV parsel yang kelasnya berubah, baru, atau dihapus")
+    rescore.add_argument("--store-dir", help="Direktori simpanan hasil per versi model (default: scores/ di root repo)")
+    rescore.add_argument("--model", help="Direktori artefak atau file .pkl (default: models/CURRENT, lalu pkl bawaan)")
+    rescore.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Jumlah baris per batch prediksi")
+    rescore.add_argument("--sklearn", action="store_true", help="Pakai estimator scikit-learn, bukan mesin terkompilasi")
+    rescore.set_defaults(func=cmd_rescore)
+
+    serve = sub.add_parser("serve", help="Jalankan server HTTP/JSON prediksi dengan micro-batching")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8000)
+    serve.add_argument("--model", help="Direktori artefak atau file .pkl (default: models/CURRENT, lalu pkl bawaan)")
+    serve.add_argument("--max-batch", type=int, default=512, help="Maksimum baris per batch predict_proba")
+    serve.add_argument("--max-wait-ms", type=float, default=2.0, help="Waktu tunggu pengumpulan batch (ms)")
+    serve.set_defaults(func=cmd_serve)
+
+    snapshot = sub.add_parser("snapshot", help="Konversi dataset CSV/XLSX ke snapshot Arrow IPC")
+    snapshot.add_argument("input", nargs="?", default=DATASET_PATH, help="Dataset sumber (default: %(default)s)")
+    snapshot.add_argument("--output", help="Path snapshot (default: nama sumber dengan akhiran .arrow)")
+    snapshot.set_defaults(func=cmd_snapshot)
+
+    artifact = sub.add_parser("artifact", help="Kelola artefak model berversi di models/")
+    artifact.add_argument("action", choices=["list", "import", "use"])
+    artifact.add_argument("path", nargs="?", help="File .pkl (import) atau nama versi (use)")
+    artifact.add_argument("--version", help="Nama versi artefak (default: pkl-<sha256>)")
+    artifact.add_argument("--training-data", help="Dataset latih yang hash-nya dicatat")
+    artifact.add_argument("--no-current", action="store_true", help="Jangan jadikan artefak baru sebagai default")
+    artifact.set_defaults(func=cmd_artifact)
+
+    train = sub.add_parser("train", help="Latih ulang Random Forest dari dataset dan simpan sebagai artefak")
+    train.add_argument("input", nargs="?", default=DATASET_PATH, help="Dataset latih (default: %(default)s)")
+    train.add_argument("--n-estimators", type=int, default=100)
+    train.add_argument("--max-depth", type=int, default=4)
+    train.add_argument("--n-jobs", type=int, default=None, help="Paralelisme fit dan cross-validation (-1 = semua core)")
+    train.add_argument("--cv", type=int, default=5, help="Jumlah fold cross-validation (0 = lewati)")
+    train.add_argument("--version", help="Nama versi artefak (default: rf-<timestamp>)")
+    train.add_argument("--no-current", action="store_true", help="Jangan jadikan artefak baru sebagai default")
+    train.set_defaults(func=cmd_train)
+
+    compile_ = sub.add_parser("compile", help="Ekspor forest ke array NumPy datar (mesin inferensi terkompilasi)")
+    compile_.add_argument("--model", help="Direktori artefak atau file .pkl (default: models/CURRENT, lalu pkl bawaan)")
+    compile_.add_argument("--output", help="Direktori keluaran (default: <artefak>/engine atau <pkl>.engine)")
+    compile_.set_defaults(func=cmd_compile)
+
+    lookup = sub.add_parser("lookup", help="Enumerasi seluruh kombinasi kategori × interval Luas ke tabel prediksi")
+    lookup.add_argument("--model", help="Direktori artefak atau file .pkl (default: models/CURRENT, lalu pkl bawaan)")
+    lookup.add_argument("--output", help="Direktori keluaran (default: <artefak>/lookup atau <pkl>.lookup)")
+    lookup.set_defaults(func=cmd_lookup)
+
+    profile = sub.add_parser("profile", help="Laporan kualitas data: baris kosong, label mirip, Luas tidak valid")
+    profile.add_argument("input", nargs="?", default=str(DATASET_PATH), help="File CSV/XLSX (default: dataset bawaan)")
+    profile.add_argument("--examples", type=int, default=5, help="Jumlah contoh Luas bermasalah per jenis")
+    profile.set_defaults(func=cmd_profile)
+
+    bench = sub.add_parser("bench", help="Benchmark muat model, prediksi, muat CSV dan render halaman")
+    bench.add_argument("--model", help="Direktori artefak atau file .pkl (default: models/CURRENT, lalu pkl bawaan)")
+    bench.add_argument("--rows", default="1,100,10000,1000000", help="Ukuran batch prediksi, dipisah koma")
+    bench.add_argument("--repeat", type=int, default=5, help="Pengulangan per metrik (median diambil)")
+    bench.add_argument("--skip-pages", action="store_true", help="Lewati render halaman Streamlit")
+    bench.add_argument("--output", help="Simpan hasil sebagai JSON")
+    bench.add_argument("--baseline", help="JSON hasil sebelumnya; keluar dengan kode 1 bila ada regresi")
+    bench.add_argument("--threshold", type=float, default=0.25, help="Ambang regresi relatif (0.25 = 25%% lebih lambat)")
+    bench.add_argument("--metric-threshold", action="append", default=[], metavar="METRIK=AMBANG",
+                       help="Ambang khusus per metrik, boleh diulang")
+    bench.add_argument("--min-seconds", type=float, default=0.005, help="Selisih absolut minimum agar dihitung regresi")
+    bench.set_defaults(func=cmd_bench)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
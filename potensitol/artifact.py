@@ -0,0 +1,166 @@
+"""Artefak model berversi: estimator + metadata yang bisa dibaca tanpa unpickle.
+
+Satu artefak adalah direktori::
+
+    models/<versi>/
+        model.pkl        estimator scikit-learn (pickle protokol 5)
+        metadata.json    skema fitur, kosakata kategori, kelas, hash data latih,
+                         versi scikit-learn, metrik dan SHA-256 model.pkl
+
+``models/CURRENT`` berisi nama versi yang dilayani secara default.
+"""
+
+import json
+import pickle
+import platform
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+
+from potensitol.data import FEATURES, ROOT, TARGET, file_digest
+
+MODELS_DIR = ROOT / "models"
+CURRENT_FILE = "CURRENT"
+MODEL_FILE = "model.pkl"
+METADATA_FILE = "metadata.json"
+FORMAT_VERSION = 1
+
+
+class ArtifactError(ValueError):
+    """Artefak rusak, tidak lengkap, atau tidak cocok dengan kontrak kolom."""
+
+
+def model_vocabularies(model):
+    """Kosakata kategori per kolom dari OneHotEncoder di dalam pipeline."""
+    prep = model.steps[0][1] if hasattr(model, "steps") else None
+    for _, transformer, columns in getattr(prep, "transformers_", []):
+        encoder = transformer.steps[-1][1] if hasattr(transformer, "steps") else transformer
+        if hasattr(encoder, "categories_"):
+            return {str(c): [str(v) for v in cats] for c, cats in zip(columns, encoder.categories_)}
+    return {}
+
+
+def _estimator_params(model):
+    estimator = model.steps[-1][1] if hasattr(model, "steps") else model
+    return {k: v for k, v in estimator.get_params().items() if isinstance(v, (bool, int, float, str, type(None)))}
+
+
+def save_artifact(model, version=None, models_dir=MODELS_DIR, training_data=None, metrics=None,
+                  source=None, make_current=True):
+    """Simpan ``model`` sebagai artefak baru dan kembalikan direktorinya."""
+    import sklearn
+
+    version = version or datetime.now(timezone.utc).strftime("rf-%Y%m%dT%H%M%SZ")
+    directory = Path(models_dir) / version
+    if directory.exists():
+        raise ArtifactError(f"Artefak {version} sudah ada")
+    directory.mkdir(parents=True)
+    with open(directory / MODEL_FILE, "wb") as f:
+        pickle.dump(model, f, protocol=5)
+
+    metadata = {
+        "format_version": FORMAT_VERSION,
+        "version": version,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "estimator": type(model.steps[-1][1] if hasattr(model, "steps") else model).__name__,
+        "features": FEATURES,
+        "target": TARGET,
+        "classes": [str(c) for c in model.classes_],
+        "vocabularies": model_vocabularies(model),
+        "params": _estimator_params(model),
+        "source": str(source) if source else None,
+        "training_data": {
+            "path": str(training_data) if training_data else None,
+            "sha256": file_digest(training_data) if training_data else None,
+        },
+        "metrics": metrics or {},
+        "sklearn_version": sklearn.__version__,
+        "python_version": platform.python_version(),
+        "model_sha256": file_digest(directory / MODEL_FILE),
+    }
+    (directory / METADATA_FILE).write_text(json.dumps(metadata, indent=2, ensure_ascii=False), encoding="utf-8")
+    if make_current:
+        set_current(version, models_dir)
+    return directory
+
+
+def read_metadata(directory):
+    path = Path(directory) / METADATA_FILE
+    if not path.exists():
+        raise ArtifactError(f"{path} tidak ditemukan")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def set_current(version, models_dir=MODELS_DIR):
+    if not (Path(models_dir) / version / METADATA_FILE).exists():
+        raise ArtifactError(f"Artefak {version} tidak ditemukan di {models_dir}")
+    (Path(models_dir) / CURRENT_FILE).write_text(version + "\n", encoding="utf-8")
+
+
+def current_artifact(models_dir=MODELS_DIR):
+    """Direktori artefak yang ditunjuk ``CURRENT``, atau ``None``."""
+    pointer = Path(models_dir) / CURRENT_FILE
+    if not pointer.exists():
+        return None
+    return Path(models_dir) / pointer.read_text(encoding="utf-8").strip()
+
+
+def list_artifacts(models_dir=MODELS_DIR):
+    models_dir = Path(models_dir)
+    if not models_dir.exists():
+        return []
+    return [read_metadata(d) for d in sorted(models_dir.iterdir()) if (d / METADATA_FILE).exists()]
+
+
+class Artifact:
+    """Artefak yang metadata-nya langsung dibaca dan estimatornya dimuat lazy.
+
+    Akses pertama ke :attr:`model` memverifikasi SHA-256 ``model.pkl``
+    (bila ``verify``) lalu memuatnya. Memory-map lewat joblib sengaja tidak
+    dipakai: ``Tree`` scikit-learn tetap menyalin array node saat unpickle,
+    dan untuk forest ini joblib ~7x lebih lambat daripada pickle biasa.
+    """
+
+    def __init__(self, directory, verify=True):
+        self.directory = Path(directory)
+        self.metadata = read_metadata(self.directory)
+        self.verify = verify
+        self._model = None
+        if self.metadata.get("format_version") != FORMAT_VERSION:
+            raise ArtifactError(f"Format artefak {self.metadata.get('format_version')} tidak didukung")
+        if self.metadata["features"] != FEATURES:
+            raise ArtifactError(f"Skema fitur artefak {self.metadata['features']} berbeda dari {FEATURES}")
+
+    @property
+    def version(self):
+        return self.metadata["version"]
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = self._load()
+        return self._model
+
+    def _load(self):
+        import sklearn
+
+        path = self.directory / MODEL_FILE
+        if self.verify and file_digest(path) != self.metadata["model_sha256"]:
+            raise ArtifactError(f"Checksum {path} tidak cocok dengan metadata")
+        if self.metadata["sklearn_version"] != sklearn.__version__:
+            warnings.warn(
+                f"Artefak {self.version} dibuat dengan scikit-learn {self.metadata['sklearn_version']}, "
+                f"terpasang {sklearn.__version__}",
+                stacklevel=3,
+            )
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+def import_pickle(pkl_path, version=None, models_dir=MODELS_DIR, training_data=None, make_current=True):
+    """Bungkus file ``.pkl`` lama menjadi artefak berversi."""
+    with open(pkl_path, "rb") as f:
+        model = pickle.load(f)
+    version = version or f"pkl-{file_digest(pkl_path)[:12]}"
+    return save_artifact(model, version, models_dir, training_data=training_data,
+                         source=pkl_path, make_current=make_current)
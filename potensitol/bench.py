@@ -0,0 +1,194 @@
+"""Benchmark inferensi, pemuatan data dan render halaman Streamlit.
+
+Setiap metrik adalah median waktu (detik) dari beberapa pengulangan::
+
+    python -m potensitol bench --output bench.json
+    python -m potensitol bench --baseline bench.json --threshold 0.25
+
+Dengan ``--baseline`` hasil dibandingkan dengan JSON sebelumnya, dan proses
+keluar dengan kode 1 bila ada metrik yang melambat lebih dari ambang
+relatif *dan* lebih dari ``min_seconds`` secara absolut, agar metrik mikro
+tidak gagal karena derau.
+"""
+
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from potensitol.data import DATASET_PATH, ROOT
+
+ROWS = (1, 100, 10_000, 1_000_000)
+REPEAT = 5
+# Batch sebesar ini cukup diukur sekali
+LARGE_ROWS = 100_000
+THRESHOLD = 0.25
+MIN_SECONDS = 0.005
+PAGES = ("0_Home.py", "pages/Prediksi.py", "pages/Analisis_Data.py")
+PAGE_TIMEOUT = 300
+
+
+def timeit(fn, repeat=REPEAT, warmup=True):
+    """Median durasi ``fn()`` dari ``repeat`` kali jalan.
+
+    Satu jalan pemanasan (impor modul, cache) tidak ikut diukur.
+    """
+    if warmup:
+        fn()
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def sample_frame(n, source=DATASET_PATH, seed=0):
+    """``n`` baris fitur yang diambil ulang (dengan pengembalian) dari dataset."""
+    from potensitol.train import training_frame
+
+    X, _ = training_frame(source)
+    idx = np.random.default_rng(seed).integers(0, len(X), n)
+    return X.iloc[idx].reset_index(drop=True)
+
+
+def bench_models(rows=ROWS, repeat=REPEAT, model_path=None):
+    """Waktu muat model dan ``predict_proba`` per ukuran batch, sklearn vs mesin."""
+    from potensitol.model import load_engine, load_model
+
+    metrics = {
+        "model_load_sklearn": timeit(lambda: load_model(model_path), repeat),
+        "model_load_engine": timeit(lambda: load_engine(model_path), repeat),
+    }
+    models = {"sklearn": load_model(model_path), "engine": load_engine(model_path)}
+    X = sample_frame(max(rows))
+    for n in rows:
+        batch = X.iloc[:n]
+        for name, model in models.items():
+            large = n >= LARGE_ROWS
+            metrics[f"predict_{n}_{name}"] = timeit(
+                lambda: model.predict_proba(batch), 1 if large else repeat, warmup=not large
+            )
+    return metrics
+
+
+def bench_data(source=DATASET_PATH, repeat=REPEAT):
+    """Waktu muat CSV, profil kualitas dan ringkasan streaming halaman analisis."""
+    from potensitol.data import load_dataset, read_table
+    from potensitol.quality import profile_dataset
+    from potensitol.stats import summarize_chunks
+
+    return {
+        "csv_load": timeit(lambda: load_dataset(source), repeat),
+        "csv_profile": timeit(lambda: profile_dataset(source), repeat),
+        "csv_streaming_summary": timeit(lambda: summarize_chunks(read_table(source, chunksize=200_000)), repeat),
+    }
+
+
+@contextmanager
+def temporary_store():
+    """Riwayat prediksi halaman diarahkan ke SQLite sementara, bukan ``prediksi.sqlite``."""
+    import streamlit as st
+
+    from potensitol.store import STORE_ENV
+
+    previous = os.environ.get(STORE_ENV)
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ[STORE_ENV] = str(Path(tmp) / "prediksi.sqlite")
+        # load_store() halaman di-cache per proses; buang agar path baru dipakai
+        st.cache_resource.clear()
+        try:
+            yield
+        finally:
+            st.cache_resource.clear()
+            if previous is None:
+                del os.environ[STORE_ENV]
+            else:
+                os.environ[STORE_ENV] = previous
+
+
+def _checked(app, page):
+    if app.exception:
+        raise RuntimeError(f"{page}: {app.exception[0].value}")
+    return app
+
+
+def bench_pages(pages=PAGES, repeat=REPEAT):
+    """Render headless setiap halaman lewat ``streamlit.testing``.
+
+    ``page_<nama>_render`` adalah render awal; untuk halaman dengan tombol,
+    ``page_<nama>_submit`` adalah render ulang setelah tombol pertama diklik.
+    Setiap render diperiksa bebas exception, dan prediksi yang disimpan
+    halaman masuk ke riwayat sementara (:func:`temporary_store`).
+    """
+    from streamlit.testing.v1 import AppTest
+
+    metrics = {}
+    with temporary_store():
+        for page in pages:
+            name = Path(page).stem.lower()
+            path = str(ROOT / page)
+            metrics[f"page_{name}_render"] = timeit(
+                lambda: _checked(AppTest.from_file(path, default_timeout=PAGE_TIMEOUT).run(), page), repeat
+            )
+            app = _checked(AppTest.from_file(path, default_timeout=PAGE_TIMEOUT).run(), page)
+            if app.button:
+                metrics[f"page_{name}_submit"] = timeit(lambda: _checked(app.button[0].click().run(), page), repeat)
+    return metrics
+
+
+def run_benchmarks(rows=ROWS, repeat=REPEAT, model_path=None, source=DATASET_PATH, pages=PAGES):
+    import sklearn
+
+    from potensitol.model import model_info
+
+    metrics = {}
+    metrics.update(bench_models(rows, repeat, model_path))
+    metrics.update(bench_data(source, repeat))
+    if pages:
+        metrics.update(bench_pages(pages, repeat))
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python_version": platform.python_version(),
+        "sklearn_version": sklearn.__version__,
+        "numpy_version": np.__version__,
+        "machine": platform.machine(),
+        "model": model_info(model_path),
+        "repeat": repeat,
+        "metrics": {k: round(v, 6) for k, v in metrics.items()},
+    }
+
+
+def compare(result, baseline, threshold=THRESHOLD, thresholds=None, min_seconds=MIN_SECONDS):
+    """Metrik yang melambat melewati ambang dibanding ``baseline``.
+
+    ``thresholds`` memetakan nama metrik ke ambang relatif khusus.
+    """
+    thresholds = thresholds or {}
+    regressions = []
+    for name, current in result["metrics"].items():
+        before = baseline["metrics"].get(name)
+        if not before:
+            continue
+        limit = thresholds.get(name, threshold)
+        if current > before * (1 + limit) and current - before > min_seconds:
+            regressions.append({
+                "metric": name, "baseline": before, "current": current,
+                "ratio": round(current / before, 3), "threshold": limit,
+            })
+    return regressions
+
+
+def load_result(path):
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def write_result(result, path):
+    Path(path).write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
@@ -0,0 +1,87 @@
+"""Cache hasil prediksi satuan (LRU) yang dipakai bersama dalam satu proses.
+
+Kunci cache adalah lima fitur yang dinormalisasi: kategori sebagai string
+apa adanya (model membedakan "Kebun" dan " Kebun") dan Luas di-cast ke
+float32, presisi yang dibandingkan forest. Dua masukan dengan kunci sama
+karenanya selalu menghasilkan prediksi yang sama. Cache dikosongkan
+otomatis begitu SHA-256 model yang dilayani berubah.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from potensitol.data import CATEGORICAL, FEATURES, NUMERIC
+
+CACHE_SIZE = 4096
+
+
+def cache_key(record):
+    return tuple(str(record[c]) for c in CATEGORICAL) + tuple(float(np.float32(record[c])) for c in NUMERIC)
+
+
+class PredictionCache:
+    """LRU ``kunci fitur → baris probabilitas`` dengan penghitung hit/miss."""
+
+    def __init__(self, maxsize=CACHE_SIZE):
+        self.maxsize = maxsize
+        self.model_sha256 = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _check_model(self, model_sha256):
+        if model_sha256 != self.model_sha256:
+            if self.model_sha256 is not None:
+                self.invalidations += 1
+            self._entries.clear()
+            self.model_sha256 = model_sha256
+
+    def predict_proba(self, model, record, model_sha256):
+        """Probabilitas kelas ``record`` dari cache atau dari ``model``."""
+        key = cache_key(record)
+        with self._lock:
+            self._check_model(model_sha256)
+            proba = self._entries.get(key)
+            if proba is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return proba
+            self.misses += 1
+
+        proba = model.predict_proba(pd.DataFrame([record], columns=FEATURES))[0]
+        proba.setflags(write=False)
+        with self._lock:
+            if model_sha256 == self.model_sha256:
+                self._entries[key] = proba
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return proba
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+PREDICTION_CACHE = PredictionCache()
@@ -0,0 +1,219 @@
+"""Statistik plot Luas yang dihitung di server dan figure Plotly ringkas.
+
+Histogram, statistik boxplot dan densitas violin dihitung dengan NumPy,
+lalu dikirim ke browser sebagai trace berukuran tetap (jumlah bin, titik
+grid dan sampel outlier terbatas), bukan sebagai seluruh baris data.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+from potensitol.trace import traced
+
+COLOR = "#1E3A8A"
+HIST_BINS = 30
+KDE_BINS = 512
+KDE_POINTS = 200
+MAX_OUTLIERS = 500
+
+
+def box_stats(values, max_outliers=MAX_OUTLIERS, seed=0):
+    """Kuartil, fence 1,5×IQR dan sampel outlier (maks. ``max_outliers``)."""
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    low, high = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+    inside = values[(values >= low) & (values <= high)]
+    outliers = values[(values < low) | (values > high)]
+    n_outliers = len(outliers)
+    if n_outliers > max_outliers:
+        outliers = np.random.default_rng(seed).choice(outliers, max_outliers, replace=False)
+    return {
+        "q1": q1, "median": median, "q3": q3, "mean": values.mean(),
+        "lowerfence": inside.min(), "upperfence": inside.max(),
+        "min": values.min(), "max": values.max(),
+        "outliers": outliers, "n_outliers": n_outliers,
+    }
+
+
+def box_stats_from_summary(summary):
+    """Statistik boxplot dari :class:`~potensitol.stats.NumericSummary`.
+
+    Mode streaming tidak menyimpan nilai mentah, jadi fence diambil dari
+    bucket sketsa dan outlier hanya dihitung jumlahnya.
+    """
+    q1, median, q3 = summary.quantiles()
+    iqr = q3 - q1
+    values, counts = summary.sketch.buckets()
+    inside = (values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)
+    return {
+        "q1": q1, "median": median, "q3": q3, "mean": summary.mean,
+        "lowerfence": max(values[inside].min(), summary.min), "upperfence": min(values[inside].max(), summary.max),
+        "min": summary.min, "max": summary.max,
+        "outliers": np.array([]), "n_outliers": int(counts[~inside].sum()),
+    }
+
+
+def silverman_bandwidth(n, std, iqr):
+    spread = min(std, iqr / 1.34) if iqr > 0 else std
+    return 0.9 * spread * n ** -0.2 if n > 1 and spread > 0 else 1.0
+
+
+def binned_kde(counts, edges, bandwidth, points=KDE_POINTS):
+    """KDE Gaussian dari histogram halus (biaya tetap, tidak tergantung n).
+
+    Grid diperluas 3 bandwidth di kedua sisi dan densitas dinormalisasi
+    sehingga luasnya 1.
+    """
+    counts = np.asarray(counts, dtype=float)
+    width = edges[1] - edges[0]
+    if width <= 0 or counts.sum() == 0:
+        return np.array([edges[0]]), np.array([1.0])
+    sigma = max(bandwidth / width, 1e-6)
+    pad = int(np.ceil(3 * sigma))
+    padded = np.pad(counts, pad)
+    offsets = np.arange(-pad, pad + 1)
+    kernel = np.exp(-0.5 * (offsets / sigma) ** 2)
+    smooth = np.convolve(padded, kernel / kernel.sum(), mode="same")
+    centers = edges[0] + (np.arange(len(padded)) - pad + 0.5) * width
+    grid = np.linspace(centers[0], centers[-1], points)
+    density = np.interp(grid, centers, smooth)
+    return grid, density / (density.sum() * (grid[1] - grid[0]))
+
+
+def kde_from_values(values, bins=KDE_BINS, points=KDE_POINTS):
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    q1, q3 = np.percentile(values, [25, 75])
+    counts, edges = np.histogram(values, bins=bins)
+    return binned_kde(counts, edges, silverman_bandwidth(len(values), values.std(ddof=1), q3 - q1), points)
+
+
+def kde_from_summary(summary, bins=KDE_BINS, points=KDE_POINTS):
+    q1, _, q3 = summary.quantiles()
+    counts, edges = summary.histogram(bins=bins)
+    return binned_kde(counts, edges, silverman_bandwidth(summary.count, summary.std, q3 - q1), points)
+
+
+def _precomputed_box(stats, name, **kwargs):
+    return go.Box(
+        name=name, q1=[stats["q1"]], median=[stats["median"]], q3=[stats["q3"]],
+        lowerfence=[stats["lowerfence"]], upperfence=[stats["upperfence"]], mean=[stats["mean"]],
+        marker_color=COLOR, boxpoints=False, **kwargs,
+    )
+
+
+def _outlier_trace(stats, x):
+    return go.Scatter(
+        x=np.full(len(stats["outliers"]), x), y=stats["outliers"], mode="markers",
+        marker=dict(color=COLOR, size=4, opacity=0.6),
+        name=f"Outlier ({len(stats['outliers']):,} dari {stats['n_outliers']:,})",
+    )
+
+
+@traced("figure.histogram")
+def histogram_figure(counts, edges, title, xaxis_title):
+    """Histogram ter-normalisasi densitas dari bin yang sudah dihitung."""
+    counts = np.asarray(counts, dtype=float)
+    widths = np.diff(edges)
+    total = counts.sum()
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2, y=counts / (total * widths) if total else counts, width=widths,
+        marker_color=COLOR, opacity=0.7, name="Histogram",
+    ))
+    fig.update_layout(title=title, xaxis_title=xaxis_title, yaxis_title="Density", bargap=0)
+    return fig
+
+
+@traced("figure.box")
+def box_figure(stats, title, name):
+    fig = go.Figure(_precomputed_box(stats, name))
+    if len(stats["outliers"]):
+        fig.add_trace(_outlier_trace(stats, name))
+    fig.update_layout(title=title, yaxis_title=name, showlegend=False)
+    return fig
+
+
+@traced("figure.violin")
+def violin_figure(grid, density, stats, title, name):
+    """Violin dari densitas KDE yang dicerminkan, dengan box di dalamnya."""
+    half = 0.4 * density / density.max()
+    fig = go.Figure(go.Scatter(
+        x=np.concatenate([-half, half[::-1]]), y=np.concatenate([grid, grid[::-1]]),
+        fill="toself", mode="lines", line=dict(color=COLOR), fillcolor="rgba(30, 58, 138, 0.4)", name=name,
+    ))
+    fig.add_trace(_precomputed_box(stats, name, x=[0], width=0.08))
+    if len(stats["outliers"]):
+        fig.add_trace(_outlier_trace(stats, 0))
+    fig.update_layout(title=title, yaxis_title=name, showlegend=False, xaxis=dict(visible=False))
+    return fig
+
+
+@traced("figure.contribution")
+def contribution_figure(frame, title):
+    """Bar horizontal kontribusi fitur (positif biru, negatif merah)."""
+    frame = frame.iloc[::-1]
+    fig = go.Figure(go.Bar(
+        x=frame["Kontribusi"], y=frame["Fitur"], orientation="h",
+        marker_color=np.where(frame["Kontribusi"] >= 0, COLOR, "#B80000"),
+        text=[f"{v:+.1%}" for v in frame["Kontribusi"]], textposition="auto",
+        hovertext=[str(v) for v in frame["Nilai"]],
+    ))
+    fig.update_layout(title=title, xaxis_title="Kontribusi terhadap probabilitas", xaxis_tickformat=".0%")
+    return fig
+
+
+@traced("figure.importance")
+def importance_figure(importance, title):
+    """Bar bertumpuk rata-rata |kontribusi| per fitur, satu warna per kelas."""
+    order = importance.sum(axis=1).sort_values().index
+    fig = go.Figure([
+        go.Bar(x=importance.loc[order, kelas], y=order, orientation="h", name=str(kelas))
+        for kelas in importance.columns
+    ])
+    fig.update_layout(title=title, barmode="stack", xaxis_title="Rata-rata |kontribusi|", legend_title="Kelas")
+    return fig
+
+
+@traced("figure.confusion_matrix")
+def confusion_matrix_figure(matrix, classes, title):
+    """Heatmap confusion matrix; sel diberi jumlah dan persentase per baris (recall)."""
+    matrix = np.asarray(matrix)
+    row_share = matrix / np.maximum(matrix.sum(axis=1, keepdims=True), 1)
+    fig = go.Figure(go.Heatmap(
+        z=row_share, x=classes, y=classes, colorscale="Blues", zmin=0, zmax=1,
+        text=[[f"{n:,}<br>{p:.0%}" for n, p in zip(row_n, row_p)] for row_n, row_p in zip(matrix, row_share)],
+        texttemplate="%{text}", colorbar=dict(title="Proporsi", tickformat=".0%"),
+    ))
+    fig.update_layout(title=title, xaxis_title="Prediksi", yaxis_title="Aktual", yaxis_autorange="reversed")
+    return fig
+
+
+@traced("figure.roc")
+def roc_figure(roc, title):
+    """Kurva ROC one-vs-rest per kelas beserta AUC."""
+    fig = go.Figure([
+        go.Scatter(x=curve["fpr"], y=curve["tpr"], mode="lines", name=f"{kelas} (AUC {curve['auc']:.3f})")
+        for kelas, curve in roc.items()
+    ])
+    fig.add_trace(go.Scatter(x=[0, 1], y=[0, 1], mode="lines", line=dict(dash="dash", color="grey"),
+                             showlegend=False))
+    fig.update_layout(title=title, xaxis_title="False positive rate", yaxis_title="True positive rate")
+    return fig
+
+
+@traced("figure.learning_curve")
+def learning_curve_figure(curve, title):
+    """Akurasi latih dan validasi terhadap jumlah data latih, dengan pita ±1 std."""
+    fig = go.Figure()
+    x = curve["Jumlah data latih"]
+    for kolom, warna in (("Akurasi latih", COLOR), ("Akurasi validasi", "#B80000")):
+        mean, std = curve[kolom], curve[f"{kolom} (std)"]
+        fig.add_trace(go.Scatter(
+            x=np.concatenate([x, x[::-1]]), y=np.concatenate([mean + std, (mean - std)[::-1]]),
+            fill="toself", line=dict(width=0), fillcolor=warna, opacity=0.15, showlegend=False, hoverinfo="skip",
+        ))
+        fig.add_trace(go.Scatter(x=x, y=mean, mode="lines+markers", line=dict(color=warna), name=kolom))
+    fig.update_layout(title=title, xaxis_title="Jumlah data latih", yaxis_title="Akurasi", yaxis_tickformat=".0%")
+    return fig
@@ -0,0 +1,123 @@
+"""Kontrak kolom dataset IP4T dan utilitas baca/tulis file."""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from potensitol.trace import span, traced
+
+ROOT = Path(__file__).resolve().parent.parent
+DATASET_PATH = ROOT / "dataset20052025(3).csv"
+
+CATEGORICAL = ["PENGUASAAN TANAH", "PEMILIKAN TANAH", "PENGGUNAAN TANAH", "PEMANFAATAN TANAH"]
+NUMERIC = ["Luas  m2"]
+FEATURES = CATEGORICAL + NUMERIC
+TARGET = "POTENSI TOL"
+
+ID = "NO"
+CATEGORY_DTYPES = {c: "category" for c in CATEGORICAL + [TARGET]}
+
+PREDICTION = "PREDIKSI POTENSI TOL"
+PROBABILITY = "PROBABILITAS"
+MARGIN = "MARGIN"
+CONFIDENCE = "KEYAKINAN"
+VALIDATION = "GALAT VALIDASI"
+
+
+def rank_columns(rank):
+    """Nama kolom (kelas, probabilitas) untuk peringkat ke-``rank`` (mulai 1)."""
+    if rank == 1:
+        return PREDICTION, PROBABILITY
+    return f"PREDIKSI #{rank}", f"PROBABILITAS #{rank}"
+
+
+def parcel_id(value):
+    """NO parsel sebagai teks: ``1234.0`` → ``"1234"``, kosong → ``None``."""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    text = str(value).strip()
+    return text or None
+
+
+def _is_excel(source):
+    return str(getattr(source, "name", source)).lower().endswith((".xlsx", ".xls"))
+
+
+def sniff_sep(source):
+    """Tebak pemisah CSV dari baris header (file BPN memakai ";")."""
+    if hasattr(source, "getvalue"):
+        header = source.getvalue().split(b"\n", 1)[0]
+    else:
+        with open(source, "rb") as f:
+            header = f.readline()
+    return ";" if header.count(b";") >= header.count(b",") else ","
+
+
+def read_table(source, chunksize=None, dtype=None):
+    """Baca CSV/XLSX dari path atau file upload Streamlit.
+
+    Dengan ``chunksize`` file CSV dikembalikan sebagai iterator DataFrame
+    sehingga file besar tidak perlu dimuat sekaligus. ``dtype`` diteruskan
+    ke pandas; tanpa itu tipe kolom ditebak per chunk.
+    """
+    if _is_excel(source):
+        with span("csv.parse"):
+            df = pd.read_excel(source, dtype=dtype)
+        return iter([df]) if chunksize else df
+    if chunksize:
+        return pd.read_csv(source, sep=sniff_sep(source), chunksize=chunksize, dtype=dtype)
+    with span("csv.parse"):
+        return pd.read_csv(source, sep=sniff_sep(source), dtype=dtype)
+
+
+def write_csv(df, target, chunk_size=50_000, header=True):
+    """Tulis DataFrame ke CSV ";" per potongan baris."""
+    for start in range(0, len(df), chunk_size):
+        df.iloc[start:start + chunk_size].to_csv(
+            target, sep=";", index=False, header=header and start == 0
+        )
+
+
+def file_digest(source):
+    """SHA-256 isi file (path atau file upload), dipakai sebagai kunci cache."""
+    if hasattr(source, "getvalue"):
+        return hashlib.sha256(source.getvalue()).hexdigest()
+    h = hashlib.sha256()
+    with open(source, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def load_dataset(source=DATASET_PATH):
+    """Baca dataset IP4T sebagai frame bertipe dan ringkas.
+
+    Lima kolom kategorik (termasuk target) langsung dibaca sebagai
+    ``category``, Luas sebagai numerik, dan baris kosong (";;;;;;") dibuang.
+    """
+    with span("csv.parse"):
+        if _is_excel(source):
+            df = pd.read_excel(source)
+            df = df.astype({c: t for c, t in CATEGORY_DTYPES.items() if c in df.columns})
+        else:
+            df = pd.read_csv(source, sep=sniff_sep(source), dtype=CATEGORY_DTYPES)
+    return tidy_frame(df)
+
+
+@traced("data.clean")
+def tidy_frame(df):
+    """Buang baris kosong, jadikan Luas numerik dan NO integer, rapikan kategori."""
+    df = df.dropna(how="all").reset_index(drop=True)
+    for col in NUMERIC:
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    if ID in df.columns and df[ID].notna().all():
+        df[ID] = pd.to_numeric(df[ID], downcast="integer")
+    for col in CATEGORY_DTYPES:
+        if col in df.columns:
+            df[col] = df[col].cat.remove_unused_categories()
+    return df
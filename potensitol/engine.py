@@ -0,0 +1,225 @@
+"""Mesin inferensi Random Forest berbasis array NumPy datar.
+
+:func:`compile_forest` mengekspor pipeline scikit-learn (OneHotEncoder +
+RandomForestClassifier) menjadi array node kontigu untuk seluruh pohon.
+:class:`CompiledForest` lalu melakukan encoding dan traversal secara
+tervektorisasi tanpa dispatch estimator/pipeline scikit-learn, dengan hasil
+``predict_proba`` identik bit demi bit:
+
+* fitur di-cast ke float32 seperti ``Tree`` scikit-learn sebelum dibandingkan
+  dengan threshold float64;
+* distribusi kelas daun dinormalisasi per daun seperti
+  ``DecisionTreeClassifier.predict_proba``;
+* probabilitas dijumlahkan per pohon secara berurutan lalu dibagi jumlah
+  pohon, sama dengan ``ForestClassifier.predict_proba``.
+
+Karena antarmukanya (``classes_``, ``predict``, ``predict_proba``) sama,
+objek ini bisa dipakai di mana pun model scikit-learn dipakai.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from potensitol.artifact import model_vocabularies
+from potensitol.data import CATEGORICAL, FEATURES, NUMERIC
+
+ROW_CHUNK = 1024
+SMALL_FRAME = 16
+ENGINE_DIR = "engine"
+ARRAYS = ("feature", "threshold", "left", "right", "value", "roots")
+
+
+class CompiledForest:
+    """Forest datar: ``feature``/``threshold``/``left``/``right`` per node
+    (indeks global lintas pohon, daun bertanda ``left == -1``), ``value``
+    berisi distribusi kelas daun yang sudah dinormalisasi, ``roots`` indeks
+    node akar tiap pohon."""
+
+    def __init__(self, feature, threshold, left, right, value, roots, classes, vocabularies, max_depth,
+                 model_sha256=None):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.classes_ = np.asarray(classes, dtype=object)
+        self.vocabularies = vocabularies
+        self.max_depth = int(max_depth)
+        # Checksum model sumber, agar ekspor basi bisa dikenali saat dimuat
+        self.model_sha256 = model_sha256
+        self._lookup = {c: {v: i for i, v in enumerate(vocab)} for c, vocab in vocabularies.items()}
+        offsets = np.cumsum([0] + [len(vocabularies[c]) for c in CATEGORICAL])
+        self._offsets = dict(zip(CATEGORICAL, offsets[:-1].tolist()))
+        self.n_features = int(offsets[-1]) + len(NUMERIC)
+        # Untuk traversal, daun menunjuk ke dirinya sendiri sehingga setiap
+        # baris cukup melangkah max_depth kali tanpa cabang khusus daun.
+        # Anak disusun [kanan, kiri] per node: anak = _child[2 * node + ke_kiri].
+        # Indeks disimpan sebagai intp agar fancy indexing tidak menyalin.
+        is_leaf = np.asarray(left) < 0
+        own = np.arange(len(is_leaf), dtype=np.intp)
+        self._child = np.stack([np.where(is_leaf, own, right), np.where(is_leaf, own, left)], axis=1).astype(np.intp).ravel()
+        self._feature = np.asarray(feature, dtype=np.intp)
+        self._roots = np.asarray(roots, dtype=np.intp)
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    def encode(self, X):
+        """DataFrame/record → matriks float32 setara keluaran ColumnTransformer.
+
+        Kategori yang tidak dikenal menjadi semua-nol, sama dengan
+        ``OneHotEncoder(handle_unknown="ignore")``.
+        """
+        if isinstance(X, dict):
+            X = [X]
+        if not isinstance(X, pd.DataFrame):
+            return self._encode_records(X)
+        if len(X) <= SMALL_FRAME:
+            return self._encode_records(X[FEATURES].to_dict("records"))
+        n = len(X)
+        out = np.zeros((n, self.n_features), dtype=np.float32)
+        rows = np.arange(n)
+        for col in CATEGORICAL:
+            codes = pd.Categorical(X[col], categories=self.vocabularies[col]).codes
+            known = codes >= 0
+            out[rows[known], self._offsets[col] + codes[known]] = 1.0
+        for i, col in enumerate(NUMERIC):
+            out[:, self.n_features - len(NUMERIC) + i] = X[col].to_numpy(dtype=np.float64)
+        return out
+
+    def _encode_records(self, records):
+        # Jalur cepat tanpa pandas untuk satu atau beberapa record dict
+        out = np.zeros((len(records), self.n_features), dtype=np.float32)
+        for r, record in enumerate(records):
+            for col in CATEGORICAL:
+                code = self._lookup[col].get(record[col])
+                if code is not None:
+                    out[r, self._offsets[col] + code] = 1.0
+            for i, col in enumerate(NUMERIC):
+                out[r, self.n_features - len(NUMERIC) + i] = float(record[col])
+        return out
+
+    def apply(self, Xe):
+        """Indeks daun global, bentuk ``(n_trees, n_rows)``."""
+        n = len(Xe)
+        flat = np.ascontiguousarray(Xe).ravel()
+        base = (np.arange(n, dtype=np.intp) * self.n_features)[None, :]
+        node = np.repeat(self._roots[:, None], n, axis=1)
+        for _ in range(self.max_depth):
+            go_left = flat[base + self._feature[node]] <= self.threshold[node]
+            node = self._child[2 * node + go_left]
+        return node
+
+    def predict_proba_encoded(self, Xe):
+        proba = np.empty((len(Xe), len(self.classes_)))
+        for start in range(0, len(Xe), ROW_CHUNK):
+            leaves = self.apply(Xe[start:start + ROW_CHUNK])
+            # Reduksi pada sumbu terluar dijumlahkan berurutan per pohon,
+            # sama seperti akumulasi ForestClassifier.predict_proba
+            acc = self.value[leaves].sum(axis=0)
+            acc /= self.n_trees
+            proba[start:start + ROW_CHUNK] = acc
+        return proba
+
+    def predict_proba(self, X):
+        return self.predict_proba_encoded(self.encode(X))
+
+    def contributions_encoded(self, Xe):
+        """Kontribusi jalur pohon (Saabas) per fitur ter-encode.
+
+        Setiap split menyumbangkan ``value[anak] - value[node]`` ke fitur
+        yang dipakai split itu, dirata-rata atas pohon. Mengembalikan
+        ``(bias (n_classes,), kontribusi (n_rows, n_features, n_classes))``
+        dengan ``bias + kontribusi.sum(axis=1)`` sama dengan
+        ``predict_proba_encoded`` (hingga pembulatan floating point).
+        """
+        n_classes = self.value.shape[1]
+        bias = self.value[self._roots].mean(axis=0)
+        out = np.zeros((len(Xe), self.n_features, n_classes))
+        for start in range(0, len(Xe), ROW_CHUNK):
+            chunk = Xe[start:start + ROW_CHUNK]
+            n = len(chunk)
+            flat = np.ascontiguousarray(chunk).ravel()
+            rows = np.arange(n, dtype=np.intp)[None, :]
+            node = np.repeat(self._roots[:, None], n, axis=1)
+            acc = np.zeros((n * self.n_features, n_classes))
+            for _ in range(self.max_depth):
+                feature = self._feature[node]
+                child = self._child[2 * node + (flat[rows * self.n_features + feature] <= self.threshold[node])]
+                # Daun menunjuk ke dirinya sendiri sehingga selisihnya nol
+                delta = self.value[child] - self.value[node]
+                slot = (rows * self.n_features + feature).ravel()
+                for c in range(n_classes):
+                    acc[:, c] += np.bincount(slot, weights=delta[:, :, c].ravel(), minlength=n * self.n_features)
+                node = child
+            out[start:start + n] = acc.reshape(n, self.n_features, n_classes) / self.n_trees
+        return bias, out
+
+    def predict(self, X):
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+    def save(self, directory):
+        """Simpan sebagai file ``.npy`` terpisah agar bisa di-memory-map."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in ARRAYS:
+            np.save(directory / f"{name}.npy", getattr(self, name))
+        meta = {"classes": self.classes_.tolist(), "vocabularies": self.vocabularies, "max_depth": self.max_depth,
+                "model_sha256": self.model_sha256}
+        (directory / "engine.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+        return directory
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        directory = Path(directory)
+        meta = json.loads((directory / "engine.json").read_text(encoding="utf-8"))
+        arrays = {name: np.load(directory / f"{name}.npy", mmap_mode="r" if mmap else None) for name in ARRAYS}
+        return cls(**arrays, classes=meta["classes"], vocabularies=meta["vocabularies"], max_depth=meta["max_depth"],
+                   model_sha256=meta.get("model_sha256"))
+
+
+def compile_forest(model, model_sha256=None):
+    """Ratakan pipeline OneHotEncoder + RandomForestClassifier ke :class:`CompiledForest`."""
+    if not hasattr(model, "steps"):
+        raise ValueError("Model harus berupa Pipeline (preprocessing + forest)")
+    forest = model.steps[-1][1]
+    vocabularies = model_vocabularies(model)
+    if list(vocabularies) != CATEGORICAL or not hasattr(forest, "estimators_"):
+        raise ValueError("Struktur pipeline tidak didukung oleh mesin terkompilasi")
+    n_features = sum(len(v) for v in vocabularies.values()) + len(NUMERIC)
+    if forest.n_features_in_ != n_features:
+        raise ValueError(f"Forest memakai {forest.n_features_in_} fitur, encoder menghasilkan {n_features}")
+
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset = 0
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        is_leaf = tree.children_left == -1
+        roots.append(offset)
+        features.append(np.where(is_leaf, 0, tree.feature))
+        thresholds.append(tree.threshold)
+        lefts.append(np.where(is_leaf, -1, tree.children_left + offset))
+        rights.append(np.where(is_leaf, -1, tree.children_right + offset))
+        value = tree.value[:, 0, :].astype(np.float64)
+        normalizer = value.sum(axis=1, keepdims=True)
+        normalizer[normalizer == 0.0] = 1.0
+        values.append(value / normalizer)
+        offset += tree.node_count
+
+    return CompiledForest(
+        feature=np.concatenate(features).astype(np.int32),
+        threshold=np.concatenate(thresholds).astype(np.float64),
+        left=np.concatenate(lefts).astype(np.int32),
+        right=np.concatenate(rights).astype(np.int32),
+        value=np.ascontiguousarray(np.concatenate(values)),
+        roots=np.asarray(roots, dtype=np.int32),
+        classes=[str(c) for c in model.classes_],
+        vocabularies=vocabularies,
+        max_depth=max(e.tree_.max_depth for e in forest.estimators_),
+        model_sha256=model_sha256,
+    )
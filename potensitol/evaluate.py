@@ -0,0 +1,74 @@
+"""Evaluasi model dengan cross-validation paralel.
+
+Estimator yang dilayani di-clone (hyperparameter sama, belum dilatih) lalu
+dievaluasi dengan stratified k-fold pada dataset: prediksi out-of-fold
+dipakai untuk confusion matrix, precision/recall per kelas dan kurva ROC
+one-vs-rest, ditambah learning curve. Semua fold dijalankan paralel lewat
+``n_jobs`` scikit-learn (joblib). Hasilnya berupa array/DataFrame biasa
+sehingga bisa di-cache per (hash model, hash dataset).
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from potensitol.trace import traced
+from potensitol.train import CV_FOLDS, RANDOM_STATE, split_xy
+
+LEARNING_CURVE_SIZES = (0.1, 0.25, 0.5, 0.75, 1.0)
+
+
+@traced("model.evaluate")
+def evaluate(model, df, cv=CV_FOLDS, n_jobs=-1, random_state=RANDOM_STATE, train_sizes=LEARNING_CURVE_SIZES):
+    """Metrik cross-validation ``model`` (pipeline scikit-learn) pada ``df``."""
+    from sklearn.base import clone
+    from sklearn.metrics import auc, confusion_matrix, precision_recall_fscore_support, roc_curve
+    from sklearn.model_selection import StratifiedKFold, cross_val_predict, learning_curve
+
+    start = time.perf_counter()
+    X, y = split_xy(df)
+    # Urutan kolom predict_proba hasil cross_val_predict = label y terurut
+    classes = [str(c) for c in np.unique(y)]
+    folds = StratifiedKFold(n_splits=cv, shuffle=True, random_state=random_state)
+    estimator = clone(model)
+
+    proba = cross_val_predict(estimator, X, y, cv=folds, n_jobs=n_jobs, method="predict_proba")
+    predicted = np.asarray(classes, dtype=object)[proba.argmax(axis=1)]
+
+    matrix = confusion_matrix(y, predicted, labels=classes)
+    precision, recall, f1, support = precision_recall_fscore_support(
+        y, predicted, labels=classes, zero_division=0
+    )
+    per_class = pd.DataFrame(
+        {"Precision": precision, "Recall": recall, "F1": f1, "Jumlah": support}, index=classes
+    ).rename_axis("Kelas")
+
+    roc = {}
+    for k, kelas in enumerate(classes):
+        fpr, tpr, _ = roc_curve(y == kelas, proba[:, k])
+        roc[kelas] = {"fpr": fpr, "tpr": tpr, "auc": float(auc(fpr, tpr))}
+
+    sizes, train_scores, test_scores = learning_curve(
+        estimator, X, y, cv=folds, n_jobs=n_jobs, train_sizes=list(train_sizes), shuffle=True,
+        random_state=random_state,
+    )
+    curve = pd.DataFrame({
+        "Jumlah data latih": sizes,
+        "Akurasi latih": train_scores.mean(axis=1),
+        "Akurasi latih (std)": train_scores.std(axis=1),
+        "Akurasi validasi": test_scores.mean(axis=1),
+        "Akurasi validasi (std)": test_scores.std(axis=1),
+    })
+
+    return {
+        "classes": classes,
+        "rows": len(X),
+        "cv_folds": cv,
+        "accuracy": float((predicted == y.to_numpy()).mean()),
+        "confusion_matrix": matrix,
+        "per_class": per_class,
+        "roc": roc,
+        "learning_curve": curve,
+        "seconds": time.perf_counter() - start,
+    }
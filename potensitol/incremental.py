@@ -0,0 +1,152 @@
+"""Skoring ulang inkremental: hanya parsel baru atau berubah yang diprediksi.
+
+Setiap baris diberi sidik jari (hash 64-bit) dari lima fitur masukan dan
+dikunci dengan kolom ``NO``. Hasil skoring sebelumnya disimpan per versi
+model sebagai Arrow IPC (``scores/<versi>.arrow`` di root repo, tidak
+bergantung pada nama file masukan sehingga ekspor bulanan yang berganti nama
+tetap memakai simpanan yang sama); pada pembaruan bulanan hanya baris yang
+NO-nya baru atau sidik jarinya berubah yang dikirim ke model, sisanya
+diambil dari simpanan::
+
+    python -m potensitol rescore dataset.csv hasil.csv --diff perubahan.csv
+
+Simpanan yang dibuat dengan model lain (checksum berbeda) diabaikan
+sehingga semua baris diskor ulang. Dataset yang berbeda (mis. wilayah lain)
+sebaiknya memakai ``--store-dir`` masing-masing.
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from potensitol.data import FEATURES, ID, NUMERIC, PREDICTION, ROOT, parcel_id
+from potensitol.model import CHUNK_SIZE, predict_frame
+from potensitol.trace import traced
+
+STORE_DIR = ROOT / "scores"
+FINGERPRINT = "SIDIK JARI"
+PREVIOUS = "PREDIKSI LAMA"
+STATUS = "STATUS"
+MODEL_KEY = b"potensitol.model_sha256"
+
+
+def store_path(version, store_dir=None):
+    """Lokasi simpanan hasil: ``<store_dir>/<versi>.arrow`` (default :data:`STORE_DIR`)."""
+    return Path(store_dir or STORE_DIR) / f"{version}.arrow"
+
+
+def fingerprint(df):
+    """Hash uint64 per baris dari lima fitur, tidak peka tipe kolom hasil baca.
+
+    Label kategori dibandingkan setelah dibuang spasi tepinya dan Luas
+    sebagai float, sehingga ``181`` dan ``181.0`` atau kolom ``category``
+    dan ``object`` menghasilkan sidik jari yang sama.
+    """
+    columns = {}
+    for col in FEATURES:
+        values = df[col] if col in df.columns else pd.Series(np.nan, index=df.index)
+        if col in NUMERIC:
+            columns[col] = pd.to_numeric(values, errors="coerce").astype("float64")
+        else:
+            columns[col] = values.astype("string").str.strip()
+    return pd.util.hash_pandas_object(pd.DataFrame(columns), index=False).to_numpy()
+
+
+def load_store(path, model_sha256):
+    """Frame simpanan sebelumnya; ``None`` bila tidak ada atau dari model lain."""
+    import pyarrow as pa
+
+    path = Path(path)
+    if not path.exists():
+        return None
+    with pa.memory_map(str(path), "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    if (table.schema.metadata or {}).get(MODEL_KEY, b"").decode() != model_sha256:
+        return None
+    return table.to_pandas()
+
+
+def save_store(frame, path, model_sha256):
+    """Tulis simpanan secara atomik (file sementara lalu ``os.replace``)."""
+    import pyarrow as pa
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), MODEL_KEY: model_sha256.encode()})
+    tmp = path.with_suffix(".tmp")
+    with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp, path)
+
+
+def class_diff(previous, current):
+    """Parsel yang kelas prediksinya berubah, baru, atau hilang dari file.
+
+    ``previous`` dan ``current`` berisi kolom ``NO`` dan kelas prediksi.
+    """
+    merged = pd.merge(
+        previous[[ID, PREDICTION]].rename(columns={PREDICTION: PREVIOUS}),
+        current[[ID, PREDICTION]],
+        on=ID, how="outer", indicator=True,
+    )
+    merged[STATUS] = merged["_merge"].map({"left_only": "dihapus", "right_only": "baru", "both": "berubah"})
+    before, after = merged[PREVIOUS].astype(object), merged[PREDICTION].astype(object)
+    same = before.eq(after) | (before.isna() & after.isna())
+    keep = (merged[STATUS] != "berubah") | ~same
+    return merged.loc[keep, [ID, PREVIOUS, PREDICTION, STATUS]].astype({STATUS: object}).reset_index(drop=True)
+
+
+@traced("model.rescore")
+def rescore_frame(model, df, previous=None, chunk_size=CHUNK_SIZE):
+    """Skor ``df`` dengan memakai ulang hasil ``previous`` untuk baris yang tidak berubah.
+
+    Mengembalikan ``(hasil, simpanan_baru, diff, ringkasan)``: ``hasil`` sama
+    dengan :func:`~potensitol.model.predict_frame` atas seluruh ``df``,
+    ``simpanan_baru`` untuk :func:`save_store`, ``diff`` dari
+    :func:`class_diff` dan ``ringkasan`` berisi jumlah baris per kategori.
+    """
+    df = df.dropna(how="all").reset_index(drop=True)
+    if ID not in df.columns:
+        raise ValueError(f"Kolom '{ID}' wajib ada untuk skoring inkremental")
+    # NO selalu teks seperti di riwayat prediksi: 1234, 1234.0 (kolom float
+    # karena baris kosong) dan "1234" sama, NO non-angka ("A-1") tetap utuh
+    df[ID] = df[ID].map(parcel_id)
+    if df[ID].isna().any() or df[ID].duplicated().any():
+        raise ValueError(f"Kolom '{ID}' harus terisi dan unik untuk skoring inkremental")
+    if previous is not None:
+        previous = previous.assign(**{ID: previous[ID].map(parcel_id)})
+
+    prints = fingerprint(df)
+    stale = np.ones(len(df), dtype=bool)
+    if previous is not None:
+        # Posisi baris simpanan per NO (-1 = parsel baru)
+        positions = pd.Index(previous[ID]).get_indexer(df[ID])
+        known = positions >= 0
+        stale[known] = previous[FINGERPRINT].to_numpy()[positions[known]] != prints[known]
+
+    scored = predict_frame(model, df.loc[stale], chunk_size=chunk_size)
+    outputs = [c for c in scored.columns if c not in df.columns]
+    result = pd.DataFrame(index=df.index, columns=outputs, dtype=object)
+    result.loc[stale] = scored[outputs].to_numpy()
+    if not stale.all():
+        result.loc[~stale] = previous[outputs].to_numpy()[positions[~stale]]
+    result = result.infer_objects()
+    hasil = pd.concat([df, result], axis=1)
+
+    store = pd.concat([df[[ID]], pd.Series(prints, name=FINGERPRINT), result], axis=1)
+    if previous is not None:
+        diff = class_diff(previous, hasil)
+    else:
+        diff = pd.DataFrame(columns=[ID, PREVIOUS, PREDICTION, STATUS])
+    summary = {
+        "baris": len(df),
+        "diskor ulang": int(stale.sum()),
+        "dipakai ulang": int((~stale).sum()),
+        "kelas berubah": int((diff[STATUS] == "berubah").sum()),
+        "baru": int((diff[STATUS] == "baru").sum()) if previous is not None else len(df),
+        "dihapus": int((diff[STATUS] == "dihapus").sum()),
+    }
+    return hasil, store, diff, summary
@@ -0,0 +1,212 @@
+"""Kerangka halaman Streamlit bersama: konfigurasi, logo sidebar, judul dan CSS.
+
+Aset statis dibaca sekali per proses dan disimpan di memori. Logo dikirim
+lewat ``st.image`` (media file Streamlit, di-cache per hash isi) sehingga
+setiap rerun hanya membawa URL-nya, bukan ~24 KB base64 di dalam HTML.
+Blok HTML/CSS judul dibangun sekali per teks yang sama. Dengan ``?debug=1``
+di URL, sesi itu mendapat :class:`~potensitol.trace.Tracer` sendiri di
+``st.session_state`` dan :func:`debug_panel` menampilkan agregatnya di
+sidebar; sesi lain dan tracer proses tidak tersentuh. Rerun fragment berjalan
+di thread lain, jadi fragment halaman dibungkus :func:`page_fragment` agar
+span-nya ikut tercatat.
+"""
+
+from functools import lru_cache, wraps
+
+from potensitol import trace
+from potensitol.data import ROOT
+
+LOGO_PATH = ROOT / "logo.png"
+LOGO_WIDTH = 150
+DEBUG_TRACER = "debug_tracer"
+# Panel debug dirender ulang berkala agar span dari rerun fragment ikut tampil
+DEBUG_REFRESH = "2s"
+
+BUTTON_CSS = """
+    <style>
+    div.stButton > button, div.stFormSubmitButton > button {
+        background-color: #007BFF;
+        color: white;
+        font-weight: bold;
+        border: none;
+        border-radius: 8px;
+        padding: 0.75em 1.5em;
+        transition: background-color 0.3s ease;
+        font-size: 18px;
+        width: 100%;
+    }
+
+    div.stButton > button:hover, div.stFormSubmitButton > button:hover {
+        background-color: #FFD600;
+        color: black;
+    }
+    </style>
+"""
+
+
+@lru_cache(maxsize=None)
+def read_asset(path):
+    """Isi file aset (bytes) dari memori proses; ``None`` bila tidak ada."""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def title_html(title, margin_bottom=0, bold=False):
+    """Judul berbentuk pill biru tua (halaman Home dan Analisis Data)."""
+    return f"""
+        <div style="text-align: center; margin-top: 20px;">
+            <h1 style="
+                color: white;
+                background-color: #11009E;
+                border-radius: 20px;
+                padding: 20px;
+                display: inline-block;
+                font-size: 22px;
+                text-transform: uppercase;
+                letter-spacing: 1px;
+                {"font-weight: bold;" if bold else ""}
+                box-shadow: 2px 2px 10px rgba(0, 0, 0, 0.3);
+                {f"margin-bottom: {margin_bottom}px;" if margin_bottom else ""}
+            ">
+                {title}
+            </h1>
+        </div>
+        """
+
+
+@lru_cache(maxsize=None)
+def banner_html(title, subtitle):
+    """Judul kotak biru muda dengan subjudul (halaman Prediksi)."""
+    return f"""
+    <div style='
+        text-align: center;
+        color: #004AAD;
+        background-color: #E3F2FD;
+        padding: 20px;
+        border-radius: 12px;
+        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
+    '>
+        <div style="font-size: 2.2rem; font-weight: bold;">
+            {title}
+        </div>
+        <div style="font-size: 1.3rem; font-weight: bold;">
+            {subtitle}
+        </div>
+    </div>
+"""
+
+
+def sidebar_logo(path=LOGO_PATH, width=LOGO_WIDTH):
+    import streamlit as st
+
+    logo = read_asset(path)
+    if logo is None:
+        st.sidebar.error(f"Logo file '{path.name}' not found. Please ensure the file is in the correct directory.")
+        return
+    _, col, _ = st.sidebar.columns([1, 3, 1])
+    col.image(logo, width=width)
+
+
+def setup_page(page_title):
+    """``set_page_config`` layout lebar + logo sidebar; panggil paling awal di setiap halaman."""
+    import streamlit as st
+
+    st.set_page_config(layout="wide", page_title=page_title, initial_sidebar_state="auto")
+    use_session_tracer()
+    sidebar_logo()
+
+
+def session_tracer(create=False):
+    """Tracer ``?debug=1`` milik sesi ini, atau ``None`` tanpa ``?debug=1``."""
+    import streamlit as st
+
+    if st.query_params.get("debug") != "1":
+        return None
+    if create and DEBUG_TRACER not in st.session_state:
+        st.session_state[DEBUG_TRACER] = trace.Tracer(enabled=True)
+    return st.session_state.get(DEBUG_TRACER)
+
+
+def use_session_tracer():
+    """Catat span thread rerun saat ini ke tracer sesi (atau lepaskan bila tidak ada)."""
+    trace.use_tracer(session_tracer(create=True))
+
+
+def page_fragment(fn):
+    """``st.fragment`` yang lebih dulu memasang tracer sesi di thread rerun fragment."""
+    import streamlit as st
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        use_session_tracer()
+        return fn(*args, **kwargs)
+    return st.fragment(wrapper)
+
+
+def page_title(title, margin_bottom=0, bold=False):
+    import streamlit as st
+
+    st.markdown(title_html(title, margin_bottom, bold), unsafe_allow_html=True)
+
+
+def page_banner(title, subtitle):
+    import streamlit as st
+
+    st.markdown(banner_html(title, subtitle), unsafe_allow_html=True)
+
+
+def button_style():
+    import streamlit as st
+
+    st.markdown(BUTTON_CSS, unsafe_allow_html=True)
+
+
+def debug_panel():
+    """Tabel span sesi ini + unduhan JSON/Prometheus; panggil paling akhir di halaman.
+
+    Tidak menggambar apa pun tanpa ``?debug=1``. Panel berupa fragment yang
+    dirender ulang setiap :data:`DEBUG_REFRESH`, sehingga span dari rerun
+    fragment lain (mis. submit form prediksi) juga tampil.
+    """
+    import streamlit as st
+
+    if session_tracer() is None:
+        return
+    with st.sidebar:
+        st.fragment(_debug_table, run_every=DEBUG_REFRESH)()
+
+
+def _debug_table():
+    import streamlit as st
+
+    tracer = session_tracer()
+    if tracer is None:
+        return
+    with st.expander("🐞 Debug: waktu eksekusi", expanded=True):
+        rows = tracer.snapshot()
+        if not rows:
+            st.caption("Belum ada span yang tercatat.")
+            return
+        st.dataframe(
+            [
+                {
+                    "Span": row["span"],
+                    "Jumlah": row["count"],
+                    "Total (ms)": round(row["total_seconds"] * 1000, 1),
+                    "Maks (ms)": round(row["max_seconds"] * 1000, 1),
+                    "Δ Memori (MB)": round(row["memory_bytes"] / 2**20, 1),
+                }
+                for row in rows
+            ],
+            use_container_width=True,
+            hide_index=True,
+        )
+        st.caption("Agregat sesi ini sejak ?debug=1 dibuka atau direset.")
+        col1, col2 = st.columns(2)
+        col1.download_button("JSON", tracer.to_json(), file_name="spans.json", mime="application/json")
+        col2.download_button("Prometheus", tracer.to_prometheus(), file_name="spans.prom", mime="text/plain")
+        st.button("Reset span", on_click=tracer.reset)
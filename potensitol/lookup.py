@@ -0,0 +1,165 @@
+"""Tabel prediksi lengkap untuk seluruh ruang fitur.
+
+Empat fitur kategorik memiliki kosakata tertutup dan forest hanya membelah
+"Luas  m2" pada sejumlah threshold terbatas. Karena itu setiap kombinasi
+kategori × interval Luas di antara threshold tersebut selalu jatuh ke daun
+yang sama di setiap pohon, sehingga probabilitasnya bisa dihitung sekali::
+
+    python -m potensitol lookup
+
+Prediksi menjadi penggabungan kode kategori (hash lookup) ditambah dua
+pencarian biner, dengan hasil identik bit demi bit dengan
+:class:`~potensitol.engine.CompiledForest` dan scikit-learn:
+
+* kategori yang tidak dikenal diberi kode tambahan per kolom (semua-nol di
+  OneHotEncoder) dan ikut dienumerasi;
+* Luas di-cast ke float32 sebelum dicari, sama seperti ``Tree``; nilai
+  ``x`` berada di interval ``j`` bila tepat ``j`` threshold ``< x``, yaitu
+  kondisi yang menentukan setiap perbandingan ``x <= threshold``;
+* interval berurutan dengan probabilitas sama di satu kombinasi digabung,
+  dan baris probabilitas yang sama disimpan sekali.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from potensitol.data import CATEGORICAL, NUMERIC
+from potensitol.engine import compile_forest
+
+LOOKUP_DIR = "lookup"
+ARRAYS = ("thresholds", "keys", "ids", "probas")
+BUILD_ROWS = 65_536
+
+
+class LookupTable:
+    """Indeks ``(kombinasi kategori, interval Luas) → baris probabilitas``.
+
+    ``keys`` terurut naik berisi ``kombinasi * (len(thresholds) + 1) +
+    interval_awal`` untuk setiap segmen interval, ``ids`` menunjuk baris
+    ``probas`` milik segmen tersebut.
+    """
+
+    def __init__(self, thresholds, keys, ids, probas, classes, vocabularies, model_sha256=None):
+        self.thresholds = thresholds
+        self.keys = keys
+        self.ids = ids
+        self.probas = probas
+        self.classes_ = np.asarray(classes, dtype=object)
+        self.vocabularies = vocabularies
+        self.model_sha256 = model_sha256
+        self._lookup = {c: {v: i for i, v in enumerate(vocab)} for c, vocab in vocabularies.items()}
+        # Kode len(vocab) = kategori tidak dikenal; radix campuran per kolom
+        sizes = [len(vocabularies[c]) + 1 for c in CATEGORICAL]
+        self._radix = np.cumprod([1] + sizes[:0:-1])[::-1].astype(np.int64)
+        self.n_combinations = int(np.prod(sizes))
+        self.n_intervals = len(thresholds) + 1
+
+    @property
+    def n_segments(self):
+        return len(self.keys)
+
+    def _combination_codes(self, X):
+        if isinstance(X, pd.DataFrame):
+            combo = np.zeros(len(X), dtype=np.int64)
+            for col, radix in zip(CATEGORICAL, self._radix):
+                codes = pd.Categorical(X[col], categories=self.vocabularies[col]).codes.astype(np.int64)
+                codes[codes < 0] = len(self.vocabularies[col])
+                combo += codes * radix
+            return combo, X[NUMERIC[0]].to_numpy(dtype=np.float64)
+        combo = np.array([
+            sum(self._lookup[col].get(record[col], len(self.vocabularies[col])) * int(radix)
+                for col, radix in zip(CATEGORICAL, self._radix))
+            for record in X
+        ], dtype=np.int64)
+        return combo, np.array([float(record[NUMERIC[0]]) for record in X], dtype=np.float64)
+
+    def rows(self, X):
+        """Indeks baris ``probas`` untuk setiap baris masukan."""
+        if isinstance(X, dict):
+            X = [X]
+        combo, luas = self._combination_codes(X)
+        luas = luas.astype(np.float32).astype(np.float64)
+        interval = np.searchsorted(self.thresholds, luas, side="left")
+        key = combo * self.n_intervals + interval
+        return self.ids[np.searchsorted(self.keys, key, side="right") - 1]
+
+    def predict_proba(self, X):
+        return self.probas[self.rows(X)]
+
+    def predict(self, X):
+        return self.classes_[self.probas[self.rows(X)].argmax(axis=1)]
+
+    def save(self, directory):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in ARRAYS:
+            np.save(directory / f"{name}.npy", getattr(self, name))
+        meta = {"classes": self.classes_.tolist(), "vocabularies": self.vocabularies,
+                "model_sha256": self.model_sha256}
+        (directory / "lookup.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+        return directory
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        directory = Path(directory)
+        meta = json.loads((directory / "lookup.json").read_text(encoding="utf-8"))
+        arrays = {name: np.load(directory / f"{name}.npy", mmap_mode="r" if mmap else None) for name in ARRAYS}
+        return cls(**arrays, classes=meta["classes"], vocabularies=meta["vocabularies"],
+                   model_sha256=meta["model_sha256"])
+
+
+def _representatives(thresholds):
+    # Nilai dengan tepat j threshold < nilai: threshold ke-j sendiri (x <= t
+    # masih ke kiri), dan untuk interval terakhir sembarang nilai di atasnya
+    if not len(thresholds):
+        return np.zeros(1)
+    return np.append(thresholds, thresholds[-1] + 1.0)
+
+
+def build_lookup(model, model_sha256=None, block_rows=BUILD_ROWS):
+    """Enumerasi seluruh kombinasi kategori × interval Luas dari ``model``.
+
+    ``model`` boleh berupa pipeline scikit-learn atau
+    :class:`~potensitol.engine.CompiledForest`.
+    """
+    engine = model if hasattr(model, "predict_proba_encoded") else compile_forest(model)
+    luas = engine.n_features - len(NUMERIC)
+    internal = np.asarray(engine.left) >= 0
+    thresholds = np.unique(np.asarray(engine.threshold)[internal & (np.asarray(engine.feature) == luas)])
+    reps = _representatives(thresholds)
+    n_intervals = len(reps)
+
+    sizes = [len(engine.vocabularies[c]) for c in CATEGORICAL]
+    table = LookupTable(thresholds, np.zeros(0, np.int64), np.zeros(0, np.int32), np.zeros((0, 0)),
+                        engine.classes_, engine.vocabularies, model_sha256)
+    offsets = np.cumsum([0] + sizes[:-1])
+    per_block = max(1, block_rows // n_intervals)
+
+    keys, probas = [], []
+    for start in range(0, table.n_combinations, per_block):
+        combo = np.arange(start, min(start + per_block, table.n_combinations), dtype=np.int64)
+        # Matriks float64: representatif interval tidak harus bisa diwakili
+        # float32, yang penting urutannya terhadap setiap threshold
+        Xe = np.zeros((len(combo), n_intervals, engine.n_features))
+        for col, radix, size, offset in zip(CATEGORICAL, table._radix, sizes, offsets):
+            code = combo // radix % (size + 1)
+            known = code < size
+            Xe[known, :, offset + code[known]] = 1.0
+        Xe[:, :, luas] = reps
+        proba = engine.predict_proba_encoded(Xe.reshape(-1, engine.n_features))
+        proba = proba.reshape(len(combo), n_intervals, -1)
+
+        starts = np.ones((len(combo), n_intervals), dtype=bool)
+        starts[:, 1:] = (proba[:, 1:] != proba[:, :-1]).any(axis=2)
+        c, j = np.nonzero(starts)
+        keys.append(combo[c] * n_intervals + j)
+        probas.append(proba[c, j])
+
+    unique, ids = np.unique(np.concatenate(probas), axis=0, return_inverse=True)
+    table.keys = np.concatenate(keys)
+    table.ids = ids.reshape(-1).astype(np.int32)
+    table.probas = unique
+    return table
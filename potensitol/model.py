@@ -0,0 +1,206 @@
+"""Memuat model Random Forest dan menjalankan prediksi tervektorisasi."""
+
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from potensitol.artifact import Artifact, current_artifact, read_metadata
+from potensitol.data import (
+    CONFIDENCE, MARGIN, ROOT, VALIDATION, file_digest, rank_columns, read_table, write_csv,
+)
+from potensitol.engine import ENGINE_DIR, CompiledForest, compile_forest
+from potensitol.lookup import LOOKUP_DIR, LookupTable
+from potensitol.schema import Schema
+from potensitol.trace import traced
+
+MODEL_PATH = ROOT / "model_rf_potensiTOL.pkl"
+CHUNK_SIZE = 50_000
+# Skoring file membaca sel sebagai teks apa adanya: tipe yang ditebak per
+# chunk/shard membuat NO dan Luas keluaran kadang "66", kadang "66.0"
+SCORE_DTYPE = str
+TOP_K = 2
+# Batas margin (probabilitas kelas teratas - kelas kedua) untuk triase
+CONFIDENCE_LEVELS = ((0.5, "Tinggi"), (0.2, "Sedang"), (0.0, "Rendah"))
+
+
+def resolve_model_path(path=None):
+    """Path model yang dilayani: argumen, artefak ``models/CURRENT``, atau pkl bawaan."""
+    if path is None:
+        path = current_artifact() or MODEL_PATH
+    return Path(path)
+
+
+@traced("model.load")
+def load_model(path=None):
+    """Muat pipeline scikit-learn (OneHotEncoder + RandomForestClassifier).
+
+    ``path`` boleh berupa direktori artefak (lihat :mod:`potensitol.artifact`)
+    atau file ``.pkl`` lama.
+    """
+    path = resolve_model_path(path)
+    if path.is_dir():
+        return Artifact(path).model
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def lookup_path(path=None):
+    """Lokasi tabel prediksi: ``<artefak>/lookup`` atau ``<pkl>.lookup``."""
+    path = resolve_model_path(path)
+    return path / LOOKUP_DIR if path.is_dir() else path.with_suffix(".lookup")
+
+
+def engine_path(path=None):
+    """Lokasi ekspor mesin terkompilasi: ``<artefak>/engine`` atau ``<pkl>.engine``."""
+    path = resolve_model_path(path)
+    return path / ENGINE_DIR if path.is_dir() else path.with_suffix(".engine")
+
+
+def load_compiled(path=None):
+    """Mesin terkompilasi dari ekspornya bila masih sesuai model, atau ``None``.
+
+    Ekspor di dalam direktori artefak lama (tanpa checksum) tetap diterima
+    karena artefak tidak pernah diubah setelah ditulis.
+    """
+    path = resolve_model_path(path)
+    target = engine_path(path)
+    if not target.exists():
+        return None
+    engine = CompiledForest.load(target)
+    if engine.model_sha256 is None and path.is_dir():
+        return engine
+    if engine.model_sha256 == model_info(path)["sha256"]:
+        return engine
+    return None
+
+
+@traced("model.load_engine")
+def load_engine(path=None):
+    """Model siap-prediksi dengan overhead terkecil.
+
+    Urutannya: tabel prediksi (:mod:`potensitol.lookup`) bila sudah dibuat
+    untuk model yang sama, mesin terkompilasi (:mod:`potensitol.engine`)
+    dari ``<artefak>/engine`` atau ``<pkl>.engine`` (lihat
+    :func:`load_compiled`), atau kompilasi di tempat. Semuanya identik
+    dengan scikit-learn; pipeline yang tidak didukung dikembalikan apa
+    adanya sebagai model scikit-learn.
+    """
+    path = resolve_model_path(path)
+    table = lookup_path(path)
+    if table.exists():
+        lookup = LookupTable.load(table)
+        # Tabel basi (model diganti setelah tabel dibuat) diabaikan
+        if lookup.model_sha256 == model_info(path)["sha256"]:
+            return lookup
+    engine = load_compiled(path)
+    if engine is not None:
+        return engine
+    model = load_model(path)
+    try:
+        return compile_forest(model)
+    except ValueError:
+        return model
+
+
+def model_info(path=None):
+    """Identitas model yang dilayani tanpa perlu memuat estimatornya."""
+    path = resolve_model_path(path)
+    if path.is_dir():
+        metadata = read_metadata(path)
+        return {
+            "version": metadata["version"],
+            "sha256": metadata["model_sha256"],
+            "sklearn_version": metadata["sklearn_version"],
+            "path": str(path),
+        }
+    digest = file_digest(path)
+    return {"version": f"pkl-{digest[:12]}", "sha256": digest, "sklearn_version": None, "path": str(path)}
+
+
+def top_k(proba, classes, k=TOP_K):
+    """``k`` kelas teratas per baris beserta probabilitas dan margin.
+
+    Satu pass tervektorisasi atas matriks ``predict_proba``: mengembalikan
+    ``(kelas (n, k), probabilitas (n, k), margin (n,))`` dengan margin =
+    selisih probabilitas peringkat 1 dan 2. Seri diurutkan sesuai urutan
+    ``classes``, sama dengan ``argmax``.
+    """
+    proba = np.atleast_2d(proba)
+    order = np.argsort(-proba, axis=1, kind="stable")
+    best = np.take_along_axis(proba, order, axis=1)
+    margin = best[:, 0] - best[:, 1] if proba.shape[1] > 1 else best[:, 0]
+    return np.asarray(classes, dtype=object)[order[:, :k]], best[:, :k], margin
+
+
+def confidence_level(margin):
+    """Label keyakinan (Tinggi/Sedang/Rendah) dari margin, tervektorisasi."""
+    margin = np.asarray(margin, dtype=float)
+    labels = np.full(margin.shape, None, dtype=object)
+    for threshold, label in reversed(CONFIDENCE_LEVELS):
+        labels[margin >= threshold] = label
+    return labels
+
+
+@traced("model.predict")
+def predict_frame(model, df, chunk_size=CHUNK_SIZE, on_progress=None, k=TOP_K, schema=None, return_proba=False):
+    """Prediksi seluruh baris ``df`` dengan satu ``predict_proba`` per chunk.
+
+    Selain kelas dan probabilitas teratas, ditambahkan ``k - 1`` kelas
+    berikutnya, margin dan label keyakinan. Label kategori diselaraskan ke
+    kosakata model lewat :class:`~potensitol.schema.Schema`. Baris kosong
+    total (";;;;;;") dibuang. Baris yang gagal validasi (fitur kosong,
+    kategori tidak dikenal, Luas tidak valid) tetap dikembalikan dengan
+    kolom prediksi kosong dan alasannya di kolom ``GALAT VALIDASI``.
+
+    Dengan ``return_proba`` dikembalikan ``(hasil, proba)``: ``proba`` adalah
+    DataFrame ``predict_proba`` lengkap (indeks ``hasil``, satu kolom per
+    ``model.classes_``), ``NaN`` untuk baris yang gagal validasi.
+    """
+    df = df.dropna(how="all").reset_index(drop=True)
+    X, errors = (schema or Schema.from_model(model)).validate(df)
+    valid = X.notna().all(axis=1).to_numpy()
+
+    k = min(k, len(model.classes_))
+    kelas = np.full((len(df), k), None, dtype=object)
+    probabilitas = np.full((len(df), k), np.nan)
+    margin = np.full(len(df), np.nan)
+    proba = np.full((len(df), len(model.classes_)), np.nan) if return_proba else None
+    idx_valid = np.flatnonzero(valid)
+    for start in range(0, len(idx_valid), chunk_size):
+        idx = idx_valid[start:start + chunk_size]
+        chunk_proba = model.predict_proba(X.iloc[idx])
+        kelas[idx], probabilitas[idx], margin[idx] = top_k(chunk_proba, model.classes_, k)
+        if return_proba:
+            proba[idx] = chunk_proba
+        if on_progress:
+            on_progress(min(start + chunk_size, len(idx_valid)), len(idx_valid))
+
+    for rank in range(k):
+        kolom_kelas, kolom_prob = rank_columns(rank + 1)
+        df[kolom_kelas] = kelas[:, rank]
+        df[kolom_prob] = probabilitas[:, rank].round(4)
+    df[MARGIN] = margin.round(4)
+    df[CONFIDENCE] = confidence_level(np.where(valid, margin, -1.0))
+    df[VALIDATION] = Schema.row_messages(errors, df.index)
+    if return_proba:
+        return df, pd.DataFrame(proba, index=df.index, columns=model.classes_)
+    return df
+
+
+def score_file(model, source, target, chunk_size=CHUNK_SIZE, on_chunk=None):
+    """Skor file CSV/XLSX ke CSV secara streaming; kembalikan jumlah baris.
+
+    ``on_chunk(hasil, proba)`` dipanggil untuk setiap chunk hasil beserta
+    matriks probabilitas lengkapnya (mis. untuk disimpan ke riwayat prediksi).
+    """
+    total = 0
+    with open(target, "w", encoding="utf-8", newline="") as out:
+        for chunk in read_table(source, chunksize=chunk_size, dtype=SCORE_DTYPE):
+            hasil, proba = predict_frame(model, chunk, chunk_size=chunk_size, return_proba=True)
+            write_csv(hasil, out, chunk_size=chunk_size, header=total == 0)
+            if on_chunk:
+                on_chunk(hasil, proba)
+            total += len(hasil)
+    return total
@@ -0,0 +1,127 @@
+"""Skoring batch paralel untuk file IP4T yang sangat besar.
+
+File CSV dibagi menjadi shard rentang baris (potongan byte yang selalu
+berawal dan berakhir di batas baris), lalu setiap shard dibaca, divalidasi,
+diprediksi dan diformat ke teks CSV oleh worker di process pool. Setiap
+worker memuat model sekali lewat initializer. Proses utama hanya menulis
+teks hasil secara berurutan, dan jumlah shard yang sedang diproses dibatasi
+``2 × workers`` sehingga memori tetap terbatas berapa pun ukuran file::
+
+    python -m potensitol score provinsi.csv hasil.csv --workers -1
+
+Pembagian byte mengasumsikan tidak ada baris baru di dalam sel ber-kutip
+(format ekspor BPN). File XLSX tidak bisa dibagi per byte: proses utama
+membacanya sekali, lalu frame-nya dibagi menjadi rentang baris yang
+dibagikan ke worker.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO, StringIO
+
+import pandas as pd
+
+from potensitol.data import _is_excel, read_table, sniff_sep, write_csv
+from potensitol.model import CHUNK_SIZE, SCORE_DTYPE, load_engine, load_model, predict_frame
+
+SHARD_BYTES = 16 * 1024 * 1024
+# Shard per worker minimal, agar worker yang selesai duluan tidak menganggur
+SHARDS_PER_WORKER = 4
+
+_model = None
+
+
+def resolve_workers(workers):
+    """``-1``/``None`` = semua core, selain itu minimal 1."""
+    if workers is None or workers < 1:
+        return os.cpu_count() or 1
+    return workers
+
+
+def shard_offsets(path, shard_bytes=SHARD_BYTES):
+    """``(header, [(awal, akhir), ...])``: rentang byte shard sejajar baris, tanpa header."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        header = f.readline()
+        start = f.tell()
+        ranges = []
+        while start < size:
+            f.seek(min(start + shard_bytes, size))
+            f.readline()
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return header, ranges
+
+
+def _init_worker(model_path, sklearn):
+    global _model
+    _model = load_model(model_path) if sklearn else load_engine(model_path)
+
+
+def _format(df, chunk_size, keep):
+    hasil, proba = predict_frame(_model, df, chunk_size=chunk_size, return_proba=True)
+    out = StringIO()
+    write_csv(hasil, out, chunk_size=chunk_size)
+    header, _, body = out.getvalue().partition("\n")
+    return len(hasil), header, body, (hasil, proba) if keep else None
+
+
+def _score_range(path, sep, header, start, end, chunk_size, keep):
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = header + f.read(end - start)
+    return _format(pd.read_csv(BytesIO(data), sep=sep, dtype=SCORE_DTYPE), chunk_size, keep)
+
+
+def _score_chunk(df, chunk_size, keep):
+    return _format(df, chunk_size, keep)
+
+
+def score_file_parallel(source, target, workers=-1, model_path=None, sklearn=False,
+                        chunk_size=CHUNK_SIZE, shard_bytes=SHARD_BYTES, on_chunk=None):
+    """Seperti :func:`~potensitol.model.score_file`, tetapi shard diproses paralel.
+
+    Urutan baris keluaran sama dengan masukan. Mengembalikan jumlah baris.
+    Dengan ``on_chunk`` worker juga mengirim balik hasil dan matriks
+    probabilitas setiap shard, lalu ``on_chunk(hasil, proba)`` dipanggil di
+    proses utama sesuai urutan shard.
+    """
+    workers = resolve_workers(workers)
+    keep = on_chunk is not None
+    if _is_excel(source):
+        df = read_table(source, dtype=SCORE_DTYPE)
+        rows = max(1, min(chunk_size, -(-len(df) // (workers * SHARDS_PER_WORKER))))
+        tasks = ((_score_chunk, df.iloc[start:start + rows], chunk_size, keep) for start in range(0, len(df), rows))
+    else:
+        size = os.path.getsize(source)
+        shard_bytes = max(1, min(shard_bytes, -(-size // (workers * SHARDS_PER_WORKER))))
+        header, ranges = shard_offsets(source, shard_bytes)
+        sep = sniff_sep(source)
+        tasks = ((_score_range, str(source), sep, header, start, end, chunk_size, keep) for start, end in ranges)
+
+    total = 0
+    header_written = False
+    pending = deque()
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(model_path, sklearn)) as pool, \
+            open(target, "w", encoding="utf-8", newline="") as out:
+
+        def drain():
+            nonlocal total, header_written
+            rows, columns, body, scored = pending.popleft().result()
+            if columns and not header_written:
+                out.write(columns + "\n")
+                header_written = True
+            out.write(body)
+            if scored is not None:
+                on_chunk(*scored)
+            total += rows
+
+        for fn, *args in tasks:
+            pending.append(pool.submit(fn, *args))
+            if len(pending) >= 2 * workers:
+                drain()
+        while pending:
+            drain()
+    return total
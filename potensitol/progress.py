@@ -0,0 +1,82 @@
+"""Pelaporan progres berdasarkan tahap kerja nyata, tanpa jeda buatan."""
+
+from contextlib import contextmanager
+from time import perf_counter
+
+from potensitol.trace import span
+
+SLOW_SECONDS = 0.5
+
+
+class StageProgress:
+    """Ukur durasi tiap tahap dan laporkan fraksi progres ke ``on_update``.
+
+    ``on_update(fraction, text)`` dipanggil saat tahap dimulai/selesai dan
+    setiap kali :meth:`report` dipanggil dari dalam tahap (mis. per chunk).
+    """
+
+    def __init__(self, stages, on_update=None):
+        self.stages = list(stages)
+        self.timings = {}
+        self.on_update = on_update
+        self._current = None
+
+    def _emit(self, fraction, text):
+        if self.on_update:
+            self.on_update(min(max(fraction, 0.0), 1.0), text)
+
+    @contextmanager
+    def stage(self, name):
+        i = self.stages.index(name)
+        self._current = i
+        self._emit(i / len(self.stages), f"⏳ {name}...")
+        start = perf_counter()
+        try:
+            with span(f"stage.{name}"):
+                yield self
+        finally:
+            self.timings[name] = perf_counter() - start
+            self._current = None
+        self._emit((i + 1) / len(self.stages), f"✅ {name}")
+
+    def report(self, done, total=None):
+        """Laporkan progres di dalam tahap yang sedang berjalan.
+
+        Tanpa ``total`` (mis. file dibaca streaming) hanya jumlahnya yang
+        ditampilkan.
+        """
+        if self._current is None:
+            return
+        name = self.stages[self._current]
+        if total:
+            fraction = (self._current + done / total) / len(self.stages)
+            self._emit(fraction, f"⏳ {name}: {done:,}/{total:,}")
+        else:
+            self._emit(self._current / len(self.stages), f"⏳ {name}: {done:,}")
+
+    @property
+    def total(self):
+        return sum(self.timings.values())
+
+    def summary(self):
+        return " · ".join(f"{name} {detik:.2f} s" for name, detik in self.timings.items())
+
+
+class StreamlitStageProgress(StageProgress):
+    """:class:`StageProgress` yang digambar sebagai ``st.progress``.
+
+    Setelah :meth:`finish`, bar dihapus; rincian durasi per tahap hanya
+    ditampilkan bila total waktunya melewati ``SLOW_SECONDS``.
+    """
+
+    def __init__(self, stages, container=None):
+        import streamlit as st
+
+        self._container = container or st
+        self._bar = self._container.progress(0.0, text="⏳ Memulai...")
+        super().__init__(stages, on_update=lambda fraction, text: self._bar.progress(fraction, text=text))
+
+    def finish(self, threshold=SLOW_SECONDS):
+        self._bar.empty()
+        if self.total >= threshold:
+            self._container.caption(f"⏱️ Total {self.total:.2f} s — {self.summary()}")
@@ -0,0 +1,138 @@
+"""Profil kualitas data IP4T yang dijalankan bersamaan dengan pemuatan dataset.
+
+File BPN berisi ribuan baris kosong (";;;;;;"), variasi ejaan label
+kategori dan nilai Luas yang tidak valid atau ambigu ("3.131" bisa berarti
+3,131 m² atau 3.131 m² dengan pemisah ribuan). :func:`profile_dataset`
+membaca file sekali, mendeteksi semua itu secara tervektorisasi, dan
+mengembalikan frame bersih yang sama dengan
+:func:`~potensitol.data.load_dataset` beserta :class:`QualityReport`::
+
+    python -m potensitol profile "dataset20052025(3).csv"
+"""
+
+from difflib import SequenceMatcher
+
+import pandas as pd
+
+from potensitol.data import CATEGORY_DTYPES, DATASET_PATH, ID, NUMERIC, _is_excel, sniff_sep, tidy_frame
+from potensitol.schema import normalize_label
+from potensitol.trace import span, traced
+
+SIMILARITY = 0.9
+# Angka dengan titik setiap tiga digit: pecahan desimal atau pemisah ribuan
+THOUSANDS_PATTERN = r"\d{1,3}(?:\.\d{3})+"
+
+
+class QualityReport:
+    """Temuan kualitas data satu file; semua tabel berupa DataFrame kecil."""
+
+    def __init__(self, lines, blank_rows, rows, missing, luas_issues, near_duplicates, duplicate_rows):
+        self.lines = lines
+        self.blank_rows = blank_rows
+        self.rows = rows
+        self.missing = missing
+        self.luas_issues = luas_issues
+        self.near_duplicates = near_duplicates
+        self.duplicate_rows = duplicate_rows
+
+    def luas_count(self, problem):
+        return int((self.luas_issues["MASALAH"] == problem).sum())
+
+    def summary(self):
+        checks = [
+            ("Baris di file", self.lines),
+            ("Baris kosong dibuang", self.blank_rows),
+            ("Baris data", self.rows),
+            ("Sel kosong pada baris data", int(self.missing.sum())),
+            ("Luas kosong", self.luas_count("kosong")),
+            ("Luas bukan angka", self.luas_count("bukan angka")),
+            ("Luas ≤ 0", self.luas_count("tidak positif")),
+            ("Luas ambigu (pemisah ribuan?)", self.luas_count("ambigu")),
+            ("Pasangan label kategori mirip", len(self.near_duplicates)),
+            ("Baris identik (tanpa NO)", self.duplicate_rows),
+        ]
+        return pd.DataFrame(checks, columns=["Pemeriksaan", "Jumlah"])
+
+
+def _read_raw(source):
+    # Luas dibaca sebagai teks agar nilai asli tetap terlihat di laporan
+    dtype = {**CATEGORY_DTYPES, **{c: str for c in NUMERIC}}
+    with span("csv.parse"):
+        if _is_excel(source):
+            df = pd.read_excel(source, dtype={c: str for c in NUMERIC})
+            return df.astype({c: t for c, t in CATEGORY_DTYPES.items() if c in df.columns})
+        return pd.read_csv(source, sep=sniff_sep(source), dtype=dtype)
+
+
+def luas_issues(raw):
+    """Satu baris per nilai Luas bermasalah: BARIS, NILAI, MASALAH."""
+    numeric = pd.to_numeric(raw, errors="coerce")
+    text = raw.astype("string").str.strip()
+    problems = {
+        "kosong": raw.isna(),
+        "bukan angka": numeric.isna() & raw.notna(),
+        "tidak positif": numeric <= 0,
+        "ambigu": text.str.fullmatch(THOUSANDS_PATTERN).fillna(False).astype(bool),
+    }
+    frames = [
+        pd.DataFrame({"BARIS": raw.index[mask.to_numpy()], "NILAI": raw[mask], "MASALAH": problem})
+        for problem, mask in problems.items() if mask.any()
+    ]
+    if not frames:
+        return pd.DataFrame(columns=["BARIS", "NILAI", "MASALAH"])
+    return pd.concat(frames, ignore_index=True).sort_values("BARIS", kind="stable", ignore_index=True)
+
+
+def near_duplicate_labels(df, columns, similarity=SIMILARITY):
+    """Pasangan label dalam satu kolom yang kemungkinan variasi ejaan.
+
+    Jenisnya: ``spasi di tepi`` (label berbeda dari versi tanpa spasi
+    depan/belakang), ``spasi/kapital`` (sama setelah normalisasi), ``awalan``
+    (label satu adalah awalan label lain, mis. "Madrasah" dan "Madrasah
+    Ibtidayah") atau ``ejaan mirip`` (rasio kemiripan ≥ ``similarity``).
+    Kosakata kategori kecil, sehingga perbandingan berpasangan murah.
+    """
+    rows = []
+    for col in columns:
+        if col not in df.columns:
+            continue
+        counts = df[col].value_counts()
+        counts = counts[counts > 0]
+        labels = counts.index.astype(str).tolist()
+        keys = normalize_label(labels).tolist()
+        for i, a in enumerate(labels):
+            if a != a.strip():
+                rows.append((col, a, int(counts.iloc[i]), a.strip(), int(counts.get(a.strip(), 0)), "spasi di tepi"))
+            for j in range(i + 1, len(labels)):
+                b = labels[j]
+                if keys[i] == keys[j]:
+                    kind = "spasi/kapital"
+                elif keys[j].startswith(keys[i] + " ") or keys[i].startswith(keys[j] + " "):
+                    kind = "awalan"
+                elif SequenceMatcher(None, keys[i], keys[j]).ratio() >= similarity:
+                    kind = "ejaan mirip"
+                else:
+                    continue
+                rows.append((col, a, int(counts.iloc[i]), b, int(counts.iloc[j]), kind))
+    return pd.DataFrame(rows, columns=["KOLOM", "LABEL", "JUMLAH", "LABEL MIRIP", "JUMLAH MIRIP", "JENIS"])
+
+
+@traced("data.profile")
+def profile_dataset(source=DATASET_PATH):
+    """Muat dan profilkan dataset sekaligus; kembalikan ``(df_bersih, QualityReport)``."""
+    raw = _read_raw(source)
+    lines = len(raw)
+    df = tidy_frame(raw)
+    data_cols = [c for c in df.columns if c != ID]
+    # Indeks baris Luas mengikuti frame bersih (baris kosong sudah dibuang)
+    luas = raw.loc[raw.notna().any(axis=1), NUMERIC[0]] if NUMERIC[0] in raw.columns else pd.Series(dtype=object)
+    report = QualityReport(
+        lines=lines,
+        blank_rows=lines - len(df),
+        rows=len(df),
+        missing=df[data_cols].isna().sum(),
+        luas_issues=luas_issues(luas.reset_index(drop=True)),
+        near_duplicates=near_duplicate_labels(df, [c for c in CATEGORY_DTYPES if c in df.columns]),
+        duplicate_rows=int(df[data_cols].duplicated().sum()),
+    )
+    return df, report
@@ -0,0 +1,152 @@
+"""Skema masukan: kosakata kanonik dari model, validasi dan penyelarasan kategori.
+
+Kosakata diambil dari OneHotEncoder model yang dilayani, jadi pilihan di
+UI, validasi batch dan server selalu sama dengan kategori yang dikenal
+model. Label masukan dicocokkan setelah dinormalisasi (spasi di tepi dan
+ganda diabaikan, huruf besar/kecil disamakan), ditambah alias untuk label
+lama di form Prediksi, misalnya "Terdaftar (HGU Baru)". Kategori yang tetap
+tidak dikenal dilaporkan per baris, tidak diam-diam dianggap semua-nol.
+"""
+
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from potensitol.artifact import model_vocabularies
+from potensitol.data import CATEGORICAL, FEATURES, NUMERIC
+
+# Label lama form Prediksi → label pada data latih
+ALIASES = {
+    "PEMILIKAN TANAH": {
+        "Terdaftar (HGU Baru)": "Terdaftar dalam HGU baru (diluar penyisihan)",
+        "Tidak Terdaftar": "Tidak terdaftar (dalam areal penyisihan HGU Lama)",
+        "Terdaftar (tumpang tindih)": "Terdaftar (di luar areal penyisihan / tumpang tindih dengan HGU baru)",
+    },
+    "PENGGUNAAN TANAH": {
+        "Madrasah": "Madrasah Ibtidayah",
+        "Lainnya": "Fasos/ fasum/ lainnya",
+    },
+    "PEMANFAATAN TANAH": {
+        "Produksi pertanian": "Pemanfaatan Produksi pertanian",
+        "Usaha": "Tempat Usaha",
+    },
+}
+COLUMN_ALIASES = {"KEPEMILIKAN TANAH": "PEMILIKAN TANAH"}
+
+ROW = "BARIS"
+COLUMN = "KOLOM"
+VALUE = "NILAI"
+MESSAGE = "PESAN"
+
+# Skema per objek model, agar predict_frame per chunk tidak membangunnya ulang
+_SCHEMAS = weakref.WeakKeyDictionary()
+
+
+def normalize_label(values):
+    """Normalisasi tervektorisasi untuk pencocokan label (bukan untuk ditampilkan)."""
+    return pd.Series(values, dtype=object).astype(str).str.strip().str.replace(r"\s+", " ", regex=True).str.casefold()
+
+
+class Schema:
+    """Kosakata kanonik per kolom kategorik dan aturan validasi Luas."""
+
+    def __init__(self, vocabularies):
+        missing = [c for c in CATEGORICAL if c not in vocabularies]
+        if missing:
+            raise ValueError(f"Kosakata model tidak memuat kolom {missing}")
+        self.vocabularies = {c: list(vocabularies[c]) for c in CATEGORICAL}
+        self._canonical = {}
+        for col, vocab in self.vocabularies.items():
+            aliases = {k: v for k, v in ALIASES.get(col, {}).items() if v in vocab}
+            labels = list(aliases) + vocab
+            targets = list(aliases.values()) + vocab
+            self._canonical[col] = dict(zip(normalize_label(labels), targets))
+
+    @classmethod
+    def from_model(cls, model):
+        """Skema dari mesin terkompilasi/tabel prediksi atau pipeline scikit-learn (di-cache per model)."""
+        try:
+            schema = _SCHEMAS.get(model)
+        except TypeError:
+            schema = None
+        if schema is None:
+            vocabularies = getattr(model, "vocabularies", None) or model_vocabularies(model)
+            schema = cls(vocabularies)
+            try:
+                _SCHEMAS[model] = schema
+            except TypeError:
+                pass
+        return schema
+
+    def options(self, col):
+        """Pilihan UI: kosakata kanonik terurut tanpa memedulikan spasi di tepi."""
+        return sorted(self.vocabularies[col], key=lambda v: v.strip().casefold())
+
+    def canonical(self, col, value):
+        """Label kanonik untuk satu nilai, atau ``None`` bila tidak dikenal."""
+        return self._canonical[col].get(normalize_label([value]).iloc[0])
+
+    def _canonicalize(self, col, raw):
+        """Label kanonik per baris; normalisasi hanya atas nilai unik lalu dipetakan balik."""
+        codes, uniques = pd.factorize(raw)
+        targets = normalize_label(np.asarray(uniques, dtype=object)).map(self._canonical[col]).to_numpy()
+        canonical = np.full(len(codes), None, dtype=object)
+        known = codes >= 0
+        canonical[known] = targets[codes[known]]
+        return pd.Series(canonical, index=raw.index, dtype=object)
+
+    def validate(self, df):
+        """Kanonisasi dan validasi seluruh baris dalam satu pass per kolom.
+
+        Mengembalikan ``(X, errors)``: ``X`` berisi kolom ``FEATURES`` dengan
+        label kanonik dan Luas numerik (nilai tidak valid menjadi NaN), dan
+        ``errors`` satu baris per pelanggaran dengan kolom BARIS (indeks
+        ``df``), KOLOM, NILAI dan PESAN.
+        """
+        df = df.rename(columns=COLUMN_ALIASES)
+        X = pd.DataFrame(index=df.index)
+        problems = []
+
+        def report(mask, col, values, message):
+            if mask.any():
+                problems.append(pd.DataFrame({
+                    ROW: df.index[mask], COLUMN: col, VALUE: values[mask], MESSAGE: message,
+                }))
+
+        for col in FEATURES:
+            if col not in df.columns:
+                report(np.ones(len(df), dtype=bool), col, pd.Series([None] * len(df), dtype=object).to_numpy(),
+                       "kolom tidak ada")
+                X[col] = np.nan
+                continue
+            raw = df[col]
+            empty = raw.isna().to_numpy()
+            if col in NUMERIC:
+                values = pd.to_numeric(raw, errors="coerce")
+                number = values.to_numpy(dtype=float)
+                not_number = np.isnan(number) & ~empty
+                not_finite = ~np.isfinite(number) & ~np.isnan(number)
+                not_positive = (number <= 0) & ~not_finite
+                report(not_number, col, raw.to_numpy(dtype=object), "bukan angka")
+                report(not_finite, col, raw.to_numpy(dtype=object), "bukan angka terhingga")
+                report(not_positive, col, raw.to_numpy(dtype=object), "harus lebih dari 0")
+                X[col] = values.where(~(not_positive | not_finite))
+            else:
+                canonical = self._canonicalize(col, raw)
+                unknown = canonical.isna().to_numpy() & ~empty
+                report(unknown, col, raw.to_numpy(dtype=object), "kategori tidak dikenal model")
+                X[col] = canonical.where(~empty)
+            report(empty, col, raw.to_numpy(dtype=object), "kosong")
+
+        columns = [ROW, COLUMN, VALUE, MESSAGE]
+        errors = pd.concat(problems, ignore_index=True) if problems else pd.DataFrame(columns=columns)
+        return X, errors.sort_values([ROW], kind="stable", ignore_index=True)
+
+    @staticmethod
+    def row_messages(errors, index):
+        """Gabungan pesan galat per baris (``None`` untuk baris valid)."""
+        if errors.empty:
+            return pd.Series(None, index=index, dtype=object)
+        messages = (errors[COLUMN] + ": " + errors[MESSAGE]).groupby(errors[ROW]).agg("; ".join)
+        return messages.reindex(index)
@@ -0,0 +1,261 @@
+"""Server HTTP/JSON lokal untuk prediksi Potensi TOL dengan micro-batching.
+
+Hanya memakai pustaka standar sehingga bisa berjalan offline::
+
+    python -m potensitol serve --port 8000
+
+    curl -s localhost:8000/predict -d '{"PENGUASAAN TANAH": "Pemilik", ...}'
+
+``POST /predict`` menerima satu objek atau array objek dengan lima fitur
+IP4T. Permintaan yang datang bersamaan digabung menjadi satu panggilan
+``predict_proba``. ``GET /metrics`` mengembalikan penghitung dan latensi
+p50/p99, ``GET /health`` untuk cek hidup beserta versi model yang dilayani.
+``GET /spans`` mengekspor agregat :mod:`potensitol.trace` dalam format teks
+Prometheus (``/spans?format=json`` untuk JSON); kosong bila
+``POTENSITOL_TRACE`` tidak diaktifkan.
+"""
+
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from potensitol.data import CATEGORICAL, FEATURES, TARGET
+from potensitol.model import confidence_level, load_engine, model_info, top_k
+from potensitol.schema import Schema
+from potensitol.trace import TRACER
+
+MAX_BATCH = 512
+MAX_WAIT_MS = 2.0
+LATENCY_WINDOW = 10_000
+
+
+class LatencyStats:
+    """Penghitung permintaan dan jendela latensi terbaru (ms)."""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.errors = 0
+
+    def record_request(self, rows, seconds):
+        with self._lock:
+            self.requests += 1
+            self.rows += rows
+            self._latencies.append(seconds * 1000)
+
+    def record_batch(self):
+        with self._lock:
+            self.batches += 1
+
+    def record_error(self):
+        with self._lock:
+            self.errors += 1
+
+    def snapshot(self):
+        with self._lock:
+            latencies = np.fromiter(self._latencies, dtype=float)
+            p50, p99 = np.percentile(latencies, [50, 99]) if len(latencies) else (0.0, 0.0)
+            return {
+                "requests": self.requests,
+                "rows": self.rows,
+                "batches": self.batches,
+                "errors": self.errors,
+                "rows_per_batch": self.rows / self.batches if self.batches else 0.0,
+                "latency_ms_p50": round(float(p50), 3),
+                "latency_ms_p99": round(float(p99), 3),
+            }
+
+
+class MicroBatcher:
+    """Gabungkan permintaan bersamaan menjadi satu ``predict_proba``.
+
+    Worker menunggu permintaan pertama, lalu mengumpulkan permintaan lain
+    paling lama ``max_wait_ms`` atau sampai ``max_batch`` baris.
+    """
+
+    def __init__(self, model, max_batch=MAX_BATCH, max_wait_ms=MAX_WAIT_MS, stats=None):
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.stats = stats or LatencyStats()
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="potensitol-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, records):
+        future = Future()
+        self._queue.put((records, future))
+        return future
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        rows = len(batch[0][0])
+        deadline = time.perf_counter() + self.max_wait
+        while rows < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(item)
+            rows += len(item[0])
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            records = [record for items, _ in batch for record in items]
+            try:
+                proba = self.model.predict_proba(pd.DataFrame.from_records(records, columns=FEATURES))
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            self.stats.record_batch()
+            start = 0
+            for items, future in batch:
+                future.set_result(proba[start:start + len(items)])
+                start += len(items)
+
+
+def parse_records(payload, schema=None):
+    """Validasi payload JSON menjadi list record berurutan sesuai ``FEATURES``.
+
+    Dengan ``schema`` label kategori diselaraskan ke kosakata model dan
+    kategori yang tidak dikenal ditolak.
+    """
+    items = payload if isinstance(payload, list) else [payload]
+    if not items:
+        raise ValueError("payload kosong")
+    records = []
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise ValueError(f"item {i}: harus berupa objek JSON")
+        missing = [c for c in FEATURES if c not in item]
+        if missing:
+            raise ValueError(f"item {i}: kolom hilang {missing}")
+        try:
+            luas = float(item["Luas  m2"])
+        except (TypeError, ValueError):
+            raise ValueError(f"item {i}: 'Luas  m2' harus numerik") from None
+        if not np.isfinite(luas):
+            raise ValueError(f"item {i}: 'Luas  m2' bukan angka terhingga")
+        values = [str(item[c]) for c in CATEGORICAL]
+        if schema is not None:
+            values = [schema.canonical(c, v) for c, v in zip(CATEGORICAL, values)]
+            unknown = [c for c, v in zip(CATEGORICAL, values) if v is None]
+            if unknown:
+                raise ValueError(f"item {i}: kategori tidak dikenal model pada {unknown}")
+            if not luas > 0:
+                raise ValueError(f"item {i}: 'Luas  m2' harus lebih dari 0")
+        records.append(tuple(values) + (luas,))
+    return records
+
+
+def format_predictions(classes, proba):
+    kelas, _, margin = top_k(proba, classes, k=1)
+    keyakinan = confidence_level(margin)
+    return [
+        {
+            TARGET: best,
+            "probabilities": {c: round(float(p), 6) for c, p in zip(classes, row)},
+            "margin": round(float(m), 6),
+            "confidence": label,
+        }
+        for best, row, m, label in zip(kelas[:, 0], proba, margin, keyakinan)
+    ]
+
+
+def make_handler(batcher, info=None):
+    classes = [str(c) for c in batcher.model.classes_]
+    schema = Schema.from_model(batcher.model)
+
+    class PredictionHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send_json(self, status, body):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _send_text(self, status, text, content_type):
+            data = text.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path == "/spans":
+                self._send_text(200, TRACER.to_prometheus(), "text/plain; version=0.0.4")
+            elif self.path == "/spans?format=json":
+                self._send_text(200, TRACER.to_json(), "application/json")
+            elif self.path == "/health":
+                self._send_json(200, {"status": "ok", "model": info})
+            elif self.path == "/metrics":
+                self._send_json(200, batcher.stats.snapshot())
+            else:
+                self._send_json(404, {"error": "not found"})
+
+        def do_POST(self):
+            if self.path != "/predict":
+                self._send_json(404, {"error": "not found"})
+                return
+            start = time.perf_counter()
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length))
+                records = parse_records(payload, schema)
+            except ValueError as e:
+                batcher.stats.record_error()
+                self._send_json(400, {"error": str(e)})
+                return
+            try:
+                proba = batcher.submit(records).result()
+            except Exception as e:
+                batcher.stats.record_error()
+                self._send_json(500, {"error": str(e)})
+                return
+            predictions = format_predictions(classes, proba)
+            batcher.stats.record_request(len(records), time.perf_counter() - start)
+            self._send_json(200, predictions if isinstance(payload, list) else predictions[0])
+
+        def log_message(self, format, *args):
+            # Log akses per permintaan terlalu mahal pada QPS tinggi
+            pass
+
+    return PredictionHandler
+
+
+class PredictionServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Antrean listen bawaan (5) membuat koneksi bersamaan ditolak
+    request_queue_size = 1024
+
+
+def serve(host="127.0.0.1", port=8000, model_path=None, max_batch=MAX_BATCH, max_wait_ms=MAX_WAIT_MS):
+    """Jalankan server sampai dihentikan (Ctrl+C)."""
+    batcher = MicroBatcher(load_engine(model_path), max_batch=max_batch, max_wait_ms=max_wait_ms)
+    server = PredictionServer((host, port), make_handler(batcher, model_info(model_path)))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
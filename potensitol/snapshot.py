@@ -0,0 +1,95 @@
+"""Snapshot kolumnar (Arrow IPC) dari dataset IP4T.
+
+Kolom kategorik disimpan sebagai dictionary array, sehingga snapshot bisa
+di-memory-map dan langsung menjadi kolom ``category`` tanpa parsing teks::
+
+    python -m potensitol snapshot "dataset20052025(3).csv"
+
+Laporan kualitas data ikut disimpan di sampingnya (``<sumber>.quality.pkl``)
+dengan hash sumber yang sama, sehingga halaman analisis tidak perlu
+mem-parsing CSV lagi untuk profilnya.
+"""
+
+import pickle
+from pathlib import Path
+
+from potensitol.data import DATASET_PATH, file_digest
+from potensitol.quality import profile_dataset
+
+SNAPSHOT_SUFFIX = ".arrow"
+QUALITY_SUFFIX = ".quality.pkl"
+DIGEST_KEY = b"potensitol.source_sha256"
+
+
+def snapshot_path(source=DATASET_PATH):
+    return Path(source).with_suffix(SNAPSHOT_SUFFIX)
+
+
+def quality_path(source=DATASET_PATH):
+    return Path(source).with_suffix(QUALITY_SUFFIX)
+
+
+def write_snapshot(source=DATASET_PATH, target=None):
+    """Konversi CSV/XLSX ke Arrow IPC tanpa kompresi (agar bisa di-mmap).
+
+    Laporan kualitas dari parsing yang sama ditulis ke :func:`quality_path`.
+    """
+    import pyarrow as pa
+
+    target = Path(target) if target else snapshot_path(source)
+    digest = file_digest(source)
+    df, report = profile_dataset(source)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[DIGEST_KEY] = digest.encode()
+    table = table.replace_schema_metadata(metadata)
+    with pa.OSFile(str(target), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    with open(quality_path(source), "wb") as f:
+        pickle.dump({"digest": digest, "report": report}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return target
+
+
+def read_snapshot(path, expected_digest=None):
+    """Baca snapshot via memory map; ``None`` bila hash sumber tidak cocok."""
+    import pyarrow as pa
+
+    with pa.memory_map(str(path), "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    if expected_digest is not None:
+        digest = (table.schema.metadata or {}).get(DIGEST_KEY, b"").decode()
+        if digest != expected_digest:
+            return None
+    return table.to_pandas()
+
+
+def read_quality_report(source=DATASET_PATH, digest=None):
+    """Laporan kualitas tersimpan; ``None`` bila tidak ada atau hash sumber tidak cocok."""
+    path = quality_path(source)
+    if not path.exists():
+        return None
+    with open(path, "rb") as f:
+        saved = pickle.load(f)
+    if digest is not None and saved.get("digest") != digest:
+        return None
+    return saved["report"]
+
+
+def load_profile_snapshot(source=DATASET_PATH, digest=None):
+    """``(df, QualityReport)`` dari snapshot dan laporan tersimpan bila keduanya sesuai sumber.
+
+    Jika salah satunya tidak ada atau usang, dataset diprofilkan ulang dengan
+    :func:`~potensitol.quality.profile_dataset` (satu kali parsing).
+    """
+    source = Path(source)
+    if digest is None and source.exists():
+        digest = file_digest(source)
+    report = read_quality_report(source, digest)
+    if report is not None and snapshot_path(source).exists():
+        try:
+            df = read_snapshot(snapshot_path(source), expected_digest=digest)
+        except ImportError:
+            df = None
+        if df is not None:
+            return df, report
+    return profile_dataset(source)
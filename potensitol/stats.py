@@ -0,0 +1,229 @@
+"""Agregat berjalan yang dapat digabung untuk analisis dataset per chunk.
+
+Dipakai ketika file terlalu besar untuk dimuat sebagai satu DataFrame:
+setiap chunk memperbarui :class:`StreamingSummary`, dan dua ringkasan dari
+bagian file berbeda dapat digabung dengan :meth:`StreamingSummary.merge`.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from potensitol.data import ID, NUMERIC
+from potensitol.trace import traced
+
+QUANTILES = (0.25, 0.5, 0.75)
+
+
+class QuantileSketch:
+    """Sketsa kuantil log-bucket (gaya DDSketch) dengan galat relatif tetap.
+
+    Setiap nilai positif ``x`` masuk bucket ``ceil(log_gamma(x))``; nilai
+    negatif memakai bucket cermin dan nol dihitung terpisah. Kuantil yang
+    dihasilkan berada dalam ``relative_accuracy`` dari nilai sebenarnya.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive = {}
+        self.negative = {}
+        self.zero = 0
+
+    @property
+    def count(self):
+        return self.zero + sum(self.positive.values()) + sum(self.negative.values())
+
+    def _add_buckets(self, buckets, values):
+        idx, counts = np.unique(np.ceil(np.log(values) / self._log_gamma).astype(np.int64), return_counts=True)
+        for i, c in zip(idx.tolist(), counts.tolist()):
+            buckets[i] = buckets.get(i, 0) + c
+
+    def add(self, values):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        self._add_buckets(self.positive, values[values > 0])
+        self._add_buckets(self.negative, -values[values < 0])
+        self.zero += int((values == 0).sum())
+
+    def merge(self, other):
+        for mine, theirs in ((self.positive, other.positive), (self.negative, other.negative)):
+            for i, c in theirs.items():
+                mine[i] = mine.get(i, 0) + c
+        self.zero += other.zero
+        return self
+
+    def _value(self, i):
+        return 2 * self.gamma ** i / (self.gamma + 1)
+
+    def buckets(self):
+        """Pasangan (nilai representatif, jumlah) terurut naik."""
+        neg = sorted(self.negative.items(), reverse=True)
+        pos = sorted(self.positive.items())
+        values = [-self._value(i) for i, _ in neg] + ([0.0] if self.zero else []) + [self._value(i) for i, _ in pos]
+        counts = [c for _, c in neg] + ([self.zero] if self.zero else []) + [c for _, c in pos]
+        return np.array(values, dtype=float), np.array(counts, dtype=np.int64)
+
+    def quantiles(self, qs=QUANTILES):
+        values, counts = self.buckets()
+        if not len(counts):
+            return [np.nan] * len(qs)
+        cum = np.cumsum(counts)
+        ranks = np.asarray(qs) * (cum[-1] - 1)
+        return values[np.searchsorted(cum, ranks, side="right")].tolist()
+
+
+class NumericSummary:
+    """Count/mean/std (Chan et al.), min/max dan sketsa kuantil satu kolom."""
+
+    def __init__(self, relative_accuracy=0.01):
+        self.count = 0
+        self.missing = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def _combine(self, count, mean, m2):
+        if not count:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+
+    def update(self, values):
+        values = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float)
+        valid = values[~np.isnan(values)]
+        self.missing += len(values) - len(valid)
+        if not len(valid):
+            return
+        mean = valid.mean()
+        self._combine(len(valid), mean, ((valid - mean) ** 2).sum())
+        self.min = min(self.min, valid.min())
+        self.max = max(self.max, valid.max())
+        self.sketch.add(valid)
+
+    def merge(self, other):
+        self._combine(other.count, other.mean, other.m2)
+        self.missing += other.missing
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+        return self
+
+    @property
+    def std(self):
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+
+    def quantiles(self, qs=QUANTILES):
+        # Ujung distribusi diketahui persis, jangan pakai pendekatan sketsa
+        return [min(max(q, self.min), self.max) for q in self.sketch.quantiles(qs)]
+
+    def histogram(self, bins=30):
+        """Histogram ``bins`` bucket seragam antara min dan max (perkiraan)."""
+        values, counts = self.sketch.buckets()
+        if not self.count:
+            return np.zeros(bins, dtype=np.int64), np.zeros(bins + 1)
+        edges = np.linspace(self.min, self.max, bins + 1)
+        hist, _ = np.histogram(np.clip(values, self.min, self.max), bins=edges, weights=counts)
+        return hist.astype(np.int64), edges
+
+
+class StreamingSummary:
+    """Ringkasan dataset IP4T yang diperbarui per chunk.
+
+    Menyimpan beberapa baris pertama, tipe kolom, jumlah non-null, frekuensi
+    tiap kategori, serta :class:`NumericSummary` untuk kolom numerik, tanpa
+    pernah menyimpan frame penuh.
+    """
+
+    def __init__(self, numeric=NUMERIC, drop=(ID,), head_rows=5):
+        self.numeric_hint = list(numeric)
+        self.drop = list(drop)
+        self.head_rows = head_rows
+        self.head = None
+        self.rows = 0
+        self.blank_rows = 0
+        self.dtypes = {}
+        self.non_null = {}
+        self.counts = {}
+        self.numeric = {}
+
+    def update(self, chunk):
+        chunk = chunk.drop(columns=[c for c in self.drop if c in chunk.columns])
+        blank = chunk.isna().all(axis=1)
+        self.blank_rows += int(blank.sum())
+        chunk = chunk[~blank]
+        if self.head is None:
+            self.head = chunk.head(self.head_rows)
+            for col in chunk.columns:
+                is_numeric = col in self.numeric_hint or pd.api.types.is_numeric_dtype(chunk[col])
+                if is_numeric:
+                    self.numeric[col] = NumericSummary()
+                else:
+                    self.counts[col] = pd.Series(dtype="int64")
+                self.dtypes[col] = "float64" if is_numeric else "category"
+                self.non_null[col] = 0
+        self.rows += len(chunk)
+        for col in self.dtypes:
+            if col not in chunk.columns:
+                continue
+            self.non_null[col] += int(chunk[col].notna().sum())
+            if col in self.numeric:
+                self.numeric[col].update(chunk[col])
+            else:
+                counts = chunk[col].value_counts(dropna=True)
+                self.counts[col] = self.counts[col].add(counts, fill_value=0).astype("int64")
+        return self
+
+    def merge(self, other):
+        if self.head is None:
+            self.head, self.dtypes = other.head, dict(other.dtypes)
+            self.non_null = {col: 0 for col in other.non_null}
+            self.counts = {col: pd.Series(dtype="int64") for col in other.counts}
+            self.numeric = {col: NumericSummary() for col in other.numeric}
+        self.rows += other.rows
+        self.blank_rows += other.blank_rows
+        for col, n in other.non_null.items():
+            self.non_null[col] = self.non_null.get(col, 0) + n
+        for col, counts in other.counts.items():
+            self.counts[col] = self.counts[col].add(counts, fill_value=0).astype("int64")
+        for col, summary in other.numeric.items():
+            self.numeric[col].merge(summary)
+        return self
+
+    def structure(self):
+        """Padanan ``df.info()``: kolom, jumlah non-null dan tipe."""
+        return pd.DataFrame({
+            "Kolom": list(self.dtypes),
+            "Non-Null": [self.non_null[c] for c in self.dtypes],
+            "Dtype": list(self.dtypes.values()),
+        })
+
+    def describe(self):
+        """Padanan ``df.describe().T`` untuk kolom numerik."""
+        rows = {}
+        for col, s in self.numeric.items():
+            q1, q2, q3 = s.quantiles()
+            rows[col] = {"count": s.count, "mean": s.mean, "std": s.std, "min": s.min,
+                         "25%": q1, "50%": q2, "75%": q3, "max": s.max}
+        return pd.DataFrame.from_dict(rows, orient="index")
+
+    def value_counts(self, col):
+        return self.counts[col].sort_values(ascending=False)
+
+
+@traced("csv.stream_summary")
+def summarize_chunks(chunks, on_progress=None):
+    """Bangun :class:`StreamingSummary` dari iterator DataFrame."""
+    summary = StreamingSummary()
+    for chunk in chunks:
+        summary.update(chunk)
+        if on_progress:
+            on_progress(summary.rows)
+    return summary
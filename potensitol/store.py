@@ -0,0 +1,184 @@
+"""Riwayat prediksi persisten di SQLite (pustaka standar, satu file lokal).
+
+Setiap prediksi (satuan dari halaman Prediksi maupun batch/CLI) disimpan
+bersama fitur masukan, kelas, probabilitas, versi model dan waktu, sehingga
+pertanyaan seperti "apa kata model tentang NO 1234?" dijawab lewat indeks,
+tanpa skoring ulang::
+
+    python -m potensitol score dataset.csv hasil.csv --store prediksi.sqlite
+
+Kolom ``no`` dan ``kelas`` diindeks. Batch dimasukkan dengan
+``executemany`` dalam satu transaksi per chunk, dan :meth:`PredictionStore.query`
+mengambil satu halaman dengan ``LIMIT``/``OFFSET`` sehingga UI tidak perlu
+memuat seluruh tabel.
+"""
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from potensitol.data import CATEGORICAL, ID, NUMERIC, PREDICTION, PROBABILITY, ROOT, parcel_id
+from potensitol.schema import COLUMN_ALIASES
+
+STORE_PATH = ROOT / "prediksi.sqlite"
+# Lokasi lain untuk riwayat halaman Prediksi (mis. benchmark menulis ke direktori sementara)
+STORE_ENV = "POTENSITOL_STORE"
+PAGE_SIZE = 50
+INSERT_CHUNK = 10_000
+
+# Nama kolom SQL per fitur IP4T
+COLUMNS = {
+    "PENGUASAAN TANAH": "penguasaan_tanah",
+    "PEMILIKAN TANAH": "pemilikan_tanah",
+    "PENGGUNAAN TANAH": "penggunaan_tanah",
+    "PEMANFAATAN TANAH": "pemanfaatan_tanah",
+    "Luas  m2": "luas_m2",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS prediksi (
+    id INTEGER PRIMARY KEY,
+    no TEXT,
+    penguasaan_tanah TEXT,
+    pemilikan_tanah TEXT,
+    penggunaan_tanah TEXT,
+    pemanfaatan_tanah TEXT,
+    luas_m2 REAL,
+    kelas TEXT NOT NULL,
+    probabilitas REAL NOT NULL,
+    probabilitas_kelas TEXT NOT NULL,
+    versi_model TEXT NOT NULL,
+    sumber TEXT,
+    dibuat TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_prediksi_no ON prediksi (no);
+CREATE INDEX IF NOT EXISTS idx_prediksi_kelas ON prediksi (kelas);
+"""
+
+INSERT = (
+    "INSERT INTO prediksi (no, penguasaan_tanah, pemilikan_tanah, penggunaan_tanah, pemanfaatan_tanah, "
+    "luas_m2, kelas, probabilitas, probabilitas_kelas, versi_model, sumber, dibuat) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Nama kolom tampilan hasil query (selaras dengan keluaran predict_frame)
+DISPLAY = {
+    "no": ID, **{sql: col for col, sql in COLUMNS.items()},
+    "kelas": PREDICTION, "probabilitas": PROBABILITY, "probabilitas_kelas": "PROBABILITAS KELAS",
+    "versi_model": "VERSI MODEL", "sumber": "SUMBER", "dibuat": "WAKTU",
+}
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _where(no=None, kelas=None):
+    clauses, params = [], []
+    if no:
+        clauses.append("no = ?")
+        params.append(parcel_id(no))
+    if kelas:
+        clauses.append("kelas = ?")
+        params.append(kelas)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+class PredictionStore:
+    """Tabel ``prediksi`` dalam satu file SQLite.
+
+    Koneksi dibuka per operasi sehingga objek aman dipakai bersama oleh
+    sesi/thread Streamlit; mode WAL membuat pembacaan tidak terblokir oleh
+    penulisan batch. Tanpa ``path`` dipakai env ``POTENSITOL_STORE``, lalu
+    ``prediksi.sqlite`` di root repo.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path or os.environ.get(STORE_ENV) or STORE_PATH)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _insert(self, rows):
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(INSERT, rows)
+        return len(rows)
+
+    def insert_record(self, record, classes, proba, model_version, no=None, source="satuan"):
+        """Simpan satu prediksi beserta distribusi probabilitas seluruh kelas."""
+        proba = np.asarray(proba, dtype=float).ravel()
+        best = int(proba.argmax())
+        distribution = {str(c): round(float(p), 4) for c, p in zip(classes, proba)}
+        return self._insert([(
+            parcel_id(no), *(record.get(c) for c in CATEGORICAL), float(record[NUMERIC[0]]),
+            str(classes[best]), round(float(proba[best]), 4), json.dumps(distribution, ensure_ascii=False),
+            model_version, source, _now(),
+        )])
+
+    def insert_frame(self, hasil, proba, model_version, source="batch", chunk_size=INSERT_CHUNK):
+        """Bulk insert baris hasil :func:`~potensitol.model.predict_frame` yang berhasil diprediksi.
+
+        ``proba`` adalah probabilitas lengkap dari ``predict_frame(...,
+        return_proba=True)`` (satu kolom per kelas), sehingga ``PROBABILITAS
+        KELAS`` berisi distribusi seluruh kelas seperti :meth:`insert_record`
+        tanpa menjalankan model lagi. Mengembalikan jumlah baris yang disimpan.
+        """
+        valid = hasil[PREDICTION].notna().to_numpy()
+        hasil = hasil.rename(columns=COLUMN_ALIASES)[valid]
+        classes = [str(c) for c in proba.columns]
+        proba = proba.to_numpy(dtype=float)[valid].round(4)
+        now = _now()
+        total = 0
+        for start in range(0, len(hasil), chunk_size):
+            chunk = hasil.iloc[start:start + chunk_size]
+            ids = chunk[ID].map(parcel_id) if ID in chunk.columns else [None] * len(chunk)
+            features = [
+                chunk[c].astype(object).where(chunk[c].notna(), None) if c in chunk.columns else [None] * len(chunk)
+                for c in CATEGORICAL
+            ] + [
+                pd.to_numeric(chunk[c], errors="coerce").astype(float).tolist() if c in chunk.columns
+                else [None] * len(chunk)
+                for c in NUMERIC
+            ]
+            distributions = [
+                json.dumps(dict(zip(classes, row)), ensure_ascii=False)
+                for row in proba[start:start + chunk_size].tolist()
+            ]
+            rows = [
+                (no, *values, str(kelas), float(prob), distribution, model_version, source, now)
+                for no, *values, kelas, prob, distribution in zip(
+                    ids, *features, chunk[PREDICTION], chunk[PROBABILITY], distributions
+                )
+            ]
+            total += self._insert(rows)
+        return total
+
+    def count(self, no=None, kelas=None):
+        where, params = _where(no, kelas)
+        with closing(self._connect()) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM prediksi{where}", params).fetchone()[0]
+
+    def query(self, no=None, kelas=None, limit=PAGE_SIZE, offset=0):
+        """Satu halaman riwayat (terbaru dulu) sebagai DataFrame berkolom tampilan."""
+        where, params = _where(no, kelas)
+        sql = (f"SELECT {', '.join(DISPLAY)} FROM prediksi{where} "
+               "ORDER BY id DESC LIMIT ? OFFSET ?")
+        with closing(self._connect()) as conn:
+            frame = pd.read_sql_query(sql, conn, params=[*params, int(limit), int(offset)])
+        return frame.rename(columns=DISPLAY)
+
+    def classes(self):
+        """Kelas yang pernah diprediksi (dibaca dari indeks ``kelas``)."""
+        with closing(self._connect()) as conn:
+            return [row[0] for row in conn.execute("SELECT DISTINCT kelas FROM prediksi ORDER BY kelas")]
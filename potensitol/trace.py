@@ -0,0 +1,179 @@
+"""Instrumentasi ringan jalur panas: span bernama dengan waktu dan memori.
+
+::
+
+    from potensitol.trace import span, traced
+
+    with span("csv.parse"):
+        df = read_table(file)
+
+    @traced("figure.histogram")
+    def histogram_figure(...): ...
+
+Secara default instrumentasi mati: :func:`span` mengembalikan satu konteks
+kosong bersama sehingga biayanya hanya pengecekan flag. Env
+``POTENSITOL_TRACE=1`` atau :func:`enable` menyalakan :data:`TRACER` per
+proses (CLI, server). Halaman Streamlit dengan ``?debug=1`` memakai
+:class:`Tracer` milik sesinya sendiri lewat :func:`use_tracer`, yang hanya
+berlaku di thread rerun sesi itu, sehingga sesi lain tidak ikut terukur.
+Saat aktif, setiap span mencatat waktu dinding dan selisih RSS proses;
+agregatnya (jumlah panggilan, total, maksimum) bisa diekspor sebagai JSON
+atau teks Prometheus.
+"""
+
+import json
+import os
+import threading
+from contextlib import nullcontext
+from functools import wraps
+from time import perf_counter
+
+ENV_VAR = "POTENSITOL_TRACE"
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+PROMETHEUS_PREFIX = "potensitol_span"
+
+_NOOP = nullcontext()
+_local = threading.local()
+
+
+def rss_bytes():
+    """Resident set size proses saat ini; 0 bila tidak tersedia (non-Linux)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "start", "rss")
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.rss = rss_bytes()
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = perf_counter() - self.start
+        self.tracer.record(self.name, seconds, rss_bytes() - self.rss)
+        return False
+
+
+class Tracer:
+    """Agregat span (per proses atau per sesi), aman dipakai dari banyak thread."""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._spans = {}
+
+    def span(self, name):
+        if not self.enabled:
+            return _NOOP
+        return _Span(self, name)
+
+    def record(self, name, seconds, memory=0):
+        with self._lock:
+            stats = self._spans.get(name)
+            if stats is None:
+                stats = self._spans[name] = [0, 0.0, 0.0, 0, 0]
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+            stats[3] += memory
+            stats[4] = max(stats[4], memory)
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+
+    def snapshot(self):
+        """Satu dict per span, terurut dari total waktu terbesar."""
+        with self._lock:
+            items = [(name, list(stats)) for name, stats in self._spans.items()]
+        rows = [
+            {
+                "span": name,
+                "count": count,
+                "total_seconds": total,
+                "mean_seconds": total / count,
+                "max_seconds": longest,
+                "memory_bytes": memory,
+                "memory_max_bytes": memory_max,
+            }
+            for name, (count, total, longest, memory, memory_max) in items
+        ]
+        return sorted(rows, key=lambda row: row["total_seconds"], reverse=True)
+
+    def to_json(self):
+        return json.dumps({"pid": os.getpid(), "spans": self.snapshot()}, indent=2)
+
+    def to_prometheus(self):
+        """Format teks eksposisi Prometheus (satu metrik per kolom agregat)."""
+        metrics = [
+            ("calls_total", "counter", "Jumlah span selesai.", "count"),
+            ("seconds_total", "counter", "Total waktu dinding span (detik).", "total_seconds"),
+            ("seconds_max", "gauge", "Waktu dinding span terlama (detik).", "max_seconds"),
+            ("memory_bytes_total", "gauge", "Jumlah selisih RSS selama span (byte).", "memory_bytes"),
+            ("memory_bytes_max", "gauge", "Selisih RSS terbesar satu span (byte).", "memory_max_bytes"),
+        ]
+        rows = self.snapshot()
+        lines = []
+        for suffix, kind, help_text, key in metrics:
+            name = f"{PROMETHEUS_PREFIX}_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for row in rows:
+                label = row["span"].replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+                lines.append(f'{name}{{span="{label}"}} {row[key]}')
+        return "\n".join(lines) + "\n"
+
+
+TRACER = Tracer(enabled=os.environ.get(ENV_VAR, "") not in ("", "0"))
+
+
+def enable(on=True):
+    TRACER.enabled = on
+
+
+def use_tracer(tracer):
+    """Catat span thread ini ke ``tracer`` (mis. milik satu sesi Streamlit); ``None`` melepasnya."""
+    _local.tracer = tracer
+
+
+def active_tracer():
+    """Tracer thread ini, :data:`TRACER` bila aktif per proses, atau ``None``."""
+    tracer = getattr(_local, "tracer", None)
+    if tracer is not None:
+        return tracer
+    return TRACER if TRACER.enabled else None
+
+
+def enabled():
+    return active_tracer() is not None
+
+
+def span(name):
+    """Konteks yang mengukur blok ``name``; kosong bila instrumentasi mati."""
+    tracer = active_tracer()
+    if tracer is None:
+        return _NOOP
+    return tracer.span(name)
+
+
+def traced(name):
+    """Dekorator: setiap panggilan fungsi dicatat sebagai span ``name``."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            tracer = active_tracer()
+            if tracer is None or not tracer.enabled:
+                return fn(*args, **kwargs)
+            with _Span(tracer, name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,112 @@
+"""Melatih ulang Random Forest Potensi TOL dari dataset IP4T.
+
+Pipeline sama dengan ``model_rf_potensiTOL.pkl``: OneHotEncoder untuk empat
+kolom kategorik, Luas diteruskan apa adanya, lalu RandomForestClassifier::
+
+    python -m potensitol train "dataset20052025(3).csv" --n-jobs -1
+"""
+
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from potensitol.artifact import MODELS_DIR, save_artifact
+from potensitol.data import CATEGORICAL, DATASET_PATH, FEATURES, NUMERIC, TARGET, load_dataset
+
+N_ESTIMATORS = 100
+MAX_DEPTH = 4
+RANDOM_STATE = 42
+CV_FOLDS = 5
+
+
+def split_xy(df):
+    """``(X, y)`` dari dataset yang sudah dimuat; baris tanpa fitur/target lengkap dibuang."""
+    df = df.dropna(subset=FEATURES + [TARGET])
+    X = df[FEATURES].astype({c: object for c in CATEGORICAL})
+    return X, df[TARGET].astype(str)
+
+
+def training_frame(source=DATASET_PATH):
+    """Dataset bersih: baris tanpa fitur/target lengkap dibuang."""
+    return split_xy(load_dataset(source))
+
+
+def build_pipeline(n_estimators=N_ESTIMATORS, max_depth=MAX_DEPTH, random_state=RANDOM_STATE, n_jobs=None):
+    from sklearn.compose import ColumnTransformer
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import OneHotEncoder
+
+    prep = ColumnTransformer([
+        ("ohe", Pipeline([("encoder", OneHotEncoder(handle_unknown="ignore", sparse_output=False))]), CATEGORICAL),
+        ("scale", "passthrough", NUMERIC),
+    ])
+    rf = RandomForestClassifier(
+        n_estimators=n_estimators, max_depth=max_depth, random_state=random_state, n_jobs=n_jobs
+    )
+    return Pipeline([("prep", prep), ("rf", rf)])
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    # ru_maxrss dalam KiB di Linux, byte di macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def train(source=DATASET_PATH, n_estimators=N_ESTIMATORS, max_depth=MAX_DEPTH, random_state=RANDOM_STATE,
+          n_jobs=None, cv=CV_FOLDS):
+    """Latih pipeline dan kembalikan ``(model, metrics)``.
+
+    ``metrics`` berisi akurasi cross-validation (stratified ``cv`` fold,
+    dijalankan paralel dengan ``n_jobs``), durasi fit, puncak alokasi
+    Python selama fit (tracemalloc) dan puncak RSS proses.
+    """
+    from sklearn.model_selection import StratifiedKFold, cross_val_score
+
+    X, y = training_frame(source)
+    metrics = {"rows": len(X), "class_counts": y.value_counts().to_dict()}
+
+    if cv:
+        start = time.perf_counter()
+        folds = StratifiedKFold(n_splits=cv, shuffle=True, random_state=random_state)
+        scores = cross_val_score(build_pipeline(n_estimators, max_depth, random_state), X, y,
+                                 cv=folds, n_jobs=n_jobs)
+        metrics.update({
+            "cv_folds": cv,
+            "cv_accuracy_mean": round(float(scores.mean()), 4),
+            "cv_accuracy_std": round(float(scores.std()), 4),
+            "cv_seconds": round(time.perf_counter() - start, 3),
+        })
+
+    model = build_pipeline(n_estimators, max_depth, random_state, n_jobs)
+    tracemalloc.start()
+    start = time.perf_counter()
+    model.fit(X, y)
+    fit_seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # n_jobs tidak ikut disimpan agar artefak tidak mewarisi setelan mesin latih
+    model.set_params(rf__n_jobs=None)
+
+    metrics.update({
+        "train_accuracy": round(float(model.score(X, y)), 4),
+        "fit_seconds": round(fit_seconds, 3),
+        "fit_peak_alloc_mb": round(peak / (1024 * 1024), 2),
+        "peak_rss_mb": _peak_rss_mb(),
+    })
+    return model, metrics
+
+
+def train_artifact(source=DATASET_PATH, version=None, models_dir=MODELS_DIR, make_current=True, **kwargs):
+    """Latih lalu simpan sebagai artefak berversi; kembalikan ``(direktori, metrics)``."""
+    model, metrics = train(source, **kwargs)
+    directory = save_artifact(model, version, models_dir, training_data=source, metrics=metrics,
+                              make_current=make_current)
+    return directory, metrics
@@ -0,0 +1,29 @@
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+# Paket dipakai langsung dari root repo (tanpa instalasi), sama seperti halaman Streamlit
+sys.path.insert(0, str(ROOT))
+
+from potensitol.data import DATASET_PATH  # noqa: E402
+from potensitol.model import MODEL_PATH  # noqa: E402
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    """Salinan pkl bawaan di direktori sementara, agar ekspor tidak mengotori repo."""
+    target = tmp_path / MODEL_PATH.name
+    shutil.copy(MODEL_PATH, target)
+    return target
+
+
+@pytest.fixture(scope="session")
+def features():
+    """Lima kolom fitur seluruh baris dataset bawaan."""
+    from potensitol.train import training_frame
+
+    X, _ = training_frame(DATASET_PATH)
+    return X
@@ -0,0 +1,36 @@
+import numpy as np
+
+import potensitol.model
+from potensitol.__main__ import main
+from potensitol.engine import CompiledForest
+from potensitol.model import engine_path, load_engine, load_model, model_info
+
+
+def test_compiled_export_is_loaded(model_path, monkeypatch):
+    main(["compile", "--model", str(model_path)])
+    assert engine_path(model_path).exists()
+
+    def no_compile(model):
+        raise AssertionError("ekspor seharusnya dipakai, bukan kompilasi ulang")
+
+    monkeypatch.setattr(potensitol.model, "compile_forest", no_compile)
+    engine = load_engine(model_path)
+    assert isinstance(engine, CompiledForest)
+    assert engine.model_sha256 == model_info(model_path)["sha256"]
+
+
+def test_stale_export_is_ignored(model_path):
+    main(["compile", "--model", str(model_path)])
+    engine = CompiledForest.load(engine_path(model_path), mmap=False)
+    engine.model_sha256 = "0" * 64
+    engine.save(engine_path(model_path))
+
+    fresh = load_engine(model_path)
+    assert fresh.model_sha256 is None
+
+
+def test_compiled_export_matches_sklearn(model_path, features):
+    main(["compile", "--model", str(model_path)])
+    X = features
+    expected = load_model(model_path).predict_proba(X)
+    np.testing.assert_array_equal(load_engine(model_path).predict_proba(X), expected)
@@ -0,0 +1,13 @@
+import numpy as np
+import pytest
+
+from potensitol.data import DATASET_PATH, load_dataset
+from potensitol.evaluate import evaluate
+from potensitol.model import load_model
+
+
+def test_out_of_fold_confusion_matrix_covers_every_row():
+    result = evaluate(load_model(), load_dataset(DATASET_PATH), n_jobs=1)
+    matrix = np.asarray(result["confusion_matrix"])
+    assert matrix.sum() == result["rows"]
+    assert np.trace(matrix) / matrix.sum() == pytest.approx(result["accuracy"])
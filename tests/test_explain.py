@@ -0,0 +1,20 @@
+import numpy as np
+
+from potensitol.data import DATASET_PATH, read_table
+from potensitol.explain import load_explainer
+
+
+def test_contributions_sum_to_predict_proba(features):
+    explainer = load_explainer()
+    bias, contributions = explainer.explain(features)
+    np.testing.assert_allclose(bias + contributions.sum(axis=1), explainer.engine.predict_proba(features), atol=1e-12)
+
+
+def test_chunked_importance_matches_global():
+    explainer = load_explainer()
+    total, rows = 0, 0
+    for chunk in read_table(DATASET_PATH, chunksize=300):
+        chunk_total, chunk_rows = explainer.importance_total(chunk)
+        total, rows = total + chunk_total, rows + chunk_rows
+    np.testing.assert_allclose(explainer.importance_frame(total, rows),
+                               explainer.global_importance(read_table(DATASET_PATH)))
@@ -0,0 +1,61 @@
+import pandas as pd
+
+from potensitol.data import DATASET_PATH, FEATURES, ID, PREDICTION, parcel_id, read_table
+from potensitol.incremental import STATUS, load_store, rescore_frame, save_store
+from potensitol.model import load_engine, predict_frame
+
+
+def monthly_update(df):
+    """Satu parsel berubah kelas, satu dihapus dan satu parsel baru."""
+    df = df.dropna(how="all").reset_index(drop=True)
+    hasil = predict_frame(load_engine(), df)
+    first = hasil.loc[0, PREDICTION]
+    other = hasil.index[hasil[PREDICTION].notna() & (hasil[PREDICTION] != first)][0]
+    update = df.copy()
+    update.loc[0, FEATURES] = df.loc[other, FEATURES].to_numpy()
+    removed = update.loc[1, ID]
+    update = update.drop(index=1)
+    added = update.iloc[[2]].assign(**{ID: df[ID].max() + 1})
+    ids = (df.loc[0, ID], removed, added[ID].iloc[0])
+    return pd.concat([update, added], ignore_index=True), *map(parcel_id, ids)
+
+
+def test_rescore_diff(tmp_path):
+    model = load_engine()
+    df = read_table(DATASET_PATH)
+    _, store, _, summary = rescore_frame(model, df)
+    assert summary["diskor ulang"] == summary["baris"]
+    path = tmp_path / "uji.arrow"
+    save_store(store, path, "sha-uji")
+
+    update, changed, removed, added = monthly_update(df)
+    hasil, _, diff, summary = rescore_frame(model, update, load_store(path, "sha-uji"))
+
+    assert summary["diskor ulang"] == 2
+    assert summary["dipakai ulang"] == len(update) - 2
+    assert dict(zip(diff[ID], diff[STATUS])) == {changed: "berubah", removed: "dihapus", added: "baru"}
+    # Keluaran sama dengan skoring penuh (NO dibandingkan terpisah: rescore menjadikannya teks)
+    expected = predict_frame(model, update)
+    assert (hasil[ID] == expected[ID].map(parcel_id)).all()
+    assert hasil.drop(columns=ID).to_csv(sep=";") == expected.drop(columns=ID).to_csv(sep=";")
+
+
+def test_store_from_other_model_is_ignored(tmp_path):
+    model = load_engine()
+    _, store, _, _ = rescore_frame(model, read_table(DATASET_PATH))
+    path = tmp_path / "uji.arrow"
+    save_store(store, path, "sha-lama")
+    assert load_store(path, "sha-baru") is None
+
+
+def test_text_parcel_ids(tmp_path):
+    model = load_engine()
+    df = read_table(DATASET_PATH).dropna(how="all").head(5)
+    df[ID] = [f"A-{i}" for i in range(len(df))]
+    _, store, _, _ = rescore_frame(model, df)
+    path = tmp_path / "uji.arrow"
+    save_store(store, path, "sha-uji")
+
+    hasil, _, diff, summary = rescore_frame(model, df, load_store(path, "sha-uji"))
+    assert list(hasil[ID]) == list(df[ID])
+    assert summary["dipakai ulang"] == len(df) and diff.empty
@@ -0,0 +1,37 @@
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from potensitol.__main__ import main
+from potensitol.data import NUMERIC
+from potensitol.lookup import LookupTable
+from potensitol.model import MODEL_PATH, load_engine, load_model
+
+
+@pytest.fixture(scope="module")
+def model_path(tmp_path_factory):
+    """Salinan pkl beserta tabel prediksinya, dibangun sekali untuk modul ini."""
+    target = tmp_path_factory.mktemp("lookup") / MODEL_PATH.name
+    shutil.copy(MODEL_PATH, target)
+    main(["lookup", "--model", str(target)])
+    return target
+
+
+def test_lookup_matches_sklearn(model_path, features):
+    table = load_engine(model_path)
+    assert isinstance(table, LookupTable)
+    model = load_model(model_path)
+    np.testing.assert_allclose(table.predict_proba(features), model.predict_proba(features), rtol=0, atol=1e-12)
+
+
+def test_lookup_matches_sklearn_at_thresholds_and_unknown_labels(model_path, features):
+    table = load_engine(model_path)
+    # Luas tepat di setiap threshold forest dan sedikit di atasnya, plus satu label yang tidak dikenal
+    luas = np.concatenate([table.thresholds, np.nextafter(table.thresholds, np.inf)])
+    X = pd.DataFrame(features.iloc[np.arange(len(luas)) % len(features)].to_numpy(), columns=features.columns)
+    X[NUMERIC[0]] = luas
+    X.iloc[::7, 0] = "Tidak dikenal"
+    model = load_model(model_path)
+    np.testing.assert_allclose(table.predict_proba(X), model.predict_proba(X), rtol=0, atol=1e-12)
@@ -0,0 +1,36 @@
+from potensitol.data import DATASET_PATH
+from potensitol.model import load_engine, score_file
+from potensitol.parallel import score_file_parallel
+
+
+def test_sharded_output_matches_serial(tmp_path):
+    # Shard kecil: sebagian berisi baris kosong (NO/Luas jadi float bila tipenya ditebak)
+    serial, sharded = tmp_path / "serial.csv", tmp_path / "sharded.csv"
+    rows = score_file(load_engine(), DATASET_PATH, serial, chunk_size=500)
+    assert score_file_parallel(DATASET_PATH, sharded, workers=2, chunk_size=500, shard_bytes=20_000) == rows
+    assert sharded.read_bytes() == serial.read_bytes()
+
+
+
+def test_xlsx_is_split_into_row_ranges(tmp_path, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from potensitol import parallel
+    from potensitol.data import read_table
+
+    source = tmp_path / "dataset.xlsx"
+    read_table(DATASET_PATH, dtype=str).to_excel(source, index=False)
+    serial, sharded = tmp_path / "serial.csv", tmp_path / "sharded.csv"
+    rows = score_file(load_engine(), source, serial, chunk_size=500)
+
+    submitted = []
+
+    class Pool(ThreadPoolExecutor):
+        def submit(self, fn, *args):
+            submitted.append(fn)
+            return super().submit(fn, *args)
+
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", Pool)
+    assert parallel.score_file_parallel(source, sharded, workers=2, chunk_size=500) == rows
+    assert len(submitted) == 2 * parallel.SHARDS_PER_WORKER
+    assert sharded.read_bytes() == serial.read_bytes()
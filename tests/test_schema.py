@@ -0,0 +1,42 @@
+import pandas as pd
+
+from potensitol.model import load_engine
+from potensitol.schema import COLUMN, MESSAGE, Schema
+
+
+def test_validate_canonicalizes_labels_and_reports_unknown():
+    schema = Schema.from_model(load_engine())
+    df = pd.DataFrame({
+        "PENGUASAAN TANAH": ["  penggarap ", "Penggarap", "Penggarap", None],
+        "KEPEMILIKAN TANAH": ["Terdaftar (HGU Baru)", "Belum  Terdaftar", "Belum Terdaftar", "Belum Terdaftar"],
+        "PENGGUNAAN TANAH": ["Madrasah", "Kebun Campuran", "Kebun Campuran", "Kebun Campuran"],
+        "PEMANFAATAN TANAH": ["Usaha", "Tanaman semusim", "Bukan label", "Tanaman semusim"],
+        "Luas  m2": ["181", 66.0, "-1", 10],
+    })
+    X, errors = schema.validate(df)
+    assert X.iloc[0].tolist() == [
+        "Penggarap", "Terdaftar dalam HGU baru (diluar penyisihan)", "Madrasah Ibtidayah", "Tempat Usaha", 181.0,
+    ]
+    assert X.iloc[1].notna().all()
+    assert sorted(zip(errors[COLUMN], errors[MESSAGE])) == [
+        ("Luas  m2", "harus lebih dari 0"),
+        ("PEMANFAATAN TANAH", "kategori tidak dikenal model"),
+        ("PENGUASAAN TANAH", "kosong"),
+    ]
+
+
+def test_schema_is_built_once_per_model():
+    model = load_engine()
+    assert Schema.from_model(model) is Schema.from_model(model)
+
+
+def test_validate_rejects_non_finite_luas():
+    schema = Schema.from_model(load_engine())
+    row = {
+        "PENGUASAAN TANAH": "Penggarap", "PEMILIKAN TANAH": "Belum Terdaftar",
+        "PENGGUNAAN TANAH": "Kebun Campuran", "PEMANFAATAN TANAH": "Tanaman semusim",
+    }
+    df = pd.DataFrame([{**row, "Luas  m2": luas} for luas in ["inf", float("inf"), "-inf", 10]])
+    X, errors = schema.validate(df)
+    assert X["Luas  m2"].isna().tolist() == [True, True, True, False]
+    assert errors[MESSAGE].tolist() == ["bukan angka terhingga"] * 3
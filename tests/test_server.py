@@ -0,0 +1,14 @@
+import pytest
+
+from potensitol.server import parse_records
+
+RECORD = {
+    "PENGUASAAN TANAH": "Penggarap", "PEMILIKAN TANAH": "Belum Terdaftar",
+    "PENGGUNAAN TANAH": "Kebun Campuran", "PEMANFAATAN TANAH": "Tanaman semusim",
+}
+
+
+@pytest.mark.parametrize("luas", [float("inf"), "-inf", float("nan"), "NaN"])
+def test_parse_records_rejects_non_finite_luas(luas):
+    with pytest.raises(ValueError, match="item 1: 'Luas  m2' bukan angka terhingga"):
+        parse_records([{**RECORD, "Luas  m2": 10}, {**RECORD, "Luas  m2": luas}])
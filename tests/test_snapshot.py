@@ -0,0 +1,34 @@
+import shutil
+
+import potensitol.snapshot
+from potensitol.data import DATASET_PATH, file_digest
+from potensitol.snapshot import load_profile_snapshot, quality_path, write_snapshot
+
+
+def test_snapshot_profile_skips_csv_parse(tmp_path, monkeypatch):
+    source = tmp_path / DATASET_PATH.name
+    shutil.copy(DATASET_PATH, source)
+    expected_df, expected_report = load_profile_snapshot(source)
+    write_snapshot(source)
+    assert quality_path(source).exists()
+
+    def no_parse(source):
+        raise AssertionError("snapshot dan laporan tersimpan seharusnya dipakai")
+
+    monkeypatch.setattr(potensitol.snapshot, "profile_dataset", no_parse)
+    df, report = load_profile_snapshot(source, file_digest(source))
+    assert df.equals(expected_df)
+    assert report.summary().equals(expected_report.summary())
+
+
+def test_stale_quality_report_is_reprofiled(tmp_path):
+    source = tmp_path / DATASET_PATH.name
+    shutil.copy(DATASET_PATH, source)
+    write_snapshot(source)
+    _, before = load_profile_snapshot(source)
+    with open(source, "a", encoding="utf-8") as f:
+        f.write("9999;Pemilik;Terdaftar (dari areal penyisihan HGU Lama);Rumah Tinggal;Tempat tinggal;Akses Reform;181\n")
+
+    df, report = load_profile_snapshot(source)
+    assert report.lines == before.lines + 1
+    assert len(df) == before.rows + 1
@@ -0,0 +1,45 @@
+import json
+
+import numpy as np
+
+from potensitol.model import load_engine, predict_frame
+from potensitol.store import PredictionStore
+
+
+def test_batch_rows_store_full_distribution(tmp_path, features):
+    model = load_engine()
+    store = PredictionStore(tmp_path / "prediksi.sqlite")
+    hasil, proba = predict_frame(model, features.head(1), return_proba=True)
+    assert store.insert_frame(hasil, proba, "uji") == 1
+
+    record = features.iloc[0].to_dict()
+    store.insert_record(record, model.classes_, model.predict_proba(features.head(1))[0], "uji")
+
+    # Terbaru dulu: satuan, lalu baris batch dengan fitur yang sama
+    rows = store.query(limit=2)
+    single, batch = (json.loads(text) for text in rows["PROBABILITAS KELAS"])
+    assert list(batch) == list(single) == [str(c) for c in model.classes_]
+    assert batch == single
+    np.testing.assert_allclose(sum(batch.values()), 1, atol=1e-3)
+
+
+def test_score_store_reuses_scoring_probabilities(tmp_path, monkeypatch):
+    from potensitol.__main__ import main
+    from potensitol.data import DATASET_PATH
+
+    model = load_engine()
+    calls = []
+    predict_proba = type(model).predict_proba
+    monkeypatch.setattr(type(model), "predict_proba", lambda self, X: calls.append(len(X)) or predict_proba(self, X))
+
+    main(["score", str(DATASET_PATH), str(tmp_path / "hasil.csv"), "--store", str(tmp_path / "prediksi.sqlite")])
+
+    store = PredictionStore(tmp_path / "prediksi.sqlite")
+    assert store.count() == sum(calls)
+    assert len(calls) == 1
+
+
+def test_default_path_follows_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("POTENSITOL_STORE", str(tmp_path / "lain.sqlite"))
+    assert PredictionStore().path == tmp_path / "lain.sqlite"
+    assert (tmp_path / "lain.sqlite").exists()
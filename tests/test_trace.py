@@ -0,0 +1,60 @@
+import threading
+
+from potensitol import trace
+
+
+def test_session_tracer_is_thread_local():
+    session = trace.Tracer(enabled=True)
+    other = []
+
+    def other_session():
+        other.append(trace.enabled())
+        with trace.span("lain"):
+            pass
+
+    trace.use_tracer(session)
+    try:
+        with trace.span("sesi"):
+            thread = threading.Thread(target=other_session)
+            thread.start()
+            thread.join()
+    finally:
+        trace.use_tracer(None)
+
+    assert [row["span"] for row in session.snapshot()] == ["sesi"]
+    assert other == [False]
+    assert not trace.TRACER.enabled and trace.TRACER.snapshot() == []
+
+
+def _fragment_app():
+    import threading
+
+    import streamlit as st
+    from streamlit.runtime.scriptrunner import add_script_run_ctx
+
+    from potensitol import trace
+    from potensitol.layout import page_fragment, session_tracer, setup_page
+
+    setup_page("Uji")
+
+    @page_fragment
+    def fragmen():
+        with trace.span("fragmen"):
+            pass
+
+    # Rerun fragment Streamlit berjalan di thread lain dari rerun halaman
+    thread = add_script_run_ctx(threading.Thread(target=fragmen))
+    thread.start()
+    thread.join()
+    st.write(",".join(row["span"] for row in session_tracer().snapshot()))
+
+
+def test_fragment_rerun_records_to_session_tracer():
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_function(_fragment_app)
+    app.query_params["debug"] = "1"
+    app.run()
+
+    assert not app.exception
+    assert [m.value for m in app.markdown] == ["fragmen"]